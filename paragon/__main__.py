@@ -0,0 +1,145 @@
+"""Headless entry point. Loads a project, runs edits or exports, and saves without Qt.
+
+Examples:
+    python -m paragon --project MyHack run edits.py
+    python -m paragon --game FE14 --rom ROM --output OUT dialogue export DEST
+    python -m paragon --project MyHack dialogue import SRC
+
+Scripts passed to "run" are executed with "gd" (GameData), "project", "config"
+and "args" (any arguments after the script path) in scope. The project is saved
+afterwards unless --no-save is given.
+"""
+
+import argparse
+import logging
+import runpy
+import sys
+
+from paragon.core import headless
+from paragon.model.configuration import Configuration
+from paragon.model.game import Game
+from paragon.model.language import Language
+from paragon.model.project import Project
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m paragon")
+    parser.add_argument("--config", default="paragon.json")
+    parser.add_argument("--project", help="Name of a project in the config file.")
+    parser.add_argument("--game", choices=[g.value for g in Game])
+    parser.add_argument("--rom", help="Path to the extracted ROM.")
+    parser.add_argument("--output", help="Project output path.")
+    parser.add_argument(
+        "--language",
+        choices=[l.value for l in Language],
+        default=Language.ENGLISH_NA.value,
+    )
+    parser.add_argument(
+        "--no-save", action="store_true", help="Discard changes instead of saving."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("projects", help="List projects in the config file.")
+
+    run = commands.add_parser("run", help="Run a Python script against the project.")
+    run.add_argument("script")
+    run.add_argument("args", nargs=argparse.REMAINDER)
+
+    dialogue = commands.add_parser(
+        "dialogue", help="Convert text archives to and from pretty script."
+    )
+    dialogue.add_argument("action", choices=["export", "import"])
+    dialogue.add_argument("directory")
+    dialogue.add_argument(
+        "--archive",
+        action="append",
+        help="Archive to export. May be repeated. Defaults to every text archive.",
+    )
+    dialogue.add_argument("--processes", type=int, default=None)
+    dialogue.add_argument(
+        "--no-translate",
+        action="store_true",
+        help="Keep game asset and emotion names instead of translating them.",
+    )
+    return parser, parser.parse_args(argv)
+
+
+def _project(parser, args, config: Configuration) -> Project:
+    if args.project:
+        project = headless.find_project(config, args.project)
+        if not project:
+            parser.error(f"No project named {args.project} in {args.config}.")
+        return project
+    if not (args.game and args.rom and args.output):
+        parser.error("Either --project or --game, --rom, and --output are required.")
+    return Project(
+        name="headless",
+        rom_path=args.rom,
+        output_path=args.output,
+        language=Language(args.language),
+        game=Game(args.game),
+    )
+
+
+def _run_dialogue(args, config, project, gd) -> bool:
+    from paragon.core.dialogue import bulk
+
+    assets, emotions = None, None
+    service = None if args.no_translate else headless.dialogue(config, project, gd)
+
+    def report(result: bulk.ArchiveResult):
+        logging.info(f"{result.archive}: {result.messages} messages ({result.file})")
+        for key, error in result.failures:
+            logging.warning(f"{result.archive}, {key}: {error}")
+
+    if args.action == "export":
+        if service:
+            assets = service.inverted_asset_translations()
+            emotions = service.emotions_reversed
+        archives = args.archive or gd.enumerate_text_archives()
+        results = bulk.export_archives(
+            gd, archives, args.directory, assets, emotions, args.processes, report
+        )
+    else:
+        if service:
+            assets = service.asset_translations()
+            emotions = service.emotion_translations()
+        results = bulk.import_archives(
+            gd, args.directory, assets, emotions, args.processes, report
+        )
+    failures = sum(len(r.failures) for r in results)
+    logging.info(f"Processed {len(results)} archives with {failures} failures.")
+    return args.action == "import"
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    parser, args = _parse_args(argv)
+    config = Configuration.load(args.config)
+    if args.command == "projects":
+        for project in config.projects:
+            print(f"{project.name}\t{project.game.value}\t{project.output_path}")
+        return 0
+
+    project = _project(parser, args, config)
+    gd = headless.load(project)
+    if args.command == "run":
+        namespace = {"gd": gd, "project": project, "config": config, "args": args.args}
+        runpy.run_path(args.script, init_globals=namespace, run_name="__main__")
+        modified = True
+    else:
+        modified = _run_dialogue(args, config, project, gd)
+
+    if modified and not args.no_save:
+        logging.info("Saving...")
+        headless.save(config, project, gd)
+        logging.info("Save complete.")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except Exception:
+        logging.exception("Headless run failed.")
+        sys.exit(1)
@@ -0,0 +1,49 @@
+"""Whole-table reads and writes for analysis and bulk balancing scripts.
+
+Int, float and bool columns are returned as array.array, which supports the
+buffer protocol. numpy.asarray wraps them without copying, so NumPy works here
+without Paragon depending on it. Other columns are plain lists.
+
+Example:
+    rids, columns = table_to_columns(gd, "jobs", ["jid", "base_hp"])
+    hp = numpy.asarray(columns["base_hp"])
+    columns_to_table(gd, "jobs", rids, {"base_hp": hp + 5})
+"""
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def table_to_columns(
+    gd, table: str, field_ids: Optional[List[str]] = None
+) -> Tuple[List[int], Dict[str, Sequence]]:
+    rids, columns = gd.table_to_columns(table, field_ids)
+    return rids, {field_id: _pack(values) for field_id, values in columns.items()}
+
+
+def columns_to_table(gd, table: str, rids: Sequence[int], columns: Dict[str, Sequence]):
+    """Write columns back in one call. Raises if any value is the wrong type or
+    outside its field's range, in which case nothing is written."""
+    gd.columns_to_table(
+        table, list(rids), {field_id: _unpack(v) for field_id, v in columns.items()}
+    )
+
+
+def _pack(values: list) -> Sequence:
+    if not values:
+        return values
+    kind = type(values[0])
+    if any(type(v) is not kind for v in values):
+        return values
+    if kind is bool:
+        return array("B", values)
+    elif kind is int:
+        return array("q", values)
+    elif kind is float:
+        return array("d", values)
+    return values
+
+
+def _unpack(values: Sequence) -> list:
+    # NumPy arrays and array.array both convert to native Python values here.
+    return values.tolist() if hasattr(values, "tolist") else list(values)
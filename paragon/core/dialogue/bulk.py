@@ -0,0 +1,196 @@
+"""Archive-wide conversion between game script and pretty script.
+
+Exports write one file per text archive. Each file starts with a line naming
+the archive, and each message follows a "=== KEY ===" header. Messages that fail
+to convert, or whose pretty form would not convert back to the same text, are
+written as-is under a "=== KEY (raw) ===" header so that importing
+the file always reproduces the archive. Body lines that start with "===" or
+a backslash are escaped with an extra leading backslash.
+
+Headless use goes through "python -m paragon dialogue export|import".
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from paragon.core.dialogue import convert
+
+EXPORT_SUFFIX = ".txt"
+
+_ARCHIVE_PREFIX = "# archive: "
+_HEADER_PATTERN = re.compile(r"^=== (.+?)( \(raw\))? ===$")
+
+# Translation tables for worker processes. Set once per process by the pool initializer.
+_assets = None
+_emotions = None
+
+
+@dataclass
+class ArchiveResult:
+    archive: str
+    file: str
+    messages: int = 0
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def export_path(output_dir: str, archive: str) -> str:
+    return os.path.join(output_dir, *archive.split("/")) + EXPORT_SUFFIX
+
+
+def export_archives(
+    gd,
+    archives: Iterable[str],
+    output_dir: str,
+    assets: Optional[Dict[str, str]] = None,
+    emotions: Optional[Dict[str, str]] = None,
+    processes: Optional[int] = None,
+    on_finished: Optional[Callable[[ArchiveResult], None]] = None,
+) -> List[ArchiveResult]:
+    """Convert every message in the given archives to pretty script.
+
+    Archives are paths from GameData.enumerate_text_archives. The translation
+    tables map game names to pretty names (the inverse of the Dialogue
+    service's asset and emotion translations).
+    """
+    with _executor(processes, assets, emotions) as executor:
+        futures = []
+        for archive in archives:
+            # GameData stays in this process. Workers only see plain strings.
+            gd.open_text_data(archive, False)
+            keys = gd.enumerate_messages(archive, False) or []
+            messages = [(k, gd.message(archive, False, k) or "") for k in keys]
+            path = export_path(output_dir, archive)
+            futures.append(executor.submit(_export_archive, archive, messages, path))
+        return _collect(futures, on_finished)
+
+
+def import_archives(
+    gd,
+    input_dir: str,
+    assets: Optional[Dict[str, str]] = None,
+    emotions: Optional[Dict[str, str]] = None,
+    processes: Optional[int] = None,
+    on_finished: Optional[Callable[[ArchiveResult], None]] = None,
+) -> List[ArchiveResult]:
+    """Convert exported files back to game script and store them in GameData.
+
+    Only messages whose text actually changed are written, so untouched
+    archives are not marked dirty. Messages that fail to parse are skipped
+    and reported in the result.
+    """
+    files = []
+    for root, _, filenames in os.walk(input_dir):
+        for filename in filenames:
+            if filename.endswith(EXPORT_SUFFIX):
+                files.append(os.path.join(root, filename))
+    with _executor(processes, assets, emotions) as executor:
+        futures = {executor.submit(_import_file, path): path for path in sorted(files)}
+        results = []
+        for future in as_completed(futures):
+            archive, messages, result = future.result()
+            gd.open_text_data(archive, False)
+            for key, game_text in messages:
+                if gd.message(archive, False, key) != game_text:
+                    gd.set_message(archive, False, key, game_text)
+            results.append(result)
+            if on_finished:
+                on_finished(result)
+        return results
+
+
+def _executor(processes, assets, emotions) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(assets, emotions)
+    )
+
+
+def _init_worker(assets, emotions):
+    global _assets, _emotions
+    _assets = assets
+    _emotions = emotions
+
+
+def _collect(futures, on_finished) -> List[ArchiveResult]:
+    results = []
+    for future in as_completed(futures):
+        result = future.result()
+        results.append(result)
+        if on_finished:
+            on_finished(result)
+    return results
+
+
+def _export_archive(
+    archive: str, messages: List[Tuple[str, str]], path: str
+) -> ArchiveResult:
+    result = ArchiveResult(archive, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(f"{_ARCHIVE_PREFIX}{archive}\n")
+        for key, game_text in messages:
+            try:
+                body = convert.game_to_pretty(game_text, _assets, _emotions)
+                # Only keep the pretty form if importing it gives back the same text.
+                if (
+                    convert.pretty_to_game(
+                        body, _reversed(_assets), _reversed(_emotions)
+                    )
+                    != game_text
+                ):
+                    raise ValueError("Conversion does not round trip.")
+                f.write(f"=== {key} ===\n")
+            except Exception as e:
+                body = game_text
+                f.write(f"=== {key} (raw) ===\n")
+                result.failures.append((key, str(e)))
+            f.write(_escape(body))
+            f.write("\n")
+            result.messages += 1
+    return result
+
+
+def _reversed(translations):
+    return {v: k for k, v in translations.items()} if translations else None
+
+
+def _escape(body: str) -> str:
+    # Lines that could be mistaken for a header get a leading backslash.
+    # Lines that already start with one are escaped too, so unescaping is unambiguous.
+    lines = body.split("\n")
+    for i, line in enumerate(lines):
+        if line.startswith("===") or line.startswith("\\"):
+            lines[i] = "\\" + line
+    return "\n".join(lines)
+
+
+def _import_file(path: str) -> Tuple[str, List[Tuple[str, str]], ArchiveResult]:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        lines = f.read().split("\n")
+    if not lines or not lines[0].startswith(_ARCHIVE_PREFIX):
+        raise ValueError(f"{path} is not a dialogue export.")
+    archive = lines[0][len(_ARCHIVE_PREFIX) :]
+    if lines[-1] == "":
+        lines.pop()  # Newline that terminates the file.
+
+    result = ArchiveResult(archive, path)
+    messages = []
+    blocks = []
+    for line in lines[1:]:
+        if match := _HEADER_PATTERN.match(line):
+            blocks.append((match.group(1), bool(match.group(2)), []))
+        elif blocks:
+            blocks[-1][2].append(line[1:] if line.startswith("\\") else line)
+    for key, raw, body_lines in blocks:
+        body = "\n".join(body_lines)
+        try:
+            if raw:
+                messages.append((key, body))
+            else:
+                messages.append((key, convert.pretty_to_game(body, _assets, _emotions)))
+            result.messages += 1
+        except Exception as e:
+            result.failures.append((key, str(e)))
+    return archive, messages, result
@@ -1,6 +1,11 @@
+import re
+
 from paragon.core.scanner import Scanner
 from paragon.core.dialogue.commands import *
 
+# Plain text runs until a command, the end of input, or a "\n" escape.
+_PRINT_TEXT = re.compile(r"(?:[^$\\\x00]|\\(?!n))*")
+
 
 class GameScriptParser:
     def __init__(self):
@@ -350,7 +355,4 @@ class GameScriptParser:
         return KoreanAvatarIdentifierCommand(identifier)
 
     def _scan_print(self, sc: Scanner):
-        res = ""
-        while sc.peek() != "$" and sc.peek() != "\0" and not self._next_is_newline(sc):
-            res += sc.next()
-        return PrintCommand(res)
+        return PrintCommand(sc.scan_pattern(_PRINT_TEXT))
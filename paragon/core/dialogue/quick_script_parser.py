@@ -12,7 +12,6 @@ from paragon.core.dialogue.commands import (
 
 from paragon.core.scanner import ScannerError
 
-from PySide6.QtGui import QFontMetrics
 
 import textwrap
 
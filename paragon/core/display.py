@@ -435,3 +435,133 @@ def display_rid(gd, rid, fn, row):
         return _DISPLAY_FUNCTIONS[fn](gd, rid, row)
     else:
         return None
+
+
+# Pseudo-dependency for reads that depend on record keys or list membership.
+# GameData reports those changes as a single key generation.
+_KEYS = ("keys",)
+
+
+class _TrackedData:
+    """Stands in for GameData while a display string is computed and records
+    which fields and messages were read."""
+
+    def __init__(self, gd):
+        self._gd = gd
+        self.dependencies = set()
+        self.trackable = True
+
+    def __getattr__(self, name):
+        # Any read we don't know how to track makes the result uncacheable.
+        self.trackable = False
+        return getattr(self._gd, name)
+
+    def _field(self, rid, field_id):
+        self.dependencies.add((rid, field_id))
+
+    def string(self, rid, field_id):
+        self._field(rid, field_id)
+        return self._gd.string(rid, field_id)
+
+    def int(self, rid, field_id):
+        self._field(rid, field_id)
+        return self._gd.int(rid, field_id)
+
+    def bool(self, rid, field_id):
+        self._field(rid, field_id)
+        return self._gd.bool(rid, field_id)
+
+    def rid(self, rid, field_id):
+        self._field(rid, field_id)
+        return self._gd.rid(rid, field_id)
+
+    def key(self, rid):
+        self.dependencies.add(_KEYS)
+        return self._gd.key(rid)
+
+    def display(self, rid):
+        fields, messages = self._gd.display_sources(rid)
+        self.dependencies.update(fields)
+        self.dependencies.update(("message", key) for key in messages)
+        return self._gd.display(rid)
+
+    def message(self, path, localized, key):
+        self.dependencies.add(("message", key))
+        return self._gd.message(path, localized, key)
+
+    def table(self, table):
+        return self._gd.table(table)
+
+    def type_of(self, rid):
+        return self._gd.type_of(rid)
+
+    def key_to_rid(self, table, key):
+        self.dependencies.add(_KEYS)
+        return self._gd.key_to_rid(table, key)
+
+    def list_size(self, rid, field_id):
+        self.dependencies.add(_KEYS)
+        return self._gd.list_size(rid, field_id)
+
+    def list_get(self, rid, field_id, index):
+        self.dependencies.add(_KEYS)
+        return self._gd.list_get(rid, field_id, index)
+
+    def list_get_by_field_value(self, rid, field_id, int_field_id, value):
+        self.dependencies.add(_KEYS)
+        self.dependencies.add(("field", int_field_id))
+        return self._gd.list_get_by_field_value(rid, field_id, int_field_id, value)
+
+
+class DisplayCache:
+    """Memoizes display strings. Each entry remembers the fields and messages
+    read while computing it and is dropped only when one of them changes."""
+
+    def __init__(self, gd):
+        self.gd = gd
+        self._entries = {}
+        self._dependents = {}
+        self._generations = gd.display_generations()
+
+    def get(self, key, compute):
+        """Return compute(data) for the key, where data is a GameData stand-in."""
+        self._sync()
+        if key in self._entries:
+            return self._entries[key]
+        data = _TrackedData(self.gd)
+        value = compute(data)
+        if data.trackable:
+            self._entries[key] = value
+            for dependency in data.dependencies:
+                self._dependents.setdefault(dependency, set()).add(key)
+        return value
+
+    def display(self, rid, fn, row):
+        return self.get((rid, fn, row), lambda data: display_rid(data, rid, fn, row))
+
+    def clear(self):
+        self._entries.clear()
+        self._dependents.clear()
+
+    def _invalidate(self, dependency):
+        for key in self._dependents.pop(dependency, ()):
+            self._entries.pop(key, None)
+
+    def _sync(self):
+        generations = self.gd.display_generations()
+        if generations == self._generations:
+            return
+        key_generation, value_generation, message_generation = self._generations
+        self._generations = generations
+        field_edits = self.gd.field_edits_since(value_generation)
+        message_edits = self.gd.message_edits_since(message_generation)
+        if field_edits is None or message_edits is None:
+            self.clear()
+            return
+        if generations[0] != key_generation:
+            self._invalidate(_KEYS)
+        for rid, field_id in field_edits:
+            self._invalidate((rid, field_id))
+            self._invalidate(("field", field_id))
+        for key in message_edits:
+            self._invalidate(("message", key))
@@ -0,0 +1,70 @@
+import logging
+import os
+from typing import Optional
+
+from paragon import paragon as pgn
+from paragon.core import backup
+from paragon.core.services.write_preprocessors import WritePreprocessors
+from paragon.model.configuration import Configuration
+from paragon.model.game import Game
+from paragon.model.project import Project
+
+
+def config_root(project: Project) -> str:
+    return os.path.normpath(os.path.join(os.getcwd(), "Data", project.game.value))
+
+
+def find_project(config: Configuration, name: str) -> Optional[Project]:
+    for project in config.projects:
+        if project.name == name or project.get_id() == name:
+            return project
+    return None
+
+
+def load(project: Project):
+    output_path = os.path.normpath(project.output_path)
+    rom_path = os.path.normpath(project.rom_path)
+    logging.info(f"Loading {output_path}, {rom_path}, {config_root(project)}")
+    gd = pgn.GameData.load(
+        output_path,
+        rom_path,
+        project.game.value,
+        project.language.value,
+        config_root(project),
+    )
+    gd.read()
+    return gd
+
+
+def write_preprocessors(game: Game) -> WritePreprocessors:
+    if game == Game.FE14:
+        from paragon.core.services.fe14_write_preprocessors import (
+            FE14WritePreprocessors,
+        )
+
+        return FE14WritePreprocessors()
+    return WritePreprocessors()
+
+
+def dialogue(config: Configuration, project: Project, gd):
+    # Only the translation side of the dialogue services works without Qt.
+    # Rendering still needs a QApplication.
+    if project.game == Game.FE10:
+        from paragon.core.services.fe10_dialogue import FE10Dialogue as cls
+    elif project.game == Game.FE13:
+        from paragon.core.services.fe13_dialogue import FE13Dialogue as cls
+    elif project.game == Game.FE14:
+        from paragon.core.services.fe14_dialogue import FE14Dialogue as cls
+    elif project.game == Game.FE15:
+        from paragon.core.services.fe15_dialogue import FE15Dialogue as cls
+    else:
+        raise NotImplementedError("Unsupported game.")
+    return cls(project.game, config, gd, None, config_root(project))
+
+
+def save(config: Configuration, project: Project, gd, progress=None):
+    """Same steps as saving from the main window: backup, preprocess, write."""
+    if config.backup != "None":
+        backup.backup(gd, project.output_path, config.backup == "Smart")
+    write_preprocessors(project.game).invoke(gd)
+    gd.write(progress)
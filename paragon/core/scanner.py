@@ -1,3 +1,35 @@
+import re
+from typing import Dict, FrozenSet, Pattern
+
+_ALNUM = re.compile(r"[^\W_]*")
+_DIGITS = re.compile(r"\d*")
+
+_until_patterns: Dict[FrozenSet[str], Pattern] = {}
+_while_patterns: Dict[FrozenSet[str], Pattern] = {}
+
+
+def _char_class(chars) -> str:
+    return "".join(re.escape(c) for c in sorted(chars))
+
+
+def _until_pattern(chars) -> Pattern:
+    key = frozenset(chars)
+    pattern = _until_patterns.get(key)
+    if not pattern:
+        pattern = re.compile(f"[^{_char_class(key)}]*")
+        _until_patterns[key] = pattern
+    return pattern
+
+
+def _while_pattern(chars) -> Pattern:
+    key = frozenset(chars)
+    pattern = _while_patterns.get(key)
+    if not pattern:
+        pattern = re.compile(f"[{_char_class(key)}]*")
+        _while_patterns[key] = pattern
+    return pattern
+
+
 class ScannerError(Exception):
     def __init__(self, line, line_index, message):
         super().__init__(f"Error at line {line}, index {line_index}: {message}")
@@ -6,38 +38,55 @@ class ScannerError(Exception):
 
 
 class Scanner:
+    """Cursor over a string for hand written parsers.
+
+    Runs of characters are sliced out with regexes instead of being built one
+    character at a time. Line and column are only worked out when asked for
+    (usually when raising an error), since most input never needs them.
+    """
+
     def __init__(self, input: str):
         self.input = input
-        self.line = 1
-        self.line_index = 0
+        self.length = len(input)
         self.pos = 0
 
+    @property
+    def line(self) -> int:
+        return self.input.count("\n", 0, self.pos) + 1
+
+    @property
+    def line_index(self) -> int:
+        last_newline = self.input.rfind("\n", 0, self.pos)
+        if last_newline == -1:
+            return self.pos
+        return self.pos - last_newline
+
     def error(self, message):
         raise ScannerError(self.line, self.line_index, message)
 
     def advance(self, count=1):
-        for _ in range(0, count):
-            self.next()
+        if self.pos + count > self.length:
+            self.pos = self.length
+            self.error("Reached EOI while parsing.")
+        self.pos += count
 
     def next(self) -> str:
-        if self.at_end():
+        if self.pos >= self.length:
             self.error("Reached EOI while parsing.")
-        result = self.peek()
-        if result == "\n":
-            self.line += 1
-            self.line_index = 0
+        result = self.input[self.pos]
         self.pos += 1
-        self.line_index += 1
         return result
 
     def expect(self, expected: str):
+        if self.pos < self.length and self.input[self.pos] == expected:
+            self.pos += 1
+            return
         actual = self.next()
-        if actual != expected:
-            self.error('Expected "%s" but found "%s" instead.' % (expected, actual))
+        self.error('Expected "%s" but found "%s" instead.' % (expected, actual))
 
     def peek(self, amount: int = 0) -> str:
         index = self.pos + amount
-        if index >= len(self.input):
+        if index >= self.length:
             return "\0"
         else:
             return self.input[index]
@@ -46,36 +95,51 @@ class Scanner:
         return self.line, self.line_index
 
     def at_end(self):
-        return self.pos >= len(self.input)
+        return self.pos >= self.length
+
+    def scan_pattern(self, pattern: Pattern) -> str:
+        """Consume and return whatever the compiled pattern matches at the cursor."""
+        end = pattern.match(self.input, self.pos).end()
+        res = self.input[self.pos : end]
+        self.pos = end
+        return res
 
     def scan_until(self, chars: set) -> str:
-        res = ""
-        while self.peek() not in chars:
-            res += self.next()
+        res = self.scan_pattern(_until_pattern(chars))
+        # Running out of input reads as "\0", so only a stop set with "\0" can end here.
+        if self.pos >= self.length and "\0" not in chars:
+            self.error("Reached EOI while parsing.")
         return res
 
     def scan_while(self, fn):
-        res = ""
-        while fn(self.peek()):
-            res += self.next()
-        return res
+        start = self.pos
+        while self.pos < self.length and fn(self.input[self.pos]):
+            self.pos += 1
+        if self.pos >= self.length and fn("\0"):
+            self.error("Reached EOI while parsing.")
+        return self.input[start : self.pos]
 
     def skip_while(self, chars: set):
-        while self.peek() in chars:
-            self.next()
+        self.scan_pattern(_while_pattern(chars))
+        if self.pos >= self.length and "\0" in chars:
+            self.error("Reached EOI while parsing.")
 
     def scan_number(self):
-        res = ""
+        start = self.pos
         if self.peek() == "-":
-            res += self.next()
+            self.pos += 1
+        self.scan_pattern(_DIGITS)
+        # \d is narrower than str.isdigit. Pick up any stragglers so the
+        # accepted input doesn't change.
         while self.peek().isdigit():
-            res += self.next()
+            self.pos += 1
+        res = self.input[start : self.pos]
         if not res:
             self.error("Expected number.")
         return int(res)
 
     def scan_alnum(self):
-        return self.scan_while(lambda c: c.isalnum())
+        return self.scan_pattern(_ALNUM)
 
     def skip_whitespace(self):
         self.skip_while({" ", "\t", "\n", "\r"})
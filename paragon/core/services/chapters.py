@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from paragon.model.coordinate_change_type import CoordinateChangeType
 from paragon.model.chapter_data import ChapterData
@@ -104,10 +104,29 @@ class Chapters:
     def set_dirty(self, chapter_data: ChapterData, dirty: bool):
         raise NotImplementedError
 
+    def prefetch(self, cid: str):
+        """Start reading a chapter's files in the background.
+
+        Call this ahead of load(cid) when the chapter is likely to be opened soon.
+        load() only has to register the parsed data after that.
+        """
+        if cid in self.chapters:
+            return
+        try:
+            files = {}
+            for multi_id, key in self._chapter_files(cid):
+                files.setdefault(multi_id, []).append(key)
+            for multi_id, keys in files.items():
+                self.gd.multi_prefetch(multi_id, keys)
+        except:
+            logging.exception(f"Failed to prefetch files for chapter {cid}.")
+
     def load(self, cid: str) -> ChapterData:
         if cid in self.chapters:
             return self.chapters[cid]
         else:
+            # Read every file in parallel instead of one open at a time.
+            self.prefetch(cid)
             data = self._load(cid)
             self.chapters[cid] = data
             return data
@@ -125,3 +144,7 @@ class Chapters:
 
     def _load(self, cid: str) -> ChapterData:
         raise NotImplementedError
+
+    def _chapter_files(self, cid: str) -> List[Tuple[str, str]]:
+        """(multi id, key) pairs that _load may open for the chapter."""
+        return []
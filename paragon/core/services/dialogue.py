@@ -1,9 +1,11 @@
 import json
 import logging
 import os
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap, QFont
 
-from PySide6.QtGui import QPixmap, QFont
 from paragon.model.speaker import Speaker
 
 from paragon.model.dialogue_snapshot import DialogueSnapshot
@@ -28,16 +30,18 @@ class Dialogue:
         self.loaded_windows = False
         self.window_sets = {}
         self.dialogue_animations = {}
+        self._asset_translations = None
+        self._inverted_asset_translations = None
+        self._asset_translations_revision = None
 
         emotions_path = os.path.join(config_root, "Emotions.json")
         try:
             with open(emotions_path, "r", encoding="utf-8") as f:
                 self.emotions = json.load(f)
-                self.emotions_reversed = {v: k for k, v in self.emotions.items()}
         except:
             logging.exception("Failed to load dialogue emotion translations.")
             self.emotions = {}
-            self.emotions_reversed = {}
+        self.emotions_reversed = {v: k for k, v in self.emotions.items()}
 
         overrides_path = os.path.join(config_root, "PortraitOverrides.json")
         try:
@@ -55,7 +59,7 @@ class Dialogue:
             logging.exception("Failed to load dialogue commands.")
             self.dialogue_commands = {}
 
-    def render(self, speaker: Speaker, mode: str, active: bool) -> Optional[QPixmap]:
+    def render(self, speaker: Speaker, mode: str, active: bool) -> Optional["QPixmap"]:
         emotions = speaker.emotions
         name = speaker.fid_alias if speaker.fid_alias else speaker.name
         if speaker.fid_alias:
@@ -70,9 +74,9 @@ class Dialogue:
         return self.portraits.render(fid, real_emotions, mode, active)
 
     def game_to_pretty(self, game_text):
-        inverted_emotions = {v: k for k, v in self.emotion_translations().items()}
-        inverted_assets = {v: k for k, v in self.asset_translations().items()}
-        return convert.game_to_pretty(game_text, inverted_assets, inverted_emotions)
+        return convert.game_to_pretty(
+            game_text, self.inverted_asset_translations(), self.emotions_reversed
+        )
 
     def pretty_to_game(self, pretty_text):
         emotions = self.emotion_translations()
@@ -88,7 +92,7 @@ class Dialogue:
         state.commit()
         return state.snapshots
 
-    def backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
         if not self.loaded_backgrounds:
             try:
                 self.background_list = self._load_backgrounds()
@@ -104,11 +108,34 @@ class Dialogue:
         return self.emotions
 
     def asset_translations(self) -> Dict[str, str]:
-        translations = self._base_asset_translations()
-        translations.update(self.overrides)
-        return translations
-
-    def windows(self) -> Dict[str, Dict[str, QPixmap]]:
+        # Building the table means scanning every portrait and looking up its name,
+        # so only rebuild when the portraits table or its text archive changes.
+        revision = self._asset_translations_source_revision()
+        if (
+            self._asset_translations is None
+            or revision != self._asset_translations_revision
+        ):
+            translations = self._base_asset_translations()
+            translations.update(self.overrides)
+            self._asset_translations = translations
+            self._inverted_asset_translations = {v: k for k, v in translations.items()}
+            self._asset_translations_revision = revision
+        return self._asset_translations
+
+    def inverted_asset_translations(self) -> Dict[str, str]:
+        self.asset_translations()
+        return self._inverted_asset_translations
+
+    def _asset_translations_source_revision(self):
+        return None
+
+    def _portraits_and_text_revision(self, text_archive: str):
+        return (
+            self.data.table_revision("portraits"),
+            self.data.text_archive_revision(text_archive, True),
+        )
+
+    def windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         if not self.loaded_windows:
             try:
                 self.window_sets = self._load_windows()
@@ -117,7 +144,9 @@ class Dialogue:
             self.loaded_windows = True
         return self.window_sets
 
-    def font(self) -> QFont:
+    def font(self) -> "QFont":
+        from PySide6.QtGui import QFont
+
         font = QFont("FOT-Chiaro Std B")
         font.setPixelSize(15)
         return font
@@ -152,10 +181,10 @@ class Dialogue:
     def _base_asset_translations(self) -> Dict[str, str]:
         raise NotImplementedError
 
-    def _load_backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def _load_backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
         raise NotImplementedError
 
-    def _load_windows(self) -> Dict[str, Dict[str, QPixmap]]:
+    def _load_windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         raise NotImplementedError
 
     def _get_avatar_config(self):
@@ -1,6 +1,7 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
-from PySide6.QtGui import QPixmap
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 from paragon.core.services.dialogue import Dialogue
 
@@ -12,10 +13,10 @@ class FE10Dialogue(Dialogue):
     def _base_asset_translations(self) -> Dict[str, str]:
         return {}
 
-    def _load_backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def _load_backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
         pass
 
-    def _load_windows(self) -> Dict[str, Dict[str, QPixmap]]:
+    def _load_windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         pass
 
     def _get_avatar_config(self):
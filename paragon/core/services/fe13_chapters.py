@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from PySide6 import QtCore
 
@@ -140,6 +140,15 @@ class FE13Chapters(Chapters):
             dialogue=dest_dialogue_path,
         )
 
+    def _chapter_files(self, cid: str) -> List[Tuple[str, str]]:
+        cid_part = cid[4:] if cid.startswith("CID_") else cid
+        return [
+            ("dispos", f"data/dispos/{cid_part}.bin.lz"),
+            ("person", f"data/person/{cid_part}.bin.lz"),
+            ("grids", f"data/terrain/{cid_part}.bin.lz"),
+            ("map_configs", f"map/data/{cid_part}.bin"),
+        ]
+
     def _load(self, cid: str) -> ChapterData:
         # Validate that the CID corresponds to a chapter.
         cid_part = cid[4:] if cid.startswith("CID_") else cid
@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
-from PySide6.QtGui import QPixmap
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 from paragon.core.services.dialogue import Dialogue
 
@@ -12,6 +13,9 @@ class FE13Dialogue(Dialogue):
             return self._get_avatar_config().name
         return self.data.message("m/GameData.bin.lz", True, alias)
 
+    def _asset_translations_source_revision(self):
+        return self._portraits_and_text_revision("m/GameData.bin.lz")
+
     def _base_asset_translations(self) -> Dict[str, str]:
         try:
             table_rid, field_id = self.data.table("portraits")
@@ -30,13 +34,17 @@ class FE13Dialogue(Dialogue):
             logging.exception("Failed to parse portrait name translations.")
             return {}
 
-    def _load_backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def _load_backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
+        from PySide6.QtGui import QPixmap
+
         return [("Default", QPixmap("resources/awakening/SupportBG.png"))]
 
-    def _load_windows(self) -> Dict[str, Dict[str, QPixmap]]:
+    def _load_windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         # Awakening textures aren't stored in a convenient format.
         # Easier to use the resources from Fire Emblem Conversation Editor.
         # All credit to SecretiveCactus for these.
+        from PySide6.QtGui import QPixmap
+
         return {
             "Standard": {
                 "NameBox": QPixmap("resources/awakening/NameBox.png"),
@@ -1,7 +1,9 @@
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
 
 from PIL import Image
-from PySide6.QtGui import QPixmap
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 from paragon.core.services import utils
 from paragon.core.services.portraits import Portraits
@@ -12,7 +14,7 @@ from paragon import paragon as pgn
 class FE13Portraits(Portraits):
     def render(
         self, fid: str, emotions: List[str], mode: str, active
-    ) -> Optional[QPixmap]:
+    ) -> Optional["QPixmap"]:
         new_emotions = list(
             map(lambda e: self.blush_label() if e == "照" else e, emotions)
         )
@@ -62,10 +62,10 @@ class FE13Sprites(Sprites):
         # male/female suffix for some reason.
         path1 = f"map/unit/{job}{char}{team}.ctpk.lz"
         path2 = f"map/unit/{fallback_job}{team}.ctpk.lz"
-        if self.gd.file_exists(path1, False):
+        if self._file_exists(path1):
             path = path1
             key = f"{job}{char}"
-        elif self.gd.file_exists(path2, False):
+        elif self._file_exists(path2):
             path = path2
             key = f"{fallback_job}"
         else:
@@ -73,14 +73,12 @@ class FE13Sprites(Sprites):
         return self._load_file(key, path, team)
 
     def _load_file(self, key, path, team):
-        raw = self.gd.read_file(path)
-
-        # Parse the texture.
-        textures = pgn.read_ctpk(bytes(raw))
+        # Parse the texture. GameData caches the decoded result.
+        textures = self.gd.read_ctpk_textures(path)
         if textures:
             # Need to do some post-processing to get a single frame
             # and remove transparency.
-            texture = next(iter(textures))
+            texture = next(iter(textures.values()))
 
             animation_data, frame_width, frame_height = self._load_animation_data(key)
             return FE13SpriteModel(
@@ -107,6 +105,7 @@ class FE13Sprites(Sprites):
 
     def _load_animation_data(self, name) -> Tuple[List[AnimationData], int, int]:
         bmap_icon_index = self.gd.key_to_rid("bmap_icons", name)
+        self._note_source(bmap_icon_index)
 
         if frame_width := self.gd.int(bmap_icon_index, "frame_width"):
             pass
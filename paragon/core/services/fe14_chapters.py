@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from PySide6 import QtCore
 
@@ -17,15 +17,23 @@ _HANDOVER_FILES = ["A_HANDOVER.bin.lz", "B_HANDOVER.bin.lz", "C_HANDOVER.bin.lz"
 class FE14Chapters(Chapters):
     def __init__(self, gd, models, icons):
         super().__init__(gd, models, icons)
-
-        self.handovers = []
-        keys = gd.multi_keys("person")
-        for key in keys:
-            for handover_file in _HANDOVER_FILES:
-                if key.endswith(handover_file):
-                    handover = utils.try_multi_open(gd, "person", key)
-                    if handover:
-                        self.handovers.append(handover)
+        self._handovers = None
+
+    @property
+    def handovers(self):
+        # Opened on first use rather than at startup. Most sessions never need them.
+        if self._handovers is None:
+            keys = [
+                key
+                for key in self.gd.multi_keys("person")
+                if any(key.endswith(f) for f in _HANDOVER_FILES)
+            ]
+            self.gd.multi_prefetch("person", keys)
+            self._handovers = []
+            for key in keys:
+                if handover := utils.try_multi_open(self.gd, "person", key):
+                    self._handovers.append(handover)
+        return self._handovers
 
     def pid_to_person(self, pid, person_key=None):
         if person_key:
@@ -225,6 +233,25 @@ class FE14Chapters(Chapters):
             fe14_route=dest_route,
         )
 
+    def _chapter_files(self, cid: str) -> List[Tuple[str, str]]:
+        cid_part = cid[4:] if cid.startswith("CID_") else cid
+        route = self._get_chapter_route(self.gd.key_to_rid("chapters", cid))
+        if route == FE14ChapterRoute.INVALID:
+            return []
+        compressed_name = cid_part + ".bin.lz"
+        files = []
+        for multi_id, root in [
+            ("dispos", os.path.join("GameData", "Dispos")),
+            ("person", os.path.join("GameData", "Person")),
+        ]:
+            files.append(
+                (multi_id, os.path.join(root, route.subdir(), compressed_name))
+            )
+            files.append((multi_id, os.path.join(root, compressed_name)))
+        files.append(("terrain", os.path.join("GameData", "Terrain", compressed_name)))
+        files.append(("map_configs", os.path.join("map", "config", cid_part + ".bin")))
+        return files
+
     def _load(self, cid: str) -> ChapterData:
         # Validate that the CID corresponds to a chapter.
         cid_part = cid[4:] if cid.startswith("CID_") else cid
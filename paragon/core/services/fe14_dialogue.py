@@ -1,8 +1,9 @@
 import logging
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
-from PySide6.QtGui import QPixmap
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 from paragon.core.services.dialogue import Dialogue
 from paragon import paragon as pgn
@@ -26,6 +27,9 @@ class FE14Dialogue(Dialogue):
             return self.config.fe14_avatar.name
         return self.data.message("m/GameData.bin.lz", True, alias)
 
+    def _asset_translations_source_revision(self):
+        return self._portraits_and_text_revision("m/GameData.bin.lz")
+
     def _base_asset_translations(self) -> Dict[str, str]:
         try:
             table_rid, field_id = self.data.table("portraits")
@@ -44,7 +48,7 @@ class FE14Dialogue(Dialogue):
             logging.exception("Failed to parse portrait name translations.")
             return {}
 
-    def _load_backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def _load_backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
         try:
             arc = self.data.read_arc("effect/Tlp_Ev_t001.arc.lz")
             if not arc or "model.bch" not in arc:
@@ -61,7 +65,7 @@ class FE14Dialogue(Dialogue):
             return []
 
     @staticmethod
-    def _slice_window_texture(texture) -> Dict[str, QPixmap]:
+    def _slice_window_texture(texture) -> Dict[str, "QPixmap"]:
         texture = Texture.from_core_texture(texture)
         talk_window = texture.crop(0, 0, 384, 56).to_qpixmap()
         talk_window_panicked = texture.crop(0, 56, 408, 72).to_qpixmap()
@@ -72,7 +76,7 @@ class FE14Dialogue(Dialogue):
             "talk_window_mini": talk_window_mini,
         }
 
-    def _load_windows(self) -> Dict[str, Dict[str, QPixmap]]:
+    def _load_windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         core1 = self.data.read_bch_textures("ui/TalkWindow.bch.lz")["TalkWindow"]
         core2 = self.data.read_bch_textures("ui/TalkWindow2.bch.lz")["TalkWindow2"]
         core2 = Texture.from_core_texture(core2)
@@ -8,6 +8,22 @@ from paragon.core.services.bch_portraits import BchPortraits
 from paragon.core.textures.texture import Texture
 from paragon.model.portrait_info import PortraitInfo
 
+# Read in one call when building portrait info.
+_PORTRAIT_FIELDS = [
+    "blush_position_x",
+    "blush_position_y",
+    "sweat_position_x",
+    "sweat_position_y",
+    "portrait_file",
+    "hair_file",
+    "accessory_file",
+    "hair_color",
+    "bu_position_x",
+    "bu_position_y",
+    "st_position_x",
+    "st_position_y",
+]
+
 
 class FE14Portraits(BchPortraits):
     def crop_for_mode(self, image: Image, info: PortraitInfo, mode: str) -> Image:
@@ -39,18 +55,20 @@ class FE14Portraits(BchPortraits):
                 )
 
         if rid := self.data.key_to_rid("portraits", fsid):
+            [values] = self.data.read_fields([rid], _PORTRAIT_FIELDS)
+            fields = dict(zip(_PORTRAIT_FIELDS, values))
             blush_coords = (
-                self.data.int(rid, "blush_position_x"),
-                self.data.int(rid, "blush_position_y"),
+                fields["blush_position_x"],
+                fields["blush_position_y"],
             )
             sweat_coords = (
-                self.data.int(rid, "sweat_position_x"),
-                self.data.int(rid, "sweat_position_y"),
+                fields["sweat_position_x"],
+                fields["sweat_position_y"],
             )
-            portrait_file = self.data.string(rid, "portrait_file")
-            hair_file = self.data.string(rid, "hair_file")
-            accessory_file = self.data.string(rid, "accessory_file")
-            hair_color = self.data.bytes(rid, "hair_color")
+            portrait_file = fields["portrait_file"]
+            hair_file = fields["hair_file"]
+            accessory_file = fields["accessory_file"]
+            hair_color = fields["hair_color"]
             if hair_color:
                 hair_color = bytes(hair_color)
             return PortraitInfo(
@@ -65,12 +83,12 @@ class FE14Portraits(BchPortraits):
                 },
                 draw_coords={
                     "BU": (
-                        self.data.int(rid, "bu_position_x"),
-                        self.data.int(rid, "bu_position_y"),
+                        fields["bu_position_x"],
+                        fields["bu_position_y"],
                     ),
                     "ST": (
-                        self.data.int(rid, "st_position_x"),
-                        self.data.int(rid, "st_position_y"),
+                        fields["st_position_x"],
+                        fields["st_position_y"],
                     ),
                 },
                 hair_file=hair_file,
@@ -80,6 +98,10 @@ class FE14Portraits(BchPortraits):
         else:
             return None
 
+    def _avatar_cache_key(self):
+        # The portrait choice is already part of the fsid.
+        return self.config.fe14_avatar.accessory
+
     def blush_label(self) -> str:
         return "照"
 
@@ -9,6 +9,22 @@ from paragon.core.services.sprites import Sprites
 from paragon.core.textures.texture import Texture
 from paragon.model.sprite import FE14SpriteModel, FE14FrameData, AnimationData
 
+# FE14FrameData attributes and the frame fields they are read from.
+_FRAME_FIELDS = {
+    "body_offset_x": "body_draw_offset_x",
+    "body_offset_y": "body_draw_offset_y",
+    "body_width": "body_width",
+    "body_height": "body_height",
+    "body_source_x": "body_source_position_x",
+    "body_source_y": "body_source_position_y",
+    "head_offset_x": "head_draw_offset_x",
+    "head_offset_y": "head_draw_offset_y",
+    "head_width": "head_width",
+    "head_height": "head_height",
+    "head_source_x": "head_source_position_x",
+    "head_source_y": "head_source_position_y",
+}
+
 
 class FE14Sprites(Sprites):
     def __init__(self, gd, chapters):
@@ -59,19 +75,19 @@ class FE14Sprites(Sprites):
             path_2 = os.path.join("unit", "Unique", f"{job}_{job}")
             anime_path = os.path.join(path, "anime.bin")
             anime_path_2 = os.path.join(path_2, "anime.bin")
-            if self.gd.file_exists(anime_path, False):
+            if self._file_exists(anime_path):
                 # Found a unique sprite. Load it!
                 image_path = os.path.join(path, sprite_filename)
-                rid = self.gd.multi_open("sprite_data", anime_path)
+                rid = self._multi_open("sprite_data", anime_path)
                 return FE14SpriteModel(
                     self._load_unique_sprite(image_path),
                     self._load_animation_data(rid, animation=animation),
                     team,
                 )
-            elif self.gd.file_exists(anime_path_2, False):
+            elif self._file_exists(anime_path_2):
                 # Found a unique sprite. Load it!
                 image_path = os.path.join(path_2, sprite_filename)
-                rid = self.gd.multi_open("sprite_data", anime_path_2)
+                rid = self._multi_open("sprite_data", anime_path_2)
                 return FE14SpriteModel(
                     self._load_unique_sprite(image_path),
                     self._load_animation_data(rid, animation=animation),
@@ -81,7 +97,7 @@ class FE14Sprites(Sprites):
             # Extract data for building the sprite from its components.
             body_path = os.path.join("unit", "Body", job)
             anime_path = os.path.join(body_path, "anime.bin")
-            rid = self.gd.multi_open("sprite_data", anime_path)
+            rid = self._multi_open("sprite_data", anime_path)
             sprite_data = self._load_animation_data(rid, animation=animation)
 
             # Load by stitching together body and head sprites.
@@ -89,7 +105,7 @@ class FE14Sprites(Sprites):
             head_path = os.path.join("unit", "Head", char)
             head_filename = os.path.join(head_path, sprite_filename)
 
-            if not self.gd.file_exists(body_filename, False) or not self.gd.file_exists(
+            if not self._file_exists(body_filename) or not self._file_exists(
                 head_filename, False
             ):
                 return self._load_dummy_sprite(animation=animation, team=team)
@@ -112,20 +128,21 @@ class FE14Sprites(Sprites):
             return key == "BID_謎の軍" or key == "BID_透魔王国軍"
 
     def _load_animation_data(self, rid, animation=0) -> List[AnimationData]:
-        animations = self.gd.items(rid, "animations")
+        animations = self.gd.items_with_fields(
+            rid, "animations", ["is_used", "frame_count"]
+        )
         animation_data = []
-        for rid in animations:
-            if self.gd.bool(rid, "is_used"):
-                frame_count = self.gd.int(rid, "frame_count")
-
+        for rid, is_used, frame_count in animations:
+            if is_used:
+                frames = self.gd.items_with_fields(
+                    rid, "frames", [*_FRAME_FIELDS.values(), "frame_delay"]
+                )
                 animation_data.append(
                     AnimationData(
                         [
-                            self._load_frame_data(self.gd.list_get(rid, "frames", i))
-                            for i in range(0, frame_count)
-                            if self.gd.int(
-                                self.gd.list_get(rid, "frames", i), "frame_delay"
-                            )
+                            self._load_frame_data(frame[1:])
+                            for frame in frames[:frame_count]
+                            if frame[-1]
                         ]
                     )
                 )
@@ -133,21 +150,10 @@ class FE14Sprites(Sprites):
                     break
         return animation_data
 
-    def _load_frame_data(self, rid) -> FE14FrameData:
+    def _load_frame_data(self, values) -> FE14FrameData:
+        *values, frame_delay = values
         return FE14FrameData(
-            body_offset_x=self.gd.int(rid, "body_draw_offset_x"),
-            body_offset_y=self.gd.int(rid, "body_draw_offset_y"),
-            body_width=self.gd.int(rid, "body_width"),
-            body_height=self.gd.int(rid, "body_height"),
-            body_source_x=self.gd.int(rid, "body_source_position_x"),
-            body_source_y=self.gd.int(rid, "body_source_position_y"),
-            head_offset_x=self.gd.int(rid, "head_draw_offset_x"),
-            head_offset_y=self.gd.int(rid, "head_draw_offset_y"),
-            head_width=self.gd.int(rid, "head_width"),
-            head_height=self.gd.int(rid, "head_height"),
-            head_source_x=self.gd.int(rid, "head_source_position_x"),
-            head_source_y=self.gd.int(rid, "head_source_position_y"),
-            frame_delay=self.gd.int(rid, "frame_delay") * 1000 / 60,
+            frame_delay=frame_delay * 1000 / 60, **dict(zip(_FRAME_FIELDS, values))
         )
 
     def _load_dummy_sprite(self, animation=0, team=None) -> Optional[FE14SpriteModel]:
@@ -156,9 +162,9 @@ class FE14Sprites(Sprites):
         dummy_path = os.path.join("unit", "Unique", "ダミー_ダミー")
         dummy_anime_path = os.path.join(dummy_path, "anime.bin")
 
-        if self.gd.file_exists(dummy_anime_path, False):
+        if self._file_exists(dummy_anime_path):
             image_path = os.path.join(dummy_path, sprite_filename)
-            rid = self.gd.multi_open("sprite_data", dummy_anime_path)
+            rid = self._multi_open("sprite_data", dummy_anime_path)
             return FE14SpriteModel(
                 self._load_unique_sprite(image_path),
                 self._load_animation_data(rid, animation=animation),
@@ -1,6 +1,7 @@
+import fnmatch
 import logging
 import os
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from paragon.model.support_info import SupportInfo, DialogueType
 
@@ -23,6 +24,12 @@ class FE14Supports:
             (DialogueType.CONQUEST_ONLY, "*黒_*.bin.lz", True),
             (DialogueType.REVELATION_ONLY, "*透_*.bin.lz", True),
         ]
+        # owner -> support table and (owner, character) -> support entry.
+        # Edits made here update both. Edits made anywhere else move the
+        # data generations, which rebuilds them on the next lookup.
+        self._tables: Dict[int, int] = {}
+        self._pairs: Dict[Tuple[int, int], int] = {}
+        self._index_generation = None
         self.supports = self._load_all_supports()
 
     @staticmethod
@@ -86,17 +93,17 @@ class FE14Supports:
         return insert_row, support_info_1
 
     def set_type_for_inverse_support(self, info: SupportInfo, raw_support_type):
-        if table := self.get_table(info.char2):
-            for support in self.gd.items(table, "supports"):
-                character = self.gd.rid(support, "character")
-                if info.char1 == character:
-                    self.gd.set_int(support, "type", raw_support_type)
-                    return
+        if support := self._index()[1].get((info.char2, info.char1)):
+            self.gd.set_int(support, "type", raw_support_type)
+            self._mark_index_current()
 
     def _add_support(self, table, char, support_type):
         support = self.gd.list_add(table, "supports")
         self.gd.set_rid(support, "character", char)
         self.gd.set_int(support, "type", support_type)
+        owner = self.gd.rid(table, "owner")
+        self._pairs.setdefault((owner, char), support)
+        self._mark_index_current()
         return support
 
     def _add_support_to_cache(self, key, support) -> int:
@@ -127,6 +134,8 @@ class FE14Supports:
         table = self.gd.new_instance("SupportTable", self.gd.store_number_of(self.support_table_rid))
         self.gd.set_rid(table, "owner", char)
         self.gd.set_rid(main_entry, "table", table)
+        self._tables.setdefault(char, table)
+        self._mark_index_current()
         return table
 
     def _create_dialogue_archive(
@@ -204,19 +213,26 @@ class FE14Supports:
 
     # TODO: Can we make this support other dialogue types as well?
     def delete_support(self, char1, char2):
-        if table := self.get_table(char1):
-            self._remove_support_from_table(table, char2)
-        if table := self.get_table(char2):
-            self._remove_support_from_table(table, char2)
+        self._remove_support_from_table(char1, char2)
+        self._remove_support_from_table(char2, char1)
         self._remove_support_from_cache(char1, char2)
         self._remove_support_from_cache(char2, char1)
 
-    def _remove_support_from_table(self, table, target):
-        for i, support in enumerate(self.gd.items(table, "supports")):
-            character = self.gd.rid(support, "character")
-            if target == character:
-                self.gd.list_remove(table, "supports", i)
-                return
+    def _remove_support_from_table(self, owner, target):
+        tables, pairs = self._index()
+        table = tables.get(owner)
+        support = pairs.pop((owner, target), None)
+        if not table or not support:
+            return
+        self.gd.list_remove(
+            table, "supports", self.gd.items(table, "supports").index(support)
+        )
+        # Another entry for the same character takes over, matching the old scan.
+        for other in self.gd.items(table, "supports"):
+            if self.gd.rid(other, "character") == target:
+                pairs[(owner, target)] = other
+                break
+        self._mark_index_current()
 
     def _remove_support_from_cache(
         self, char1, char2, dialogue_type=DialogueType.STANDARD
@@ -237,13 +253,30 @@ class FE14Supports:
         return False
 
     def get_table(self, char) -> Optional[int]:
-        for table in self.gd.items(self.support_table_rid, self.support_table_field_id):
-            table = self.gd.rid(table, "table")  # Dereference pointer.
-            if table:
-                owner = self.gd.rid(table, "owner")
-                if owner == char:
-                    return table
-        return None
+        return self._index()[0].get(char)
+
+    def _index(self) -> Tuple[Dict[int, int], Dict[Tuple[int, int], int]]:
+        generation = self.gd.display_generations()[:2]
+        if generation == self._index_generation:
+            return self._tables, self._pairs
+        self._tables = {}
+        self._pairs = {}
+        entries = self.gd.items(self.support_table_rid, self.support_table_field_id)
+        tables = [t for (t,) in self.gd.read_fields(entries, ["table"]) if t]
+        for table, (owner,) in zip(tables, self.gd.read_fields(tables, ["owner"])):
+            # The first table for an owner wins, matching the old linear scan.
+            if owner not in self._tables:
+                self._tables[owner] = table
+        for owner, table in self._tables.items():
+            items = self.gd.items_with_fields(table, "supports", ["character"])
+            for support, character in items:
+                self._pairs.setdefault((owner, character), support)
+        self._index_generation = generation
+        return self._tables, self._pairs
+
+    def _mark_index_current(self):
+        # Called after our own edits, which already updated the index.
+        self._index_generation = self.gd.display_generations()[:2]
 
     def shift_supports(self, char, support1, support2):
         table = self.get_table(char)
@@ -260,11 +293,23 @@ class FE14Supports:
             return
         if index2 is None:
             index2 = self.gd.list_size(table, "supports")
+        # Reordering keeps every entry, so only the generation needs updating.
+        # The index is stale if the table holds two entries for one character,
+        # since the first one is the one that counts.
+        duplicates = self._has_duplicate_characters(table)
         self.gd.list_remove(table, "supports", index1)
         if index1 < index2:
             self.gd.list_insert_existing(table, "supports", support1, index2 - 1)
         else:
             self.gd.list_insert_existing(table, "supports", support1, index2)
+        if not duplicates:
+            self._mark_index_current()
+
+    def _has_duplicate_characters(self, table) -> bool:
+        characters = [
+            c for _, c in self.gd.items_with_fields(table, "supports", ["character"])
+        ]
+        return len(characters) != len(set(characters))
 
     # Partition characters based on whether or not they have
     # a support with the given character.
@@ -278,14 +323,17 @@ class FE14Supports:
     def _load_all_supports(self):
         characters = self.gd.items(self.char_table_rid, self.char_table_field_id)
         key_to_rid = self._build_key_to_rid_dict(characters)
+        files = self.gd.list_files("m", "*.bin.lz", True)
+        file_names = {os.path.basename(f) for f in files}
         supports = {}
         for rid in characters:
-            key_and_supports = self._load_normal_supports_for_character(rid)
+            key_and_supports = self._load_normal_supports_for_character(rid, file_names)
             if key_and_supports:
                 key, char_supports = key_and_supports
                 supports[key] = char_supports
         for t, glob, extra_char in self.dialogue_types:
-            self._load_special_supports(key_to_rid, supports, t, glob, extra_char)
+            matches = [f for f in files if fnmatch.fnmatch(os.path.basename(f), glob)]
+            self._load_special_supports(key_to_rid, supports, t, matches, extra_char)
         return supports
 
     def _build_key_to_rid_dict(self, characters):
@@ -297,9 +345,9 @@ class FE14Supports:
         return key_to_rid
 
     def _load_special_supports(
-        self, key_to_rid, supports, dialogue_type, glob, extra_char=None
+        self, key_to_rid, supports, dialogue_type, files, extra_char=None
     ):
-        for f in self.gd.list_files("m", glob, True):
+        for f in files:
             parts = os.path.basename(f).replace(".bin.lz", "").split("_")
             char1, char2 = parts[0], parts[1]
             if extra_char:
@@ -326,7 +374,7 @@ class FE14Supports:
                     " because character data cannot be found."
                 )
 
-    def _load_normal_supports_for_character(self, char):
+    def _load_normal_supports_for_character(self, char, file_names):
         table = self.get_table(char)
         if not table:
             return None
@@ -336,11 +384,14 @@ class FE14Supports:
             char1_key = char1_key[4:]
         else:
             return None
-        for support in self.gd.items(table, "supports"):
-            char2 = self.gd.rid(support, "character")
+        for support, char2 in self.gd.items_with_fields(
+            table, "supports", ["character"]
+        ):
             if char2 and self.gd.key(char2).startswith("PID_"):
                 char2_key = self.gd.key(char2)[4:]
-                path = self._get_support_path("m/%s_%s.bin.lz", char1_key, char2_key)
+                path = self._get_support_path(
+                    "m/%s_%s.bin.lz", char1_key, char2_key, file_names
+                )
                 if not path:
                     path = f"m/{char1_key}_{char2_key}.bin.lz"
                 supports.append(
@@ -348,11 +399,15 @@ class FE14Supports:
                 )
         return char1_key, supports
 
-    def _get_support_path(self, path_base, key1, key2) -> Optional[str]:
+    def _get_support_path(self, path_base, key1, key2, file_names) -> Optional[str]:
         path1 = path_base % (key1, key2)
         path2 = path_base % (key2, key1)
-        if self.gd.file_exists(path1, True) or self.gd.has_text_data(path1, True):
+        if self._archive_exists(path1, file_names):
             return path1
-        elif self.gd.file_exists(path2, True) or self.gd.has_text_data(path2, True):
+        elif self._archive_exists(path2, file_names):
             return path2
         return None
+
+    def _archive_exists(self, path, file_names) -> bool:
+        # Archives created this session are open but not on disk yet.
+        return os.path.basename(path) in file_names or self.gd.has_text_data(path, True)
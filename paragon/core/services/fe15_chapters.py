@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from PySide6 import QtCore
 
@@ -132,6 +132,14 @@ class FE15Chapters(Chapters):
             dialogue=dest_dialogue_path,
         )
 
+    def _chapter_files(self, cid: str) -> List[Tuple[str, str]]:
+        cid_part = cid[4:] if cid.startswith("CID_") else cid
+        return [
+            ("dispos", f"Data/Dispos/{cid_part}.bin.lz"),
+            ("grids", f"Data/Terrain/{cid_part}.bin.lz"),
+            ("events", f"Data/Event/{cid_part}.bin.lz"),
+        ]
+
     def _load(self, cid: str) -> ChapterData:
         # Validate that the CID corresponds to a chapter.
         cid_part = cid[4:] if cid.startswith("CID_") else cid
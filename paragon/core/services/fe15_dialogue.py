@@ -1,8 +1,9 @@
 import logging
 import json
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, TYPE_CHECKING
 
-from PySide6.QtGui import QPixmap, QFont
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 from paragon.core.textures.texture import Texture
 
 from paragon.core.services import utils
@@ -40,6 +41,9 @@ class FE15Dialogue(Dialogue):
             logging.exception("Failed to load dialogue animations.")
             self.dialogue_animations = {}
 
+    def _asset_translations_source_revision(self):
+        return self._portraits_and_text_revision("m/Name.bin.lz")
+
     def _base_asset_translations(self) -> Dict[str, str]:
         try:
             table_rid, field_id = self.data.table("portraits")
@@ -58,7 +62,7 @@ class FE15Dialogue(Dialogue):
             logging.exception("Failed to parse portrait name translations.")
             return {}
 
-    def _load_backgrounds(self) -> List[Tuple[str, QPixmap]]:
+    def _load_backgrounds(self) -> List[Tuple[str, "QPixmap"]]:
         textures = []
         for path in _BACKGROUNDS:
             res = utils.safe_texture_load(lambda: self.data.read_bch_textures(path))
@@ -67,7 +71,7 @@ class FE15Dialogue(Dialogue):
                 textures.append((path[7:], pixmap))
         return textures
 
-    def _load_windows(self) -> Dict[str, Dict[str, QPixmap]]:
+    def _load_windows(self) -> Dict[str, Dict[str, "QPixmap"]]:
         core = self.data.read_bch_textures("ui/mat/Talk.bch.lz")["IntermediateCtex1"]
         texture = Texture.from_core_texture(core)
         uvs_rid = self.data.multi_open("uvs", "ui/mat/Talk.bin.lz")
@@ -1,9 +1,11 @@
 import logging
 from abc import ABC
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, TYPE_CHECKING
 
 from PIL import Image
-from PySide6.QtGui import QPixmap
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 from paragon.core.textures.texture import Texture
 
@@ -14,9 +16,9 @@ from paragon.model.portrait_info import PortraitInfo
 # Context: FE9 and FE10 organize portraits differently, so need to load portraits differently.
 # This is a band aid fix and bad OOP, so should revisit later.
 class GCPortraits(Portraits, ABC):
-    def render(
+    def _render(
         self, fid: str, emotions: List[str], mode: str, active: bool = True
-    ) -> Optional[QPixmap]:
+    ) -> Optional["QPixmap"]:
         if not fid:
             return self.render(self.default_fid(), emotions, mode, active)
 
@@ -1,9 +1,12 @@
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 
 from PIL import ImageEnhance, Image
-from PySide6.QtGui import QPixmap
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
+
+from paragon.core.lru_cache import LRUCache
 from paragon.core.services import utils
 from paragon.core.textures.texture import Texture
 
@@ -34,10 +37,38 @@ class Portraits:
     def __init__(self, config, data):
         self.config = config
         self.data = data
+        # Merged emotion sets are large, so keep fewer of them than rendered busts.
+        self.composited_cache = LRUCache(32)
+        self.rendered_cache = LRUCache(512)
+
+    def clear_cache(self):
+        self.composited_cache.clear()
+        self.rendered_cache.clear()
 
     def render(
         self, fid: str, emotions: List[str], mode: str, active: bool = True
-    ) -> Optional[QPixmap]:
+    ) -> Optional["QPixmap"]:
+        # The state key captures the FaceData fields and avatar settings that
+        # feed into the portrait, so edits to either produce a fresh render.
+        key = (fid, tuple(emotions), mode, active, self._render_state_key(fid, mode))
+        if pixmap := self.rendered_cache.get(key):
+            return pixmap
+        pixmap = self._render(fid, emotions, mode, active)
+        if pixmap:
+            self.rendered_cache.put(key, pixmap)
+        return pixmap
+
+    def _render_state_key(self, fid: str, mode: str):
+        fsid = self.fid_to_fsid(fid, mode) if fid else None
+        info = self.fsid_to_portrait_info(fsid) if fsid else None
+        return fsid, repr(info), self._avatar_cache_key()
+
+    def _avatar_cache_key(self):
+        return None
+
+    def _render(
+        self, fid: str, emotions: List[str], mode: str, active: bool = True
+    ) -> Optional["QPixmap"]:
         # TODO: Other modes?
         if not fid:
             return self.default(mode)
@@ -137,7 +168,19 @@ class Portraits:
             info = self.fsid_to_portrait_info(fsid)
             if not info:
                 return None
+            key = (fsid, repr(info), self._avatar_cache_key())
+            if textures := self.composited_cache.get(key):
+                return dict(textures)
+        except:
+            logging.exception(f"Failed to load portraits for fsid {fsid}.")
+            return None
+        if textures := self._composite(fsid, info):
+            self.composited_cache.put(key, textures)
+            return dict(textures)
+        return textures
 
+    def _composite(self, fsid: str, info: PortraitInfo) -> Optional[Dict[str, Texture]]:
+        try:
             # Read the body arc.
             arc = self._read_portrait_arc(info.body_arc)
 
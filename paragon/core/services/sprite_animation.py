@@ -1,95 +1,139 @@
-from PySide6.QtCore import QTimer, QDateTime
-from paragon.ui.controllers.sprite_item import SpriteItem, SceneSpriteItem
+import heapq
+import time
+from typing import Dict, List, Tuple
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget
+
+from paragon.ui.controllers.sprite_item import AbstractSpriteItem
+
+# Shortest time between two frames of one sprite (60 FPS).
+MIN_FRAME_DELAY = 1000 / 60
+
+# How often to check whether a hidden or paused sprite should resume.
+PARKED_DELAY = 500
+
+# Weight of the newest tick in the average frame time.
+FRAME_TIME_SMOOTHING = 0.1
 
 
 class SpriteAnimation:
+    """Advances every animated sprite from one shared timer.
+
+    Sprites wait in a queue ordered by when their next frame is due, so a
+    tick only touches sprites that have a frame to draw. Sprites without a
+    spritesheet are dropped from the queue until they get one. Sprites that
+    are hidden or have no frame delay are checked again every PARKED_DELAY
+    ms instead of being animated. All frames due in a tick are advanced
+    together, so Qt repaints them in one pass. frame_time is a running average
+    of how long a tick takes, in ms."""
+
     def __init__(self):
         self.timer = QTimer()
-        self.sprite_items = []
-        self.activated = []
-
-        self.scene_sprite_timer = QTimer()
-        self.scene_sprite_items = []
-        self.scene_sprite_activated = []
-
-        self.timer.timeout.connect(self._next_frame)
-        self.scene_sprite_timer.timeout.connect(self._next_scene_item_frame)
-
-    def add_sprite(self, sprite_item: SpriteItem):
-        if isinstance(sprite_item, SceneSpriteItem):
-            if self.timer.isActive():
-                self.scene_sprite_activated.append(QDateTime().currentMSecsSinceEpoch())
-            self.scene_sprite_items.append(sprite_item)
-        else:
-            if self.timer.isActive():
-                self.activated.append(QDateTime().currentMSecsSinceEpoch())
-            self.sprite_items.append(sprite_item)
-
-    def delete_sprite(self, sprite_item: SpriteItem):
-        if self.activated and self.sprite_items:
-            for index in range(len(self.sprite_items)):
-                if self.sprite_items[index] == sprite_item:
-                    self.sprite_items.pop(index)
-                    self.activated.pop(index)
-                    break
-
-    def delete_scene_sprite(self, sprite_item: SceneSpriteItem):
-        if self.activated and self.scene_sprite_items:
-            for index in range(len(self.scene_sprite_items)):
-                if self.scene_sprite_items[index] == sprite_item:
-                    self.scene_sprite_items.pop(index)
-                    self.scene_sprite_activated.pop(index)
-                    break
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._tick)
+        self.running = False
+        self.frame_time = 0.0
+        self._items: Dict[int, AbstractSpriteItem] = {}
+        self._queue: List[Tuple[float, int, int]] = []
+        self._queued: Dict[int, int] = {}
+        self._sequence = 0
+        self._timer_due = None
+
+    def add_sprite(self, sprite_item: AbstractSpriteItem):
+        self._items[id(sprite_item)] = sprite_item
+        self.wake(sprite_item)
+
+    def delete_sprite(self, sprite_item: AbstractSpriteItem):
+        # Queue entries for removed sprites are skipped when they come up.
+        self._items.pop(id(sprite_item), None)
+        self._queued.pop(id(sprite_item), None)
+
+    def delete_scene_sprite(self, sprite_item: AbstractSpriteItem):
+        self.delete_sprite(sprite_item)
+
+    def wake(self, sprite_item: AbstractSpriteItem):
+        """Queue a sprite whose spritesheet or animation just changed."""
+        key = id(sprite_item)
+        if self.running and key in self._items and key not in self._queued:
+            self._reschedule(sprite_item, self._now())
+
+    def animating_count(self) -> int:
+        return len(self._queued)
 
     def start(self):
-        time = QDateTime().currentMSecsSinceEpoch()
-        self.activated = [time for _ in range(len(self.sprite_items))]
-        # Check every 30Hz or 30FPS for layman's terms
-        self.timer.start(1000 / 30)
-        # Check every 60Hz or 60FPS for layman's terms
-        self.scene_sprite_timer.start(1000 / 60)
+        self.running = True
+        now = self._now()
+        for sprite_item in self._items.values():
+            self._reschedule(sprite_item, now)
 
     def stop(self):
+        self.running = False
         self.timer.stop()
+        self._timer_due = None
+        self._queue.clear()
+        self._queued.clear()
 
-    def _next_frame(self):
-        current_time = QDateTime().currentMSecsSinceEpoch()
-        for x in range(len(self.sprite_items)):
-            # If non-zero
-            if frame_delay := self.sprite_items[x].get_current_frame_delay():
-                if (current_time - self.activated[x]) / frame_delay > 1:
-                    self.activated[x] = current_time
-                    # Fire signal here
-                    try:
-                        self.sprite_items[x].next_frame()
-                    except:
-                        pass
-            # If zero, which shouldn't be the case
-            else:
-                # Fire signal here
+    def _tick(self):
+        self._timer_due = None
+        started = time.perf_counter()
+        now = self._now()
+        while self._queue and self._queue[0][0] <= now:
+            _, sequence, key = heapq.heappop(self._queue)
+            if self._queued.get(key) != sequence:
+                continue
+            del self._queued[key]
+            sprite_item = self._items[key]
+            if _is_shown(sprite_item) and self._frame_delay(sprite_item) is not None:
                 try:
-                    self.sprite_items[x].next_frame()
+                    sprite_item.next_frame()
                 except:
                     pass
+            self._reschedule(sprite_item, now)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.frame_time += (elapsed - self.frame_time) * FRAME_TIME_SMOOTHING
+        self._restart_timer()
 
-    def _next_scene_item_frame(self):
-        current_time = QDateTime().currentMSecsSinceEpoch()
-        for x in range(len(self.scene_sprite_items)):
-            # If non-zero
-            if frame_delay := self.scene_sprite_items[x].get_current_frame_delay():
-                # Fire signal here
-                try:
-                    if (
-                        current_time - self.scene_sprite_activated[x]
-                    ) / frame_delay > 1:
-                        self.scene_sprite_activated[x] = current_time
-                        self.scene_sprite_items[x].next_frame()
-                except:
-                    pass
-            # If zero
-            else:
-                # Fire signal here
-                try:
-                    self.scene_sprite_items[x].next_frame()
-                except:
-                    pass
+    def _reschedule(self, sprite_item: AbstractSpriteItem, now: float):
+        if sprite_item.sprite is None:
+            return
+        delay = self._frame_delay(sprite_item)
+        if delay is None or not _is_shown(sprite_item):
+            delay = PARKED_DELAY
+        key = id(sprite_item)
+        self._sequence += 1
+        self._queued[key] = self._sequence
+        heapq.heappush(
+            self._queue, (now + max(delay, MIN_FRAME_DELAY), self._sequence, key)
+        )
+        self._restart_timer()
+
+    def _restart_timer(self):
+        if not self.running or not self._queue:
+            return
+        due = self._queue[0][0]
+        if self._timer_due is None or due < self._timer_due:
+            self._timer_due = due
+            self.timer.start(max(0, int(due - self._now())))
+
+    @staticmethod
+    def _frame_delay(sprite_item: AbstractSpriteItem):
+        try:
+            return sprite_item.get_current_frame_delay()
+        except:
+            return None
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic() * 1000
+
+
+def _is_shown(sprite_item) -> bool:
+    if isinstance(sprite_item, QWidget):
+        return sprite_item.isVisible()
+    scene = sprite_item.scene()
+    return (
+        sprite_item.isVisible()
+        and scene is not None
+        and any(view.isVisible() for view in scene.views())
+    )
@@ -1,15 +1,27 @@
 import logging
 import traceback
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 from PySide6.QtGui import QPixmap
 from paragon.model.sprite import SpriteModel
 
+# Finished sprites kept before the least recently used is dropped.
+_CACHE_SIZE = 128
+
 
 class Sprites:
     def __init__(self, gd):
         self.gd = gd
 
+        # Finished sprites by (char, job, team, fallback_job, animation), plus the
+        # stores each one was read from so edits to those stores can drop it.
+        self._sprites = OrderedDict()
+        self._sources = {}
+        self._reading = set()
+        self._value_generation = gd.display_generations()[1]
+        self._files = {}
+
         self.defaults = {
             "緑": QPixmap("resources/misc/allied.png"),
             "赤": QPixmap("resources/misc/enemy.png"),
@@ -45,6 +57,74 @@ class Sprites:
 
     def load(
         self, char, job, team, fallback_job=None, animation=0
+    ) -> Optional[SpriteModel]:
+        return self._cached(
+            (char, job, team, fallback_job, animation),
+            lambda: self._load_uncached(char, job, team, fallback_job, animation),
+        )
+
+    def _cached(self, key, build) -> Optional[SpriteModel]:
+        self._sync()
+        if key in self._sprites:
+            self._sprites.move_to_end(key)
+            self._reading.update(self._sources[key])
+            return self._sprites[key]
+        # Builds can nest (ex. load falling back to default). Sources of the
+        # inner build count toward the outer one too.
+        outer = self._reading
+        self._reading = set()
+        try:
+            sprite = build()
+        finally:
+            sources = self._reading
+            self._reading = outer
+            outer.update(sources)
+        self._sprites[key] = sprite
+        self._sources[key] = sources
+        if len(self._sprites) > _CACHE_SIZE:
+            evicted, _ = self._sprites.popitem(last=False)
+            del self._sources[evicted]
+        return sprite
+
+    def clear_cache(self):
+        self._sprites.clear()
+        self._sources.clear()
+        self._files.clear()
+        self.gd.refresh_file_index()
+
+    def _sync(self):
+        generation = self.gd.display_generations()[1]
+        if generation == self._value_generation:
+            return
+        edits = self.gd.field_edits_since(self._value_generation)
+        self._value_generation = generation
+        if edits is None:
+            self._sprites.clear()
+            self._sources.clear()
+            return
+        edited = {rid >> 32 for rid, _ in edits}
+        for key in [k for k, stores in self._sources.items() if stores & edited]:
+            del self._sprites[key]
+            del self._sources[key]
+
+    def _note_source(self, rid):
+        # RIDs carry their store number in the upper 32 bits.
+        if rid:
+            self._reading.add(rid >> 32)
+
+    def _multi_open(self, multi_id, key):
+        rid = self.gd.multi_open(multi_id, key)
+        self._note_source(rid)
+        return rid
+
+    def _file_exists(self, path) -> bool:
+        # Probes are remembered, including misses. clear_cache forgets them.
+        if path not in self._files:
+            self._files[path] = self.gd.file_exists(path, False)
+        return self._files[path]
+
+    def _load_uncached(
+        self, char, job, team, fallback_job, animation
     ) -> Optional[SpriteModel]:
         try:
             team_name = self.team_name(team)
@@ -62,6 +142,12 @@ class Sprites:
             return self.default(team, animation=animation)
 
     def default(self, team: int, animation=0) -> Optional[SpriteModel]:
+        return self._cached(
+            ("default", team, animation),
+            lambda: self._default_uncached(team, animation),
+        )
+
+    def _default_uncached(self, team: int, animation=0) -> Optional[SpriteModel]:
         team_name = self.team_name(team)
         return (
             self._default(self.defaults[team_name], animation=animation, team=team_name)
@@ -1,7 +1,10 @@
 import dataclasses
+from typing import TYPE_CHECKING
 
 from PIL import Image
-from PySide6.QtGui import QPixmap
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
 
 @dataclasses.dataclass
@@ -32,7 +35,7 @@ class Texture:
             filename=filename, width=width, height=height, pixel_data=image.tobytes()
         )
 
-    def to_qpixmap(self) -> QPixmap:
+    def to_qpixmap(self) -> "QPixmap":
         return self.to_pillow_image().toqpixmap()
 
     def crop(self, x, y, width, height) -> "Texture":
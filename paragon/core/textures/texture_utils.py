@@ -1,11 +1,10 @@
 from paragon.core.textures.texture import Texture
 
-from paragon.core.textures import ctpk
-
 
 def read_ctpk(gd, path):
-    contents = bytes(gd.read_file(path))
-    return ctpk.decode_textures(contents)
+    # Goes through GameData's texture cache instead of decoding every time.
+    raw_textures = gd.read_ctpk_textures(path)
+    return {k: Texture.from_core_texture(t) for k, t in raw_textures.items()}
 
 
 def read_tpl(gd, path):
@@ -2,7 +2,7 @@ import logging
 import os
 import traceback
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QCoreApplication
 
 from paragon.core.services.fe10_dialogue import FE10Dialogue
 from paragon.core.services.fe10_icons import FE10Icons
@@ -33,26 +33,34 @@ from paragon.core.services.fe15_portraits import FE15Portraits
 from paragon.core.services.fe15_sprites import FE15Sprites
 from paragon.core.services.sprite_animation import SpriteAnimation
 from paragon.core.services.write_preprocessors import WritePreprocessors
+from paragon.core.workers.staged_loader import StagedLoader
 from paragon.model.fe10_state import FE10State
 from paragon.model.fe13_state import FE13State
 from paragon.model.fe14_state import FE14State
 from paragon.model.fe15_state import FE15State
 from paragon.model.game import Game
+from paragon.model.lazy_state import Deferred
 from paragon.model.project import Project
 from paragon.ui.enum_loader import EnumLoader
 from paragon.ui.models import Models
 from paragon.ui.specs import Specs
 
 
-# TODO: Make this multithreaded again.
 class LoadProjectWorker(QObject):
     succeeded = Signal(object)
     error = Signal(tuple)
+    progress = Signal(str, float)
 
     def __init__(self, config: Configuration, project: Project):
         QObject.__init__(self)
         self.project = project
         self.config = config
+        self.loader = None
+        self.timings = {}
+
+    def cancel(self):
+        if self.loader:
+            self.loader.cancel()
 
     def run(self):
         config_root = os.path.join(os.getcwd(), "Data", self.project.game.value)
@@ -61,111 +69,207 @@ class LoadProjectWorker(QObject):
         rom_path = os.path.normpath(self.project.rom_path)
         try:
             logging.info(f"Loading {output_path}, {rom_path}, {config_root}")
-            gd = pgn.GameData.load(
-                output_path,
-                rom_path,
-                self.project.game.value,
-                self.project.language.value,
-                config_root,
-            )
-            gd.read()
-
-            specs = Specs.load(
-                os.path.join(config_root, "UI", "Modules"), self.project.language
+            self.loader = StagedLoader(
+                on_stage_finished=self.progress.emit,
+                idle=QCoreApplication.processEvents,
             )
-            enums = EnumLoader(os.path.join(config_root, "UI", "Enums"))
-
+            self._add_common_stages(self.loader, output_path, rom_path, config_root)
             if self.project.game == Game.FE10:
-                icons = FE10Icons(gd)
-                portraits = FE10Portraits(self.config, gd)
-                models = Models(gd, icons)
-                state = FE10State(
-                    project=self.project,
-                    data=gd,
-                    specs=specs,
-                    enums=enums,
-                    models=models,
-                    icons=icons,
-                    portraits=portraits,
-                    dialogue=FE10Dialogue(
-                        self.project.game, self.config, gd, portraits, config_root
-                    ),
-                    write_preprocessors=WritePreprocessors(),
-                )
+                self._add_fe10_stages(self.loader, config_root)
             elif self.project.game == Game.FE13:
-                icons = FE13Icons(gd)
-                models = Models(gd, icons)
-                portraits = FE13Portraits(self.config, gd)
-                sprites = FE13Sprites(gd)
-                state = FE13State(
-                    project=self.project,
-                    data=gd,
-                    specs=specs,
-                    enums=enums,
-                    models=models,
-                    icons=icons,
-                    portraits=portraits,
-                    dialogue=FE13Dialogue(
-                        self.project.game, self.config, gd, portraits, config_root
-                    ),
-                    sprites=sprites,
-                    sprite_animation=SpriteAnimation(),
-                    chapters=FE13Chapters(gd, models, icons),
-                    endings=FE13Endings(gd, portraits),
-                    write_preprocessors=WritePreprocessors(),
-                )
+                self._add_fe13_stages(self.loader, config_root)
             elif self.project.game == Game.FE14:
-                icons = FE14Icons(gd)
-                models = Models(gd, icons)
-                portraits = FE14Portraits(self.config, gd)
-                dialogue = FE14Dialogue(
-                    self.project.game, self.config, gd, portraits, config_root
-                )
-                chapters = FE14Chapters(gd, models, icons)
-                sprites = FE14Sprites(gd, chapters)
-                state = FE14State(
-                    project=self.project,
-                    data=gd,
-                    specs=specs,
-                    enums=enums,
-                    models=models,
-                    icons=icons,
-                    write_preprocessors=FE14WritePreprocessors(),
-                    portraits=portraits,
-                    dialogue=dialogue,
-                    sprites=sprites,
-                    sprite_animation=SpriteAnimation(),
-                    chapters=chapters,
-                    supports=FE14Supports(gd),
-                )
+                self._add_fe14_stages(self.loader, config_root)
             elif self.project.game == Game.FE15:
-                icons = FE15Icons(gd)
-                models = Models(gd, icons)
-                portraits = FE15Portraits(self.config, gd)
-                sprites = FE15Sprites(gd)
-                state = FE15State(
-                    project=self.project,
-                    data=gd,
-                    specs=specs,
-                    enums=enums,
-                    models=models,
-                    icons=icons,
-                    portraits=portraits,
-                    dialogue=FE15Dialogue(
-                        self.project.game, self.config, gd, portraits, config_root
-                    ),
-                    sprites=sprites,
-                    events=FE15Events(gd),
-                    supports=FE15Supports(gd),
-                    dungeons=FE15Dungeons(gd),
-                    chapters=FE15Chapters(gd, models, icons),
-                    sprite_animation=SpriteAnimation(),
-                    write_preprocessors=WritePreprocessors(),
-                )
+                self._add_fe15_stages(self.loader, config_root)
             else:
                 raise NotImplementedError("Unsupported game.")
-            self.succeeded.emit(state)
+            results = self.loader.run()
+            self.timings = dict(self.loader.timings)
+            if self.loader.canceled:
+                logging.info("Load project canceled.")
+                return
+            logging.info(
+                "Load stage timings: "
+                + ", ".join(f"{k}={v:.3f}s" for k, v in self.timings.items())
+            )
+            self.succeeded.emit(results["state"])
         except Exception as e:
             logging.exception("Load project failed.")
             trace = traceback.format_exc()
             self.error.emit((trace, e))
+
+    def _add_common_stages(self, loader, output_path, rom_path, config_root):
+        # GameData.read() runs on the pool so that spec parsing and any other
+        # file-only work overlaps it. Anything that touches GameData afterwards
+        # runs on the main thread, after "read", to avoid concurrent borrows.
+        loader.add(
+            "definitions",
+            lambda: pgn.GameData.load(
+                output_path,
+                rom_path,
+                self.project.game.value,
+                self.project.language.value,
+                config_root,
+            ),
+        )
+        loader.add("read", _read, ["definitions"])
+        loader.add(
+            "specs",
+            lambda: Specs.load(
+                os.path.join(config_root, "UI", "Modules"),
+                self.project.language,
+                os.path.join(config_root, ".cache"),
+            ),
+        )
+        loader.add(
+            "enums", lambda: EnumLoader(os.path.join(config_root, "UI", "Enums"))
+        )
+
+    def _add_fe10_stages(self, loader, config_root):
+        loader.add("icons", FE10Icons, ["read"], main_thread=True)
+        loader.add("models", Models, ["read", "icons"], main_thread=True)
+        loader.add(
+            "portraits",
+            lambda gd: FE10Portraits(self.config, gd),
+            ["read"],
+            main_thread=True,
+        )
+        loader.add(
+            "dialogue",
+            lambda gd, portraits: FE10Dialogue(
+                self.project.game, self.config, gd, portraits, config_root
+            ),
+            ["read", "portraits"],
+            main_thread=True,
+        )
+        loader.add(
+            "state",
+            self._fe10_state,
+            ["read", "specs", "enums", "models", "icons", "portraits", "dialogue"],
+            main_thread=True,
+        )
+
+    def _add_fe13_stages(self, loader, config_root):
+        loader.add("icons", FE13Icons, ["read"], main_thread=True)
+        loader.add("models", Models, ["read", "icons"], main_thread=True)
+        loader.add(
+            "state",
+            lambda *args: self._fe13_state(config_root, *args),
+            ["read", "specs", "enums", "models", "icons"],
+            main_thread=True,
+        )
+
+    def _add_fe14_stages(self, loader, config_root):
+        loader.add("icons", FE14Icons, ["read"], main_thread=True)
+        loader.add("models", Models, ["read", "icons"], main_thread=True)
+        loader.add(
+            "state",
+            lambda *args: self._fe14_state(config_root, *args),
+            ["read", "specs", "enums", "models", "icons"],
+            main_thread=True,
+        )
+
+    def _add_fe15_stages(self, loader, config_root):
+        # FE15Events only holds on to GameData in its constructor, so the
+        # grammar build can overlap the Rust read instead of being deferred.
+        loader.add("events", FE15Events, ["definitions"])
+        loader.add("icons", FE15Icons, ["read"], main_thread=True)
+        loader.add("models", Models, ["read", "icons"], main_thread=True)
+        loader.add(
+            "state",
+            lambda *args: self._fe15_state(config_root, *args),
+            ["read", "specs", "enums", "models", "icons", "events"],
+            main_thread=True,
+        )
+
+    def _fe10_state(
+        self,
+        gd,
+        specs,
+        enums,
+        models,
+        icons,
+        portraits,
+        dialogue,
+    ):
+        return FE10State(
+            project=self.project,
+            data=gd,
+            specs=specs,
+            enums=enums,
+            models=models,
+            icons=icons,
+            portraits=portraits,
+            dialogue=dialogue,
+            write_preprocessors=WritePreprocessors(),
+        )
+
+    # Services below are Deferred so the main window can open as soon as the
+    # data is read. Each one is built the first time an editor asks for it,
+    # or earlier by the warm-up in UIMainState.
+
+    def _dialogue(self, dialogue_type, config_root):
+        return Deferred(
+            lambda s: dialogue_type(
+                self.project.game, self.config, s.data, s.portraits, config_root
+            )
+        )
+
+    def _fe13_state(self, config_root, gd, specs, enums, models, icons):
+        return FE13State(
+            project=self.project,
+            data=gd,
+            specs=specs,
+            enums=enums,
+            models=models,
+            icons=icons,
+            portraits=Deferred(lambda s: FE13Portraits(self.config, s.data)),
+            dialogue=self._dialogue(FE13Dialogue, config_root),
+            sprites=Deferred(lambda s: FE13Sprites(s.data)),
+            sprite_animation=SpriteAnimation(),
+            chapters=Deferred(lambda s: FE13Chapters(s.data, s.models, s.icons)),
+            endings=Deferred(lambda s: FE13Endings(s.data, s.portraits)),
+            write_preprocessors=WritePreprocessors(),
+        )
+
+    def _fe14_state(self, config_root, gd, specs, enums, models, icons):
+        return FE14State(
+            project=self.project,
+            data=gd,
+            specs=specs,
+            enums=enums,
+            models=models,
+            icons=icons,
+            write_preprocessors=FE14WritePreprocessors(),
+            portraits=Deferred(lambda s: FE14Portraits(self.config, s.data)),
+            dialogue=self._dialogue(FE14Dialogue, config_root),
+            sprites=Deferred(lambda s: FE14Sprites(s.data, s.chapters)),
+            sprite_animation=SpriteAnimation(),
+            chapters=Deferred(lambda s: FE14Chapters(s.data, s.models, s.icons)),
+            supports=Deferred(lambda s: FE14Supports(s.data)),
+        )
+
+    def _fe15_state(self, config_root, gd, specs, enums, models, icons, events):
+        return FE15State(
+            project=self.project,
+            data=gd,
+            specs=specs,
+            enums=enums,
+            models=models,
+            icons=icons,
+            portraits=Deferred(lambda s: FE15Portraits(self.config, s.data)),
+            dialogue=self._dialogue(FE15Dialogue, config_root),
+            sprites=Deferred(lambda s: FE15Sprites(s.data)),
+            events=events,
+            supports=Deferred(lambda s: FE15Supports(s.data)),
+            dungeons=Deferred(lambda s: FE15Dungeons(s.data)),
+            chapters=Deferred(lambda s: FE15Chapters(s.data, s.models, s.icons)),
+            sprite_animation=SpriteAnimation(),
+            write_preprocessors=WritePreprocessors(),
+        )
+
+
+def _read(gd):
+    gd.read()
+    return gd
@@ -0,0 +1,34 @@
+import logging
+import time
+import traceback
+
+from PySide6.QtCore import QObject, Signal
+
+
+class SaveWorker(QObject):
+    """Writes GameData off the main thread.
+
+    GameData releases the GIL while it serializes and compresses files, so the
+    UI stays responsive. The caller is responsible for blocking edits until
+    one of the finished signals fires.
+    """
+
+    succeeded = Signal(float)
+    error = Signal(tuple)
+    progress = Signal(str, int, int)
+
+    def __init__(self, gd):
+        QObject.__init__(self)
+        self.gd = gd
+
+    def run(self):
+        try:
+            start = time.perf_counter()
+            self.gd.write(progress=self.progress.emit)
+            elapsed = time.perf_counter() - start
+            logging.info(f"Save completed in {elapsed:.3f}s.")
+            self.succeeded.emit(elapsed)
+        except Exception as e:
+            logging.exception("Save failed.")
+            trace = traceback.format_exc()
+            self.error.emit((trace, e))
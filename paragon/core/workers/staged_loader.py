@@ -0,0 +1,129 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class StageFailedError(Exception):
+    def __init__(self, stage: str):
+        super().__init__(f"Load stage '{stage}' failed.")
+        self.stage = stage
+
+
+@dataclass
+class LoadStage:
+    name: str
+    function: Callable
+    dependencies: Sequence[str] = field(default_factory=tuple)
+    main_thread: bool = False
+
+
+class StagedLoader:
+    """Runs a dependency graph of load steps, overlapping independent steps.
+
+    Each stage receives the results of its dependencies as positional arguments,
+    in the order they were declared. Stages flagged as main_thread run on the
+    calling thread (anything that creates Qt objects or touches GameData while
+    another stage may be using it). Everything else runs on a thread pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        on_stage_finished: Optional[Callable[[str, float], None]] = None,
+        idle: Optional[Callable[[], None]] = None,
+        poll_interval: float = 0.05,
+    ):
+        self.max_workers = max_workers
+        self.on_stage_finished = on_stage_finished
+        self.idle = idle
+        self.poll_interval = poll_interval
+        self.stages: Dict[str, LoadStage] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+        self.canceled = False
+
+    def add(
+        self,
+        name: str,
+        function: Callable,
+        dependencies: Sequence[str] = (),
+        main_thread: bool = False,
+    ):
+        if name in self.stages:
+            raise KeyError(f"Duplicate load stage '{name}'.")
+        self.stages[name] = LoadStage(name, function, tuple(dependencies), main_thread)
+
+    def cancel(self):
+        self.canceled = True
+
+    def run(self) -> Dict[str, Any]:
+        self._validate()
+        pending: List[str] = list(self.stages)
+        running = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        finished = False
+        try:
+            while (pending or running) and not self.canceled:
+                ready = [s for s in pending if self._is_ready(self.stages[s])]
+                for name in ready:
+                    stage = self.stages[name]
+                    if not stage.main_thread:
+                        pending.remove(name)
+                        running[executor.submit(self._run_stage, stage)] = name
+
+                # Main thread stages run one at a time so that newly
+                # finished pool stages can be picked up between them.
+                main_stage = next(
+                    (self.stages[s] for s in ready if self.stages[s].main_thread), None
+                )
+                if main_stage:
+                    pending.remove(main_stage.name)
+                    self._finish(main_stage.name, self._run_stage(main_stage))
+                    continue
+
+                if not running:
+                    raise RuntimeError(
+                        f"Load stages {pending} can never run. Check their dependencies."
+                    )
+                done, _ = wait(
+                    running, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    self._finish(running.pop(future), future.result())
+                if self.idle:
+                    self.idle()
+            finished = not self.canceled
+        finally:
+            # Don't block on stragglers if we failed or were canceled.
+            executor.shutdown(wait=finished)
+        return self.results
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dependency in stage.dependencies:
+                if dependency not in self.stages:
+                    raise KeyError(
+                        f"Load stage '{stage.name}' depends on unknown stage '{dependency}'."
+                    )
+
+    def _is_ready(self, stage: LoadStage) -> bool:
+        return all(d in self.results for d in stage.dependencies)
+
+    def _run_stage(self, stage: LoadStage):
+        args = [self.results[d] for d in stage.dependencies]
+        start = time.perf_counter()
+        try:
+            result = stage.function(*args)
+        except Exception as e:
+            raise StageFailedError(stage.name) from e
+        return result, time.perf_counter() - start
+
+    def _finish(self, name: str, outcome):
+        result, elapsed = outcome
+        self.results[name] = result
+        self.timings[name] = elapsed
+        logging.info(f"Load stage '{name}' finished in {elapsed:.3f}s.")
+        if self.on_stage_finished:
+            self.on_stage_finished(name, elapsed)
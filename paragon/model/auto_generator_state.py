@@ -1,4 +1,28 @@
 import dataclasses
+from typing import Callable, List
+
+
+class LabeledWidgets(dict):
+    """Widgets with a widget_id, for code that looks them up by name.
+
+    Tabs, collapsibles and list editors build their contents the first time
+    they are shown. If a lookup misses, those builders run until the widget
+    turns up, so callers see the same widgets as with eager generation."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending: List[Callable[[], None]] = []
+
+    def defer(self, build: Callable[[], None]):
+        self.pending.append(build)
+
+    def __missing__(self, key):
+        # Builders may defer more of their own contents, so keep going.
+        while self.pending:
+            self.pending.pop(0)()
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+        raise KeyError(key)
 
 
 @dataclasses.dataclass
@@ -9,4 +33,4 @@ class AutoGeneratorState:
     type_metadata: dict
     field_metadata: dict
     typename: str
-    labeled_widgets: dict = dataclasses.field(default_factory=dict)
+    labeled_widgets: LabeledWidgets = dataclasses.field(default_factory=LabeledWidgets)
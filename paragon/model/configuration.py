@@ -18,6 +18,7 @@ class Configuration(BaseModel):
     theme: Optional[str] = "Fusion Dark"
     backup: Literal["Smart", "Full", "None"] = "Smart"
     show_animations: bool = False
+    warm_up_services: bool = True
     log_level: int = logging.INFO
     font: Optional[str] = None
     map_editor_zoom: int = 1
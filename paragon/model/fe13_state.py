@@ -10,6 +10,7 @@ from paragon.core.services.dialogue import Dialogue
 from paragon.core.services.icons import Icons
 from paragon.core.services.portraits import Portraits
 from paragon.core.services.write_preprocessors import WritePreprocessors
+from paragon.model.lazy_state import LazyState
 from paragon.model.project import Project
 from paragon import paragon as paragon_core
 from paragon.ui.enum_loader import EnumLoader
@@ -18,7 +19,7 @@ from paragon.ui.specs import Specs
 
 
 @dataclasses.dataclass
-class FE13State:
+class FE13State(LazyState):
     project: Project
     data: paragon_core.GameData
     specs: Specs
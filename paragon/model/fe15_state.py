@@ -13,6 +13,7 @@ from paragon.core.services.sprites import Sprites
 from paragon.core.services.sprite_animation import SpriteAnimation
 from paragon.core.services.write_preprocessors import WritePreprocessors
 
+from paragon.model.lazy_state import LazyState
 from paragon.model.project import Project
 from paragon import paragon as paragon_core
 from paragon.ui.enum_loader import EnumLoader
@@ -21,7 +22,7 @@ from paragon.ui.specs import Specs
 
 
 @dataclasses.dataclass
-class FE15State:
+class FE15State(LazyState):
     project: Project
     data: paragon_core.GameData
     specs: Specs
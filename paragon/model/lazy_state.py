@@ -0,0 +1,59 @@
+import logging
+from typing import Any, Callable, Dict, List
+
+
+class Deferred:
+    """Placeholder for a state field that is built on first access.
+
+    factory receives the state, so a service can depend on other fields
+    (which may themselves be deferred)."""
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        self.factory = factory
+
+
+class LazyState:
+    """Base for game states whose services are built on demand.
+
+    Fields given a Deferred are held back by __post_init__ and built the
+    first time they are read. After that they are ordinary attributes.
+    Everything runs on the main thread, like the services themselves."""
+
+    def __post_init__(self):
+        deferred = {}
+        for name, value in list(self.__dict__.items()):
+            if isinstance(value, Deferred):
+                deferred[name] = value
+                del self.__dict__[name]
+        self.__dict__["_deferred"] = deferred
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, so built fields never get here.
+        deferred: Dict[str, Deferred] = self.__dict__.get("_deferred", {})
+        if name not in deferred:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        try:
+            value = deferred[name].factory(self)
+        except AttributeError as e:
+            # Python would swallow this and report the field itself as missing.
+            raise RuntimeError(f"Failed to build '{name}'.") from e
+        del deferred[name]
+        setattr(self, name, value)
+        return value
+
+    def pending_services(self) -> List[str]:
+        return list(self.__dict__.get("_deferred", {}))
+
+    def warm_up(self, name: str):
+        """Build a pending service ahead of time, logging any failure.
+
+        A service that fails stays pending, so whoever reads it first still
+        sees the error."""
+        if name not in self.__dict__.get("_deferred", {}):
+            return
+        try:
+            getattr(self, name)
+        except:
+            logging.exception(f"Failed to warm up '{name}'.")
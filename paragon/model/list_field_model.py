@@ -11,40 +11,86 @@ _REORDERING_MIMETYPE = "application/paragon-model-row"
 
 
 class ListFieldModel(QAbstractListModel):
-    def __init__(self, gd, icons, rid, field_id, display_function=None):
+    def __init__(self, gd, icons, rid, field_id, display_function=None, displays=None):
         super().__init__()
         self.gd = gd
         self.icons = icons
         self.rid = rid
         self.field_id = field_id
         self.display_function = display_function
+        self.displays = displays
+
+        # Filled on first use and dropped whenever the list or anything
+        # a display could depend on changes (see GameData.display_generation).
+        self._generation = None
+        self._rids = None
+        self._displays = None
+        self._icons = {}
 
     def refresh(self):
+        self._invalidate()
         self.beginResetModel()
         self.endResetModel()
 
     def rowCount(self, parent: QtCore.QModelIndex = ...) -> int:
-        return self.gd.list_size(self.rid, self.field_id)
+        return len(self._cached_rids())
 
     def data(self, index: QtCore.QModelIndex, role: int = ...) -> Any:
         if not index.isValid():
             return None
-        rid = self.gd.list_get(self.rid, self.field_id, index.row())
+        rids = self._cached_rids()
+        if index.row() >= len(rids):
+            return None
+        rid = rids[index.row()]
         if role == QtCore.Qt.DisplayRole:
-            if self.display_function:
-                display = display_rid(self.gd, rid, self.display_function, index.row())
-            else:
-                display = None
-            display = display if display else self.gd.display(rid)
-            display = display if display else self.gd.key(rid)
-            display = display if display else "Item"
-            return f"{display} #{index.row() + 1}"
+            return self._cached_displays()[index.row()]
         elif role == QtCore.Qt.DecorationRole:
-            return self.icons.icon(rid)
+            if rid not in self._icons:
+                self._icons[rid] = self.icons.icon(rid)
+            return self._icons[rid]
         elif role == QtCore.Qt.UserRole:
             return rid
         return None
 
+    def _invalidate(self):
+        self._rids = None
+        self._displays = None
+        self._icons = {}
+
+    def _cached_rids(self) -> List[int]:
+        generation = self.gd.display_generation()
+        if generation != self._generation:
+            self._invalidate()
+            self._generation = generation
+        if self._rids is None:
+            self._rids = self.gd.items(self.rid, self.field_id) or []
+        return self._rids
+
+    def _cached_displays(self) -> List[str]:
+        rids = self._cached_rids()
+        if self._displays is None:
+            self._displays = [self._display(rid, row) for row, rid in enumerate(rids)]
+        return self._displays
+
+    def _display(self, rid, row) -> str:
+        # Rows that an edit didn't touch come straight from the shared cache.
+        if self.displays:
+            key = ("list", rid, self.display_function, row)
+            return self.displays.get(
+                key, lambda gd: self._compute_display(gd, rid, row)
+            )
+        return self._compute_display(self.gd, rid, row)
+
+    def _compute_display(self, gd, rid, row) -> str:
+        if self.display_function:
+            display = display_rid(gd, rid, self.display_function, row)
+        else:
+            display = None
+        display = display if display else gd.display(rid)
+        display = display if display else gd.key(rid)
+        display = display if display else "Item"
+        return f"{display} #{row + 1}"
+
     def insertRows(self, row: int, count: int, parent: QModelIndex = ...) -> bool:
         if row > self.rowCount():
             return False
@@ -52,6 +98,7 @@ class ListFieldModel(QAbstractListModel):
             self.beginInsertRows(parent, row, row + count - 1)
             for i in range(0, count):
                 self.gd.list_insert(self.rid, self.field_id, row)
+            self._invalidate()
             self.endInsertRows()
             return True
 
@@ -69,6 +116,7 @@ class ListFieldModel(QAbstractListModel):
             self.beginRemoveRows(parent, row, row + count - 1)
             for _ in range(0, count):
                 self.gd.list_remove(self.rid, self.field_id, row)
+            self._invalidate()
             self.endRemoveRows()
             return True
 
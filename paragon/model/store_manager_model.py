@@ -10,7 +10,7 @@ class StoreManagerModel(QStandardItemModel):
     def __init__(self, gd):
         super().__init__()
         self.gd = gd
-        self.setHorizontalHeaderLabels(["Store ID", "Path", "Type", "Dirty?"])
+        self.setHorizontalHeaderLabels(["Store ID", "Path", "Type", "Dirty?", "Memory"])
         self.refresh()
 
         self.itemChanged.connect(self._on_dirty_state_changed)
@@ -34,7 +34,14 @@ class StoreManagerModel(QStandardItemModel):
         dirty_item.setCheckable(True)
         dirty_item.setCheckState(QtCore.Qt.Checked if store.dirty else QtCore.Qt.Unchecked)
         dirty_item.setEnabled(store.store_type != "Multi")
-        return [item, path_item, type_item, dirty_item]
+        memory_item = QStandardItem(f"{sum(m[2] for m in store.memory) // 1024} KB")
+        memory_item.setToolTip(
+            "\n".join(
+                f"{typename}: {count} records, {size // 1024} KB"
+                for typename, count, size in store.memory
+            )
+        )
+        return [item, path_item, type_item, dirty_item, memory_item]
 
     def _on_dirty_state_changed(self, item: QStandardItem):
         store_number = self.item(item.row(), 0).data()
@@ -10,7 +10,7 @@ from paragon.ui.controllers.auto.rendered_portrait_box import RenderedPortraitBo
 from paragon.ui.controllers.auto.swappable import Swappable
 from paragon.ui.controllers.auto.union_widget import UnionWidget
 
-from paragon.model.auto_generator_state import AutoGeneratorState
+from paragon.model.auto_generator_state import AutoGeneratorState, LabeledWidgets
 from paragon.model.auto_ui import (
     FormSpec,
     StringLineEditSpec,
@@ -105,6 +105,7 @@ class AutoWidgetGenerator:
             "record": RecordWidgetSpec(type="record_widget"),
             "union": UnionWidgetSpec(type="union_widget"),
         }
+        self.pool = {}
 
     def generate_for_type(self, typename, state=None, multi_wrap_ids=None):
         type_metadata = self.data.type_metadata(typename)
@@ -116,7 +117,7 @@ class AutoWidgetGenerator:
             type_metadata=type_metadata,
             field_metadata=field_metadata,
             typename=typename,
-            labeled_widgets=state.labeled_widgets if state else {},
+            labeled_widgets=state.labeled_widgets if state else LabeledWidgets(),
         )
         ui = self.generate_top_level(state, self.get_top_level_spec(typename))
         if size := self.specs.get_dimensions(typename):
@@ -130,6 +131,20 @@ class AutoWidgetGenerator:
             ui.set_target = wrapper
         return ui
 
+    def acquire(self, typename, multi_wrap_ids=None):
+        """Get a top level UI for the type, reusing one whose window is closed.
+
+        UIs are pooled by typename, so opening another node of the same type
+        only retargets an existing UI. The caller must call set_target."""
+        key = (typename, tuple(multi_wrap_ids or ()))
+        uis = self.pool.setdefault(key, [])
+        for ui in uis:
+            if not ui.isVisible():
+                return ui
+        ui = self.generate_for_type(typename, multi_wrap_ids=multi_wrap_ids)
+        uis.append(ui)
+        return ui
+
     def generate_top_level(self, state, spec):
         widget = self._generate_top_level(state, spec)
         if spec.widget_id:
@@ -3,17 +3,33 @@ from paragon.ui.views.ui_collapsible import Ui_Collapsible
 
 
 class Collapsible(AbstractAutoWidget, Ui_Collapsible):
+    """The inner widget is generated the first time it is expanded."""
+
     def __init__(self, state, spec):
         AbstractAutoWidget.__init__(self, state)
         Ui_Collapsible.__init__(self)
-        self.inner = state.generator.generate_top_level(state, spec.inner)
-        self.inner.setVisible(False)
-        self.layout().addWidget(self.inner)
+        self.state = state
+        self.spec = spec
+        self.rid = None
+        self.inner = None
+        state.labeled_widgets.defer(self._build)
 
         self.toggle.clicked.connect(self._toggle)
 
+    def _build(self):
+        if not self.inner:
+            self.inner = self.state.generator.generate_top_level(
+                self.state, self.spec.inner
+            )
+            self.inner.setVisible(False)
+            self.layout().addWidget(self.inner)
+            self.inner.set_target(self.rid)
+
     def _toggle(self):
+        self._build()
         self.inner.setVisible(not self.inner.isVisible())
 
     def set_target(self, rid):
-        self.inner.set_target(rid)
+        self.rid = rid
+        if self.inner:
+            self.inner.set_target(rid)
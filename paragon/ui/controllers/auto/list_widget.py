@@ -3,7 +3,7 @@ from typing import Optional
 
 from PySide6 import QtCore
 from PySide6.QtCore import QSortFilterProxyModel, QModelIndex, Signal
-from PySide6.QtWidgets import QInputDialog
+from PySide6.QtWidgets import QInputDialog, QWidget
 
 from paragon.ui import utils
 from paragon.ui.controllers.advanced_copy_dialog import AdvancedCopyDialog
@@ -33,10 +33,14 @@ class ListWidget(AbstractAutoWidget, Ui_ListWidget):
         fm = state.field_metadata[field_id]
         self.fixed_size = fm.get("fixed_size")
         self.stored_type = fm["stored_type"]
-        self.inner = state.generator.generate_for_type(fm["stored_type"], state)
-        self.inner.set_target(None)
-        self.splitter.addWidget(self.inner)
-        self.splitter.setStretchFactor(spec.stretch_index, 1)
+
+        # The item editor is generated when the first item is selected.
+        self.state = state
+        self.inner = None
+        self.splitter.addWidget(QWidget())
+        state.labeled_widgets.defer(self._get_inner)
+        self.stretch_index = spec.stretch_index
+        self.splitter.setStretchFactor(self.stretch_index, 1)
 
         if spec.no_margins:
             self.setContentsMargins(0, 0, 0, 0)
@@ -71,10 +75,22 @@ class ListWidget(AbstractAutoWidget, Ui_ListWidget):
         else:
             self.list.setModel(None)
             self.proxy_model = None
-        self.inner.set_target(None)
+        if self.inner:
+            self.inner.set_target(None)
         self.item_selected.emit(None)
         self._update_buttons()
 
+    def _get_inner(self):
+        if not self.inner:
+            index = self.splitter.count() - 1
+            self.inner = self.state.generator.generate_for_type(
+                self.stored_type, self.state
+            )
+            self.inner.set_target(None)
+            self.splitter.replaceWidget(index, self.inner).deleteLater()
+            self.splitter.setStretchFactor(self.stretch_index, 1)
+        return self.inner
+
     @staticmethod
     def _wrap_in_proxy_model(model):
         proxy_model = QSortFilterProxyModel()
@@ -116,7 +132,7 @@ class ListWidget(AbstractAutoWidget, Ui_ListWidget):
                         self.data.copy(other_rid, rid, [])
 
                         # Refresh the view.
-                        self.inner.set_target(rid)
+                        self._get_inner().set_target(rid)
                         self.list.model().dataChanged.emit(
                             self.list.currentIndex(),
                             self.list.currentIndex(),
@@ -133,7 +149,7 @@ class ListWidget(AbstractAutoWidget, Ui_ListWidget):
     def _on_select(self):
         if model := self.list.model():
             rid = model.data(self.list.currentIndex(), QtCore.Qt.UserRole)
-            self.inner.set_target(rid)
+            self._get_inner().set_target(rid)
             self.item_selected.emit(rid)
         else:
             self.item_selected.emit(None)
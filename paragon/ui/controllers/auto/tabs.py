@@ -1,21 +1,56 @@
-from PySide6.QtWidgets import QTabWidget
+from PySide6.QtWidgets import QTabWidget, QWidget, QVBoxLayout
 from paragon.ui.controllers.auto.abstract_auto_widget import AbstractAutoWidget
 
 
 class Tabs(AbstractAutoWidget, QTabWidget):
+    """Tab contents are generated the first time the tab is opened."""
+
     def __init__(self, state, spec):
         AbstractAutoWidget.__init__(self, state)
         QTabWidget.__init__(self)
+        self.state = state
+        self.rid = None
+        self.specs = []
         self.widgets = []
         for tab in spec.tabs:
-            w = state.generator.generate_top_level(state, tab.inner)
-            self.widgets.append(w)
-            self.addTab(w, tab.title)
+            page = QWidget()
+            layout = QVBoxLayout()
+            layout.setContentsMargins(0, 0, 0, 0)
+            page.setLayout(layout)
+            self.specs.append(tab.inner)
+            self.widgets.append(None)
+            self.addTab(page, tab.title)
+        state.labeled_widgets.defer(self._build_all)
+        self._build_tab(self.currentIndex())
+
+        self.currentChanged.connect(self._on_current_changed)
 
     def set_target(self, rid):
+        self.rid = rid
         for widget in self.widgets:
-            widget.set_target(rid)
+            if widget:
+                widget.set_target(rid)
 
     def delete_tab(self, index):
-        self.removeTab(index)
+        # Drop the bookkeeping first since removing the tab can open another.
+        del self.specs[index]
         del self.widgets[index]
+        self.removeTab(index)
+
+    def _on_current_changed(self, index):
+        if index >= 0 and not self.widgets[index]:
+            self._build_tab(index)
+            self.widgets[index].set_target(self.rid)
+
+    def _build_tab(self, index):
+        if index < 0 or self.widgets[index]:
+            return
+        w = self.state.generator.generate_top_level(self.state, self.specs[index])
+        self.widget(index).layout().addWidget(w)
+        self.widgets[index] = w
+
+    def _build_all(self):
+        for i in range(0, len(self.widgets)):
+            if not self.widgets[i]:
+                self._build_tab(i)
+                self.widgets[i].set_target(self.rid)
@@ -56,10 +56,12 @@ class AvatarConfigWindow(Ui_AvatarConfigWindow):
 
     def _on_portraits_changed(self):
         self.config.portraits = self.portraits.currentData()
+        self.service.clear_cache()
         self._update_portraits()
 
     def _on_accessory_changed(self):
         self.config.accessory = self.accessory.currentData()
+        self.service.clear_cache()
         self._update_portraits()
 
     def _update_portraits(self):
@@ -102,3 +102,16 @@ class ChapterEditor(Ui_ChapterEditor):
             logging.exception(f"Failed to load chapter {key}")
             self.error_dialog = ErrorDialog(traceback.format_exc())
             self.error_dialog.show()
+            return
+        self._prefetch_neighbors(index)
+
+    def _prefetch_neighbors(self, index):
+        # Chapters are usually browsed in order, so warm up the ones on either side.
+        model = self.list.model()
+        for row in (index.row() - 1, index.row() + 1):
+            neighbor = model.index(row, 0)
+            if not neighbor.isValid():
+                continue
+            decl = model.data(neighbor, QtCore.Qt.UserRole)
+            if decl and (key := self.gd.key(decl)):
+                self.chapters.prefetch(key)
@@ -5,7 +5,9 @@ from PySide6.QtGui import QPixmap, QPainter, QMouseEvent, QCursor, QAction
 from paragon.ui.controllers.sprite_item import SpriteItem
 
 
-class FE13UnitSpriteItem(SpriteItem):
+# Menus and animation stepping for FE13 unit sprites. Mixed into a widget
+# (FE13UnitSpriteItem) or a scene item (the map editor's cells).
+class FE13UnitSprite:
     def __init__(self, sprite_svc, sprite_animation):
         super().__init__(sprite_svc, sprite_animation)
         self._setup_menu()
@@ -218,3 +220,7 @@ class FE13UnitSpriteItem(SpriteItem):
 
             # Redraw new frame
             self.update(0, 0, self.width(), self.height())
+
+
+class FE13UnitSpriteItem(FE13UnitSprite, SpriteItem):
+    pass
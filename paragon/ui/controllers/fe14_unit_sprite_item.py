@@ -5,7 +5,9 @@ from PySide6.QtGui import QPixmap, QPainter, QMouseEvent, QCursor, QAction
 from paragon.ui.controllers.sprite_item import SpriteItem
 
 
-class FE14UnitSpriteItem(SpriteItem):
+# Menus and animation stepping for FE14 unit sprites. Mixed into a widget
+# (FE14UnitSpriteItem) or a scene item (the map editor's cells).
+class FE14UnitSprite:
     def __init__(self, sprite_svc, sprite_animation):
         super().__init__(sprite_svc, sprite_animation)
         self._setup_menu()
@@ -216,3 +218,7 @@ class FE14UnitSpriteItem(SpriteItem):
 
             # Redraw new frame
             self.update(0, 0, self.width(), self.height())
+
+
+class FE14UnitSpriteItem(FE14UnitSprite, SpriteItem):
+    pass
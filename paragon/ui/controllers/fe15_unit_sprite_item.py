@@ -5,7 +5,9 @@ from PySide6.QtGui import QPixmap, QPainter, QMouseEvent, QCursor, QAction
 from paragon.ui.controllers.sprite_item import SpriteItem
 
 
-class FE15UnitSpriteItem(SpriteItem):
+# Menus and animation stepping for FE15 unit sprites. Mixed into a widget
+# (FE15UnitSpriteItem) or a scene item (the map editor's cells).
+class FE15UnitSprite:
     def __init__(self, sprite_svc, sprite_animation):
         super().__init__(sprite_svc, sprite_animation)
         self._setup_menu()
@@ -172,3 +174,7 @@ class FE15UnitSpriteItem(SpriteItem):
 
             # Redraw new frame
             self.update(0, 0, self.width(), self.height())
+
+
+class FE15UnitSpriteItem(FE15UnitSprite, SpriteItem):
+    pass
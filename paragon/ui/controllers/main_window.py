@@ -2,12 +2,13 @@ import logging
 import traceback
 
 from PySide6 import QtCore
-from PySide6.QtCore import QSortFilterProxyModel
+from PySide6.QtCore import QSortFilterProxyModel, QThread
 from PySide6.QtGui import QIcon, QActionGroup, QAction
 from PySide6.QtWidgets import QInputDialog, QFontDialog
 from paragon.ui import utils
 
 from paragon.core import backup
+from paragon.core.workers.save_worker import SaveWorker
 from paragon.model.game import Game
 from paragon.model.multi_model import MultiModel
 from paragon.model.node_model import NodeModel
@@ -18,6 +19,7 @@ from paragon.ui.controllers.fe10_main_widget import FE10MainWidget
 from paragon.ui.controllers.fe13_main_widget import FE13MainWidget
 from paragon.ui.controllers.fe14_main_widget import FE14MainWidget
 from paragon.ui.controllers.fe15_main_widget import FE15MainWidget
+from paragon.ui.controllers.save_progress_dialog import SaveProgressDialog
 from paragon.ui.views.ui_main_window import Ui_MainWindow
 
 
@@ -29,6 +31,9 @@ class MainWindow(Ui_MainWindow):
         self.gen = AutoWidgetGenerator(ms, gs)
         self.about_dialog = About()
         self.error_dialog = None
+        self.save_dialog = None
+        self.save_thread = None
+        self.save_worker = None
         self.open_uis = {}
 
         self.node_model = NodeModel(gs.data)
@@ -73,6 +78,7 @@ class MainWindow(Ui_MainWindow):
 
     def closeEvent(self, event) -> None:
         self.open_uis.clear()
+        self.gen.pool.clear()
         if hasattr(self, "main_widget"):
             self.main_widget.on_close()
         super().closeEvent(event)
@@ -146,6 +152,8 @@ class MainWindow(Ui_MainWindow):
         self.ms.sm.transition("Load", main_state=self.ms, project=self.gs.project)
 
     def _on_save(self):
+        if self.save_thread:
+            return
         if self.ms.config.backup != "None":
             try:
                 backup.backup(
@@ -163,13 +171,40 @@ class MainWindow(Ui_MainWindow):
             logging.info("Invoking preprocessors before saving.")
             self.gs.write_preprocessors.invoke(self.gs.data)
             logging.info("Preprocessing completed. Saving...")
-            self.gs.data.write()
-            logging.info("Save completed.")
-            self.statusBar().showMessage("Save complete.", 5000)
         except:
             logging.exception("Save failed.")
             self.error_dialog = ErrorDialog(traceback.format_exc())
             self.error_dialog.show()
+            return
+
+        # Write on a background thread. The modal dialog blocks edits until it finishes.
+        self.save_dialog = SaveProgressDialog()
+        self.save_thread = QThread()
+        self.save_worker = SaveWorker(self.gs.data)
+        self.save_worker.moveToThread(self.save_thread)
+        self.save_worker.progress.connect(self.save_dialog.set_progress)
+        self.save_worker.succeeded.connect(self._on_save_succeeded)
+        self.save_worker.error.connect(self._on_save_error)
+        self.save_thread.started.connect(self.save_worker.run)
+        self.save_dialog.show()
+        self.save_thread.start()
+
+    def _on_save_succeeded(self, _elapsed):
+        self._finish_save()
+        self.statusBar().showMessage("Save complete.", 5000)
+
+    def _on_save_error(self, error_info):
+        self._finish_save()
+        self.error_dialog = ErrorDialog(error_info[0])
+        self.error_dialog.show()
+
+    def _finish_save(self):
+        self.save_thread.quit()
+        self.save_thread.wait()
+        self.save_dialog.reset()
+        self.save_dialog = None
+        self.save_thread = None
+        self.save_worker = None
 
     def _on_about(self):
         self.about_dialog.show()
@@ -210,18 +245,24 @@ class MainWindow(Ui_MainWindow):
                 self.open_uis[node].show()
                 return
 
-            # Not cached. Generate the UI from the typename.
+            # Not cached. Take a UI for the typename from the pool.
             typename = self.gs.data.type_of(node.rid)
-            ui = self.gen.generate_for_type(typename)
+            ui = self.gen.acquire(typename)
             ui.setWindowTitle(f"Paragon - {node.name}")
             ui.setWindowIcon(QIcon("paragon.ico"))
             ui.set_target(node.rid)
-            self.open_uis[node] = ui
+            self._track_open_ui(node, ui)
             ui.show()
         except:
             logging.exception(f"Failed to generate ui for node {node.name}.")
             utils.error(self)
 
+    def _track_open_ui(self, key, ui):
+        # A pooled UI may have been showing something else before.
+        for other in [k for k, v in self.open_uis.items() if v is ui]:
+            del self.open_uis[other]
+        self.open_uis[key] = ui
+
     def _on_multi_activated(self, index):
         # Prompt the user to select a file.
         data = self.gs.data
@@ -240,16 +281,14 @@ class MainWindow(Ui_MainWindow):
 
             # Not cached. Open the file and generate a UI.
             rid = data.multi_open(multi.id, choice)
-            ui = self.gen.generate_for_type(
-                data.type_of(rid), multi_wrap_ids=multi.wrap_ids
-            )
+            ui = self.gen.acquire(data.type_of(rid), multi_wrap_ids=multi.wrap_ids)
             ui.setWindowTitle(f"Paragon - {multi.name}")
             ui.setWindowIcon(QIcon("paragon.ico"))
             if multi.wrap_ids:
                 ui.set_target(rid, multi_id=key[0], multi_key=key[1])
             else:
                 ui.set_target(rid)
-            self.open_uis[key] = ui
+            self._track_open_ui(key, ui)
             ui.show()
         except:
             logging.exception(f"Failed to open multi {multi.name}.")
@@ -40,6 +40,7 @@ class MapEditor(Ui_MapEditor):
         self.cid = None
         self.gd = gs.data
         self.chapters = gs.chapters
+        self.sprites = gs.sprites
         self.undo_stack = QUndoStack()
 
         self.grid = MapGrid(
@@ -562,6 +563,8 @@ class MapEditor(Ui_MapEditor):
 
     def _on_reload(self):
         try:
+            # Pick up sprite files added outside the editor.
+            self.sprites.clear_cache()
             self.set_target(
                 self.cid, self.terrain_key, self.person_key, self.dispos, self.terrain
             )
@@ -1,6 +1,8 @@
 from PySide6 import QtCore
 from PySide6.QtCore import QItemSelectionModel, Signal
+from PySide6.QtGui import QMouseEvent, QTransform
 
+from paragon.ui.controllers.map_cell import TILE_SIZE
 from paragon.ui.views.ui_map_grid import Ui_MapGrid
 
 
@@ -24,6 +26,8 @@ class MapGrid(Ui_MapGrid):
         self.selection_model = None
         self.is_terrain_mode = mode_fn
         self.is_coord_2 = coord_fn
+        self._hovered_cell = None
+        self._drag_cell = None
 
     def move_spawn(self, spawn, row, col):
         if cell := self._spawn_to_cell(spawn):
@@ -34,7 +38,7 @@ class MapGrid(Ui_MapGrid):
             self.cells[row][col].set_selected(True)
 
     def set_tile_color(self, row, col, color):
-        self.cells[row][col].set_color(color)
+        self.terrain.set_color(row, col, color)
 
     def clear(self):
         self._for_each_cell(lambda cell: cell.clear_spawns())
@@ -59,17 +63,12 @@ class MapGrid(Ui_MapGrid):
         c.person_key = person_key
 
     def set_zoom(self, zoom):
-        self._for_each_cell(lambda c: c.set_zoom(zoom))
-        if zoom != 0:
-            self.widget().resize(zoom * 32 * 40, zoom * 32 * 40)
-        else:
-            self.widget().resize(32 * 32, 32 * 32)
+        # Zoom 0 shrinks tiles to 32px. Otherwise tiles are 40px times zoom.
+        scale = zoom if zoom != 0 else 32 / 40
+        self.setTransform(QTransform.fromScale(scale, scale))
 
     def set_tile_colors(self, colors):
-        if not colors:
-            self._for_each_cell(lambda c: c.set_color("#424242"))
-        else:
-            self._for_each_cell(lambda c: c.set_color(colors[c.row][c.column]))
+        self.terrain.set_colors(colors)
 
     def set_selection_model(self, selection_model: QItemSelectionModel):
         self.selection_model = selection_model
@@ -108,11 +107,46 @@ class MapGrid(Ui_MapGrid):
         elif self.is_terrain_mode():
             self.tile_clicked.emit(cell.row, cell.column)
 
-    def _on_cell_dragged(self, cell):
-        self.dragged.emit(cell.row, cell.column)
-
-    def _on_cell_hovered(self, cell):
-        self.hovered.emit(cell.row, cell.column)
+    def _cell_at(self, ev: QMouseEvent):
+        pos = self.mapToScene(ev.position().toPoint())
+        row = int(pos.y() // TILE_SIZE)
+        col = int(pos.x() // TILE_SIZE)
+        return self.cells[row][col] if coord_in_bounds([row, col]) else None
+
+    def mousePressEvent(self, ev: QMouseEvent):
+        cell = self._cell_at(ev)
+        if not cell:
+            return
+        self._on_cell_selected(cell)
+        if (
+            not self.is_terrain_mode()
+            and ev.button() == QtCore.Qt.LeftButton
+            and cell.spawns
+        ) or self.is_terrain_mode():
+            self._drag_cell = cell
+        cell.press(ev.button())
+
+    def mouseMoveEvent(self, ev: QMouseEvent):
+        cell = self._cell_at(ev)
+        if cell is not self._hovered_cell:
+            if self._hovered_cell:
+                self._hovered_cell.set_hovered(False)
+            self._hovered_cell = cell
+            if cell:
+                cell.set_hovered(True)
+                self.hovered.emit(cell.row, cell.column)
+        if self._drag_cell and ev.buttons() and cell and cell is not self._drag_cell:
+            self._drag_cell = cell
+            self.dragged.emit(cell.row, cell.column)
+
+    def mouseReleaseEvent(self, ev: QMouseEvent):
+        self._drag_cell = None
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        if self._hovered_cell:
+            self._hovered_cell.set_hovered(False)
+            self._hovered_cell = None
 
     def _on_selection(self, current, previous):
         if not self.is_terrain_mode():
@@ -5,7 +5,14 @@ from PySide6.QtWidgets import QProgressDialog
 class ProjectLoadingDialog(QProgressDialog):
     def __init__(self, project):
         super().__init__(f"Loading project {project.name}...", "Cancel", 0, 0)
+        self.project_name = project.name
         self.setAutoClose(True)
         self.setModal(True)
         self.setWindowTitle("Paragon - Loading...")
         self.setWindowIcon(QIcon("paragon.ico"))
+
+    def set_finished_stage(self, stage: str, elapsed: float):
+        self.setLabelText(
+            f"Loading project {self.project_name}...\n"
+            f"Finished {stage} ({elapsed:.2f}s)"
+        )
@@ -0,0 +1,19 @@
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QProgressDialog
+
+
+class SaveProgressDialog(QProgressDialog):
+    def __init__(self):
+        super().__init__("Saving...", None, 0, 0)
+        self.setAutoClose(True)
+        self.setModal(True)
+        self.setMinimumDuration(250)
+        self.setWindowTitle("Paragon - Saving...")
+        self.setWindowIcon(QIcon("paragon.ico"))
+
+    def set_progress(self, path: str, done: int, total: int):
+        # Totals are estimated from dirty files, so don't let them overflow.
+        total = max(total, done)
+        self.setMaximum(total)
+        self.setValue(min(done, total - 1))
+        self.setLabelText(f"Saving...\nWrote {path} ({done}/{total})")
@@ -1,5 +1,7 @@
+from typing import Optional
+
 from PySide6.QtCore import QPoint, Signal, QRectF
-from PySide6.QtWidgets import QLabel, QGraphicsItem
+from PySide6.QtWidgets import QLabel, QGraphicsItem, QGraphicsObject
 from PySide6.QtGui import QPixmap, QPainter
 
 from paragon.core.services.dialogue import Dialogue
@@ -16,29 +18,25 @@ class AbstractSpriteItem:
         self.frame_index = 0
         self.sprite_svc = sprite_svc
         self.sprite_animation_svc = sprite_animation_svc
-        self.sprite = None
+        self._sprite = None
         self.sprite_animation_svc.add_sprite(self)
 
+    @property
+    def sprite(self):
+        return self._sprite
+
+    @sprite.setter
+    def sprite(self, sprite):
+        # Let the animation clock pick the sprite up if it wasn't animating.
+        self._sprite = sprite
+        if self.sprite_animation_svc:
+            self.sprite_animation_svc.wake(self)
+
     def set_sprite(self, sprite):
         self.sprite = sprite
         self.setPixmap(self.sprite.spritesheet) if self.sprite else None
         self.reset_animation()
 
-    def next_frame(self):
-        raise NotImplementedError
-
-    def reset_animation(self):
-        raise NotImplementedError
-
-    def _reset_actions(self):
-        raise NotImplementedError
-
-
-class SpriteItem(AbstractSpriteItem, QLabel):
-    def __init__(self, sprite_svc, sprite_animation):
-        AbstractSpriteItem.__init__(self, sprite_svc, sprite_animation)
-        QLabel.__init__(self)
-
     def get_current_frame_delay(self) -> int:
         # If sprite is loaded
         if self.sprite:
@@ -56,6 +54,61 @@ class SpriteItem(AbstractSpriteItem, QLabel):
                         .frame_delay
                     )
 
+    def next_frame(self):
+        raise NotImplementedError
+
+    def reset_animation(self):
+        raise NotImplementedError
+
+    def _reset_actions(self):
+        raise NotImplementedError
+
+
+class SpriteItem(AbstractSpriteItem, QLabel):
+    def __init__(self, sprite_svc, sprite_animation):
+        AbstractSpriteItem.__init__(self, sprite_svc, sprite_animation)
+        QLabel.__init__(self)
+
+    def __del__(self):
+        if self.sprite_animation_svc:
+            self.sprite_animation_svc.delete_sprite(self)
+        del self
+
+
+class GraphicsSpriteItem(AbstractSpriteItem, QGraphicsObject):
+    """Unit sprite drawn as a scene item instead of a widget.
+
+    Provides the parts of the QLabel API the unit sprite classes use, so
+    they can be mixed into either base."""
+
+    def __init__(self, sprite_svc, sprite_animation, size=40):
+        AbstractSpriteItem.__init__(self, sprite_svc, sprite_animation)
+        QGraphicsObject.__init__(self)
+        self._size = size
+        self._pixmap = None
+
+    def width(self) -> int:
+        return self._size
+
+    def height(self) -> int:
+        return self._size
+
+    def pixmap(self) -> Optional[QPixmap]:
+        return self._pixmap
+
+    def setPixmap(self, pixmap):
+        self._pixmap = pixmap
+        self.update()
+
+    def clear(self):
+        if self.sprite or self._pixmap:
+            self.sprite = None
+            self._pixmap = None
+            self.update()
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self._size, self._size)
+
     def __del__(self):
         if self.sprite_animation_svc:
             self.sprite_animation_svc.delete_sprite(self)
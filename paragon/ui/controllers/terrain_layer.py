@@ -0,0 +1,74 @@
+from typing import Dict, List, Optional
+
+from PySide6 import QtCore
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+from paragon.ui.controllers.map_cell import TILE_SIZE
+
+DEFAULT_COLOR = "#424242"
+MAP_SIZE = 32
+
+
+class TerrainLayer(QGraphicsItem):
+    """Tile colors and grid lines for the whole map, drawn as one item.
+
+    Only the exposed tiles are painted, and changing a tile repaints just
+    that tile. Brushes are cached by color since maps reuse a few colors."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self._colors = [[DEFAULT_COLOR] * MAP_SIZE for _ in range(MAP_SIZE)]
+        self._brushes: Dict[str, QBrush] = {}
+        self._grid_pen = QPen(QtCore.Qt.black, 1, QtCore.Qt.DashLine)
+        self._grid_pen.setCosmetic(True)
+
+    def set_color(self, row, col, color):
+        if self._colors[row][col] != color:
+            self._colors[row][col] = color
+            self.update(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+    def set_colors(self, colors: Optional[List[List[str]]]):
+        if not colors:
+            self._colors = [[DEFAULT_COLOR] * MAP_SIZE for _ in range(MAP_SIZE)]
+        else:
+            self._colors = [list(row) for row in colors]
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, TILE_SIZE * MAP_SIZE, TILE_SIZE * MAP_SIZE)
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget):
+        rect = option.exposedRect
+        first_col = max(0, int(rect.left() // TILE_SIZE))
+        last_col = min(MAP_SIZE - 1, int(rect.right() // TILE_SIZE))
+        first_row = max(0, int(rect.top() // TILE_SIZE))
+        last_row = min(MAP_SIZE - 1, int(rect.bottom() // TILE_SIZE))
+        for r in range(first_row, last_row + 1):
+            for c in range(first_col, last_col + 1):
+                painter.fillRect(
+                    c * TILE_SIZE,
+                    r * TILE_SIZE,
+                    TILE_SIZE,
+                    TILE_SIZE,
+                    self._brush(self._colors[r][c]),
+                )
+
+        painter.setPen(self._grid_pen)
+        top = first_row * TILE_SIZE
+        bottom = (last_row + 1) * TILE_SIZE
+        left = first_col * TILE_SIZE
+        right = (last_col + 1) * TILE_SIZE
+        for c in range(first_col, last_col + 2):
+            painter.drawLine(c * TILE_SIZE, top, c * TILE_SIZE, bottom)
+        for r in range(first_row, last_row + 2):
+            painter.drawLine(left, r * TILE_SIZE, right, r * TILE_SIZE)
+
+    def _brush(self, color) -> QBrush:
+        brush = self._brushes.get(color)
+        if brush is None:
+            brush = QBrush(QColor(color))
+            self._brushes[color] = brush
+        return brush
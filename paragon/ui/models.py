@@ -1,3 +1,4 @@
+from paragon.core.display import DisplayCache
 from paragon.model.list_field_model import ListFieldModel
 
 
@@ -6,6 +7,7 @@ class Models:
         self.gd = gd
         self.icons = icons
         self.models = {}
+        self.displays = DisplayCache(gd)
 
     def get(self, rid, field_id):
         key = (rid, field_id)
@@ -13,7 +15,9 @@ class Models:
             return self.models[key]
         else:
             display_function = self._get_display_function(rid, field_id)
-            model = ListFieldModel(self.gd, self.icons, rid, field_id, display_function)
+            model = ListFieldModel(
+                self.gd, self.icons, rid, field_id, display_function, self.displays
+            )
             self.models[key] = model
             return model
 
@@ -1,4 +1,7 @@
+import hashlib
+import logging
 import os
+import pickle
 from pathlib import Path
 
 import yaml
@@ -7,20 +10,43 @@ from yaml import Loader
 from paragon.model import auto_ui
 from paragon.model.auto_ui import UISpec
 
+# Bump when the cache layout changes.
+_CACHE_VERSION = 1
+_CACHE_FILE = "ui_specs.pickle"
+
 
 class Specs:
     def __init__(self, specs):
         self.specs = specs
 
     @staticmethod
-    def load(path, language):
+    def load(path, language, cache_dir=None):
+        """Load every UI spec under path, with the language's overrides on top.
+
+        If cache_dir is given, the parsed specs are pickled there with a hash
+        of their source files. Later loads unpickle them instead of
+        parsing YAML and validating again, as long as the hash still matches."""
         language_dir = os.path.join(path, language.value)
         auto_ui.model_rebuild()
-        specs = Specs._load_specs_from_dir(path)
-        if os.path.exists(language_dir):
-            specs.update(Specs._load_specs_from_dir(language_dir))
+        dirs = [path, language_dir] if os.path.exists(language_dir) else [path]
+        if not cache_dir:
+            return Specs(Specs._parse(dirs))
+
+        digest = Specs._digest(dirs)
+        cache_path = os.path.join(cache_dir, language.value + "_" + _CACHE_FILE)
+        if specs := Specs._read_cache(cache_path, digest):
+            return Specs(specs)
+        specs = Specs._parse(dirs)
+        Specs._write_cache(cache_path, digest, specs)
         return Specs(specs)
 
+    @staticmethod
+    def _parse(dirs):
+        specs = {}
+        for d in dirs:
+            specs.update(Specs._load_specs_from_dir(d))
+        return specs
+
     @staticmethod
     def _load_specs_from_dir(path):
         specs = {}
@@ -31,6 +57,41 @@ class Specs:
                 specs[spec.typename] = spec
         return specs
 
+    @staticmethod
+    def _digest(dirs) -> str:
+        # The spec classes are part of the key since pickles depend on them.
+        h = hashlib.sha256(str(_CACHE_VERSION).encode())
+        with open(auto_ui.__file__, "rb") as f:
+            h.update(f.read())
+        for d in dirs:
+            for filename in sorted(Path(d).glob("*.yml")):
+                h.update(filename.name.encode("utf-8"))
+                h.update(filename.read_bytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def _read_cache(cache_path, digest):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_digest, specs = pickle.load(f)
+            return specs if cached_digest == digest else None
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logging.warning(f"Discarding unreadable UI spec cache {cache_path}")
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, digest, specs):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump((digest, specs), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            logging.exception(f"Failed to write UI spec cache {cache_path}")
+
     def get_dimensions(self, typename):
         if spec := self.specs.get(typename):
             if spec.width and spec.height:
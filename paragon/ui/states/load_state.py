@@ -1,7 +1,7 @@
 import logging
 
 from PySide6 import QtCore
-from PySide6.QtCore import QObject, QThreadPool
+from PySide6.QtCore import QObject
 from paragon.core.workers.load_project_worker import LoadProjectWorker
 from paragon.ui.controllers.error_dialog import ErrorDialog
 
@@ -24,14 +24,20 @@ class LoadState(QObject):
         self.worker = LoadProjectWorker(self.ms.config, project)
         self.worker.succeeded.connect(self._on_load_succeeded)
         self.worker.error.connect(self._on_load_error)
+        self.worker.progress.connect(self._on_load_progress)
 
         self.dialog = ProjectLoadingDialog(project)
         self.dialog.canceled.connect(self._on_load_canceled)
         self.dialog.show()
 
-        # TODO: Make this multithreaded again.
+        # Independent load stages run on a thread pool. Stages that create Qt
+        # objects stay on this thread, which keeps processing events meanwhile.
         self.worker.run()
 
+    def _on_load_progress(self, stage, elapsed):
+        if self.dialog and isinstance(self.dialog, ProjectLoadingDialog):
+            self.dialog.set_finished_stage(stage, elapsed)
+
     def _on_load_succeeded(self, game_state):
         if self.canceled:
             return
@@ -51,7 +57,8 @@ class LoadState(QObject):
     def _on_load_canceled(self):
         self.canceled = True
         try:
-            QThreadPool.globalInstance().cancel(self.worker)
+            if self.worker:
+                self.worker.cancel()
         except:
             logging.exception("Failed to cancel load project worker.")
         self.ms.sm.transition("SelectProject", main_state=self.ms)
@@ -1,3 +1,6 @@
+from PySide6.QtCore import QTimer
+
+from paragon.model.lazy_state import LazyState
 from paragon.ui.controllers.main_window import MainWindow
 from paragon.ui.states.state import State
 
@@ -6,6 +9,8 @@ class UIMainState(State):
     def __init__(self):
         super().__init__()
         self.window = None
+        self.game_state = None
+        self.warm_up_queue = []
 
     def run(self, **kwargs):
         ms = kwargs["main_state"]
@@ -14,7 +19,22 @@ class UIMainState(State):
         self.window = MainWindow(ms, gs)
         self.window.show()
 
+        # Build the remaining services while the user looks around, one per
+        # event loop pass so the window stays responsive.
+        if isinstance(gs, LazyState) and ms.config.warm_up_services:
+            self.game_state = gs
+            self.warm_up_queue = gs.pending_services()
+            QTimer.singleShot(0, self._warm_up_next)
+
+    def _warm_up_next(self):
+        if not self.game_state or not self.warm_up_queue:
+            return
+        self.game_state.warm_up(self.warm_up_queue.pop(0))
+        QTimer.singleShot(0, self._warm_up_next)
+
     def on_exit(self):
+        self.game_state = None
+        self.warm_up_queue = []
         if self.window:
             self.window.destroy(True, True)
         self.window = None
@@ -1,5 +1,7 @@
 use anyhow::{anyhow, bail, Context};
 use mila::LayeredFilesystem;
+use crate::data::parallel::par_map;
+use crate::data::save_progress::SaveProgress;
 use std::collections::HashMap;
 use indexmap::IndexMap;
 
@@ -87,16 +89,20 @@ impl Archives {
         Ok(())
     }
 
-    pub fn save(&self, fs: &LayeredFilesystem) -> anyhow::Result<()> {
-        for (k, v) in &self.archives {
-            let is_dirty = self.dirty_tracker.get(k).unwrap_or(&false);
-            if *is_dirty {
-                let raw = mila::fe9_arc::serialize(v)
-                    .with_context(|| format!("Failed to serialize CMP archive '{}'", k))?;
-                fs.write(k, &raw, false)
-                    .with_context(|| format!("Failed to write CMP archive '{}'", k))?;
-            }
-        }
-        Ok(())
+    pub fn save(&self, fs: &LayeredFilesystem, progress: &SaveProgress) -> anyhow::Result<()> {
+        let dirty: Vec<(&String, &IndexMap<String, Vec<u8>>)> = self
+            .archives
+            .iter()
+            .filter(|(k, _)| *self.dirty_tracker.get(*k).unwrap_or(&false))
+            .collect();
+        let results = par_map(&dirty, |(k, v)| -> anyhow::Result<()> {
+            let raw = mila::fe9_arc::serialize(v)
+                .with_context(|| format!("Failed to serialize CMP archive '{}'", k))?;
+            fs.write(k, &raw, false)
+                .with_context(|| format!("Failed to write CMP archive '{}'", k))?;
+            progress.finished(k);
+            Ok(())
+        });
+        results.into_iter().collect()
     }
 }
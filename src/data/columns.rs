@@ -0,0 +1,67 @@
+use anyhow::anyhow;
+use pyo3::prelude::*;
+
+use crate::data::fields::field::Field;
+use crate::data::Types;
+use crate::model::id::RecordId;
+
+/// A value taken from a Python column, already checked against its field.
+pub enum ColumnValue {
+    Bool(bool),
+    Bytes(Vec<u8>),
+    Float(f32),
+    Int(i64),
+    Items(Vec<RecordId>),
+    Rid(Option<RecordId>),
+    String(Option<String>),
+}
+
+/// Field IDs of the table's stored type, in declaration order.
+pub fn default_field_ids(types: &Types, rid: RecordId, id: &str) -> Vec<String> {
+    types
+        .stored_type(rid, id)
+        .and_then(|typename| types.get(&typename))
+        .map(|td| td.get_fields().iter().map(|f| f.id().to_string()).collect())
+        .unwrap_or_default()
+}
+
+/// Convert a Python value to the type of the record's field, rejecting ints
+/// outside the field's range. Nothing is written here so a bad column can be
+/// reported before any record is touched.
+pub fn extract(
+    types: &Types,
+    rid: RecordId,
+    id: &str,
+    value: &PyAny,
+) -> anyhow::Result<ColumnValue> {
+    let field = types
+        .field(rid, id)
+        .ok_or_else(|| anyhow!("Record {} has no field {}.", rid, id))?;
+    extract_for_field(field, value).map_err(|err| anyhow!("{}, {}: {}", rid, id, err))
+}
+
+fn extract_for_field(field: &Field, value: &PyAny) -> anyhow::Result<ColumnValue> {
+    Ok(match field {
+        // Columns may come back from buffers as 0/1 instead of bools.
+        Field::Bool(_) => match value.extract::<bool>() {
+            Ok(v) => ColumnValue::Bool(v),
+            Err(_) => ColumnValue::Bool(value.extract::<i64>()? != 0),
+        },
+        Field::Bytes(_) => ColumnValue::Bytes(value.extract()?),
+        Field::Float(_) => ColumnValue::Float(value.extract()?),
+        Field::Int(f) => {
+            let v: i64 = value.extract()?;
+            let (min, max) = f.range();
+            if v < min || v > max {
+                return Err(anyhow!("{} is outside of range {}..={}.", v, min, max));
+            }
+            ColumnValue::Int(v)
+        }
+        Field::List(_) => ColumnValue::Items(value.extract()?),
+        Field::Record(_) | Field::Reference(_) => ColumnValue::Rid(value.extract()?),
+        Field::Label(_) | Field::Message(_) | Field::String(_) => {
+            ColumnValue::String(value.extract()?)
+        }
+        Field::Union(f) => return extract_for_field(f.variant(), value),
+    })
+}
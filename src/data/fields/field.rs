@@ -14,7 +14,7 @@ use crate::model::id::{RecordId, StoreNumber};
 use crate::model::read_state::ReadState;
 use crate::model::write_state::WriteState;
 use anyhow::anyhow;
-use pyo3::{PyObject, PyResult, Python};
+use pyo3::{IntoPy, PyObject, PyResult, Python};
 use serde::Deserialize;
 
 #[derive(Clone, Debug, Deserialize)]
@@ -68,6 +68,40 @@ impl Field {
         on_field!(self, f, { f.metadata(py) })
     }
 
+    /// The field's value as the matching single-field getter would return it.
+    /// Lists give their items. Unions give the value of the active variant.
+    pub fn value(&self, py: Python) -> PyObject {
+        match self {
+            Field::Bool(f) => f.value.into_py(py),
+            Field::Bytes(f) => f.value.clone().into_py(py),
+            Field::Float(f) => f.value.into_py(py),
+            Field::Int(f) => f.value.into_py(py),
+            Field::Label(f) => f.value.clone().into_py(py),
+            Field::List(f) => f.items.clone().into_py(py),
+            Field::Message(f) => f.value.clone().into_py(py),
+            Field::Record(f) => f.value.into_py(py),
+            Field::Reference(f) => f.value.into_py(py),
+            Field::String(f) => f.value.clone().into_py(py),
+            Field::Union(f) => f.variant().value(py),
+        }
+    }
+
+    /// Approximate bytes owned on the heap by the field's value.
+    pub fn heap_size(&self) -> usize {
+        match self {
+            Field::Bytes(f) => f.value.capacity(),
+            Field::Label(f) => f.value.as_ref().map(|v| v.capacity()).unwrap_or_default(),
+            Field::List(f) => f.items.capacity() * std::mem::size_of::<RecordId>(),
+            Field::Message(f) => f.value.as_ref().map(|v| v.capacity()).unwrap_or_default(),
+            Field::String(f) => f.value.as_ref().map(|v| v.capacity()).unwrap_or_default(),
+            Field::Union(f) => {
+                f.variants.capacity() * std::mem::size_of::<Field>()
+                    + f.variants.iter().map(|v| v.heap_size()).sum::<usize>()
+            }
+            _ => 0,
+        }
+    }
+
     pub fn post_register_read(&self, rid: RecordId, state: &mut ReadState) {
         match self {
             Field::List(f) => f.post_register_read(rid, state),
@@ -0,0 +1,147 @@
+use std::collections::{BTreeSet, HashMap};
+use std::path::PathBuf;
+use std::time::SystemTime;
+
+/// Names in one directory, merged across every layer.
+struct Listing {
+    names: BTreeSet<String>,
+    /// Modification time of the directory in each layer when it was listed.
+    stamps: Vec<Option<SystemTime>>,
+}
+
+/// In-memory view of the filesystem layers for existence checks.
+///
+/// A directory is read once per layer the first time anything inside it is
+/// asked about, so a probe costs a hash lookup instead of a stat per layer.
+/// Files Paragon writes are added as they are written. Changes made by
+/// other programs are picked up by refresh, which re-reads only directories
+/// whose modification time moved.
+///
+/// list_files results are memoized as well. Paragon's own writes clear them.
+pub struct FileIndex {
+    layers: Vec<PathBuf>,
+    listings: HashMap<String, Listing>,
+    lists: HashMap<(String, Option<String>, bool), Vec<String>>,
+}
+
+impl FileIndex {
+    pub fn new(layers: &[String]) -> Self {
+        FileIndex {
+            layers: layers.iter().map(PathBuf::from).collect(),
+            listings: HashMap::new(),
+            lists: HashMap::new(),
+        }
+    }
+
+    /// Whether a file or directory exists in any layer.
+    pub fn exists(&mut self, path: &str) -> bool {
+        let path = normalize(path);
+        if path.is_empty() {
+            return true;
+        }
+        let (dir, name) = split(&path);
+        self.listing(dir).names.contains(name)
+    }
+
+    pub fn cached_list(
+        &self,
+        dir: &str,
+        glob: Option<&str>,
+        localized: bool,
+    ) -> Option<Vec<String>> {
+        self.lists
+            .get(&(dir.to_owned(), glob.map(str::to_owned), localized))
+            .cloned()
+    }
+
+    pub fn cache_list(
+        &mut self,
+        dir: &str,
+        glob: Option<&str>,
+        localized: bool,
+        files: Vec<String>,
+    ) {
+        self.lists
+            .insert((dir.to_owned(), glob.map(str::to_owned), localized), files);
+    }
+
+    /// Record a file written to the output layer.
+    pub fn add(&mut self, path: &str) {
+        let path = normalize(path);
+        let mut current = path.as_str();
+        // Parent directories may have been created by the write too.
+        while !current.is_empty() {
+            let (dir, name) = split(current);
+            if let Some(listing) = self.listings.get_mut(dir) {
+                listing.names.insert(name.to_owned());
+            }
+            current = dir;
+        }
+        self.lists.clear();
+    }
+
+    /// Re-read directories that changed on disk since they were listed.
+    pub fn refresh(&mut self) {
+        let layers = &self.layers;
+        self.listings
+            .retain(|dir, listing| listing.stamps == stamps(layers, dir));
+        self.lists.clear();
+    }
+
+    pub fn clear(&mut self) {
+        self.listings.clear();
+        self.lists.clear();
+    }
+
+    fn listing(&mut self, dir: &str) -> &Listing {
+        if !self.listings.contains_key(dir) {
+            let mut names = BTreeSet::new();
+            for layer in &self.layers {
+                if let Ok(entries) = std::fs::read_dir(layer.join(dir)) {
+                    for entry in entries.flatten() {
+                        names.insert(normalize(&entry.file_name().to_string_lossy()));
+                    }
+                }
+            }
+            let listing = Listing {
+                names,
+                stamps: stamps(&self.layers, dir),
+            };
+            self.listings.insert(dir.to_owned(), listing);
+        }
+        self.listings.get(dir).unwrap()
+    }
+}
+
+fn stamps(layers: &[PathBuf], dir: &str) -> Vec<Option<SystemTime>> {
+    layers
+        .iter()
+        .map(|layer| {
+            std::fs::metadata(layer.join(dir))
+                .and_then(|m| m.modified())
+                .ok()
+        })
+        .collect()
+}
+
+/// Use forward slashes, drop empty and "." components, and fold case where
+/// the filesystem does.
+fn normalize(path: &str) -> String {
+    let path = if cfg!(windows) {
+        path.replace('\\', "/").to_lowercase()
+    } else {
+        path.replace('\\', "/")
+    };
+    let parts: Vec<&str> = path
+        .split('/')
+        .filter(|part| !part.is_empty() && *part != ".")
+        .collect();
+    parts.join("/")
+}
+
+fn split(path: &str) -> (&str, &str) {
+    match path.rfind('/') {
+        Some(i) => (&path[..i], &path[i + 1..]),
+        None => ("", path),
+    }
+}
@@ -1,11 +1,13 @@
 use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use std::str::FromStr;
+use std::sync::Mutex;
 
 use anyhow::Context;
 use mila::LayeredFilesystem;
 use pyo3::exceptions::PyException;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyTuple};
 
 use crate::data::{TextData, Types};
 use crate::model::id::{RecordId, StoreNumber};
@@ -13,9 +15,18 @@ use crate::model::store_description::StoreDescription;
 use crate::model::texture::Texture;
 
 use crate::data::archives::Archives;
+use crate::data::columns::{self, ColumnValue};
 use crate::data::fields::field::Field;
+use crate::data::file_index::FileIndex;
+use crate::data::key_index::KeyIndex;
+use crate::data::prefetch::Prefetcher;
+use crate::data::save_progress::SaveProgress;
 use crate::data::serialization::references::ReadReferences;
+use crate::data::staged_output::StagedOutput;
 use crate::data::storage::stores::Stores;
+use crate::data::texture_cache::{
+    source_stamp, CachedTextures, TextureCache, TextureFormat, DEFAULT_TEXTURE_CACHE_BUDGET,
+};
 use crate::model::multi_node::MultiNode;
 use crate::model::ui_node::UINode;
 
@@ -24,6 +35,9 @@ use super::scripts::Scripts;
 #[pyclass]
 pub struct GameData {
     fs: LayeredFilesystem,
+    layers: Vec<String>,
+    game: String,
+    language: String,
     types: Types,
     stores: Stores,
     text_data: TextData,
@@ -31,6 +45,10 @@ pub struct GameData {
     nodes: HashMap<String, UINode>,
     tables: HashMap<String, (RecordId, String)>,
     archives: Archives,
+    texture_cache: Mutex<TextureCache>,
+    prefetcher: Prefetcher,
+    key_index: Mutex<KeyIndex>,
+    file_index: Mutex<FileIndex>,
 }
 
 impl GameData {
@@ -42,10 +60,11 @@ impl GameData {
         config_root: String,
     ) -> anyhow::Result<Self> {
         // Create the filesystem.
-        let game = mila::Game::from_str(&game)?;
+        let game_name = game;
+        let game = mila::Game::from_str(&game_name)?;
         let language_enum = mila::Language::from_str(&language)?;
         let layers = vec![rom_path, output_path];
-        let fs = LayeredFilesystem::new(layers, language_enum, game)?;
+        let fs = LayeredFilesystem::new(layers.clone(), language_enum, game)?;
 
         // Load text data.
         let mut text_data_path = PathBuf::new();
@@ -68,6 +87,10 @@ impl GameData {
 
         Ok(GameData {
             fs,
+            prefetcher: Prefetcher::new(layers.clone(), game_name.clone(), language.clone()),
+            layers,
+            game: game_name,
+            language,
             types,
             stores,
             text_data,
@@ -75,6 +98,9 @@ impl GameData {
             nodes: HashMap::new(),
             tables: HashMap::new(),
             archives: Archives::new(),
+            texture_cache: Mutex::new(TextureCache::new(DEFAULT_TEXTURE_CACHE_BUDGET)),
+            key_index: Mutex::new(KeyIndex::new()),
+            file_index: Mutex::new(FileIndex::new(&layers)),
         })
     }
 
@@ -93,6 +119,8 @@ impl GameData {
             .read(&self.fs)
             .context("Failed to read text data.")?;
 
+        self.key_index.lock().unwrap().clear();
+        self.file_index.lock().unwrap().clear();
         self.nodes.clear();
         for node in output.nodes.into_iter() {
             self.nodes.insert(node.id.clone(), node);
@@ -105,18 +133,92 @@ impl GameData {
         Ok(())
     }
 
-    pub fn write_impl(&mut self) -> anyhow::Result<()> {
+    pub fn write_impl(&mut self, progress: Option<PyObject>) -> anyhow::Result<()> {
+        let total = self.dirty_files().len() + self.scripts.dirty_files().len();
+        let progress = SaveProgress::new(progress, total);
+
+        // Write everything to a staging layer first so a failed save
+        // can't leave the output directory half written.
+        let staged = StagedOutput::begin(&self.layers, &self.game, &self.language)
+            .context("Failed to prepare the output directory for saving.")?;
+        match self.write_to(staged.fs(), &progress) {
+            Ok(_) => {
+                let written = staged
+                    .commit()
+                    .context("Failed to move saved files into the output directory.")?;
+                let mut file_index = self.file_index.lock().unwrap();
+                for path in written {
+                    file_index.add(&path);
+                }
+                Ok(())
+            }
+            Err(err) => {
+                staged.abort();
+                Err(err)
+            }
+        }
+    }
+
+    fn cached_textures<F>(
+        &self,
+        path: &str,
+        format: TextureFormat,
+        load: F,
+    ) -> anyhow::Result<CachedTextures>
+    where
+        F: FnOnce() -> anyhow::Result<CachedTextures>,
+    {
+        let stamp = source_stamp(&self.layers, path);
+        if let Some(textures) = self.texture_cache.lock().unwrap().get(path, format, stamp) {
+            return Ok(textures);
+        }
+        // Decode without holding the lock so other readers aren't blocked.
+        let textures = load()?;
+        self.texture_cache
+            .lock()
+            .unwrap()
+            .insert(path, format, stamp, textures.clone());
+        Ok(textures)
+    }
+
+    fn table_or_err(&self, table: &str) -> PyResult<(RecordId, String)> {
+        self.table(table)
+            .ok_or_else(|| PyException::new_err(format!("Table {} does not exist.", table)))
+    }
+
+    fn field_values(&self, py: Python, rid: RecordId, field_ids: &[String]) -> Vec<PyObject> {
+        field_ids
+            .iter()
+            .map(|id| match self.types.field(rid, id) {
+                Some(field) => field.value(py),
+                None => py.None(),
+            })
+            .collect()
+    }
+
+    fn file_exists_impl(&self, path_in_rom: &str, localized: bool) -> anyhow::Result<bool> {
+        let path = if localized {
+            self.fs
+                .localizer()
+                .localize(path_in_rom, &self.fs.language())?
+        } else {
+            path_in_rom.to_owned()
+        };
+        Ok(self.file_index.lock().unwrap().exists(&path))
+    }
+
+    fn write_to(&mut self, fs: &LayeredFilesystem, progress: &SaveProgress) -> anyhow::Result<()> {
         self.scripts
-            .save(&self.fs)
+            .save(fs, progress)
             .context("Failed to write scripts.")?;
         self.text_data
-            .save(&self.fs)
+            .save(fs, progress)
             .context("Failed to write text data.")?;
         self.stores
-            .write(&self.types, &self.tables, &mut self.archives, &self.fs)
+            .write(&self.types, &self.tables, &mut self.archives, fs, progress)
             .context("Failed to write store data.")?;
         self.archives
-            .save(&self.fs)
+            .save(fs, progress)
             .context("Failed to write CMP archives.")?;
         Ok(())
     }
@@ -138,15 +240,20 @@ impl GameData {
         }
     }
 
-    pub fn read(&mut self) -> PyResult<()> {
-        match self.read_impl() {
+    pub fn read(&mut self, py: Python) -> PyResult<()> {
+        // Reading touches nothing owned by Python, so let other threads
+        // (ex. the Qt event loop) run in the meantime.
+        match py.allow_threads(|| self.read_impl()) {
             Ok(gd) => Ok(gd),
             Err(err) => Err(PyException::new_err(format!("{:?}", err))),
         }
     }
 
-    pub fn write(&mut self) -> PyResult<()> {
-        match self.write_impl() {
+    /// Write dirty files to the output directory. If given, progress is
+    /// called with (path, files_done, files_total) as each file finishes.
+    #[pyo3(signature = (progress=None))]
+    pub fn write(&mut self, py: Python, progress: Option<PyObject>) -> PyResult<()> {
+        match py.allow_threads(|| self.write_impl(progress)) {
             Ok(gd) => Ok(gd),
             Err(err) => Err(PyException::new_err(format!("{:?}", err))),
         }
@@ -161,13 +268,19 @@ impl GameData {
         res
     }
 
+    /// Answered from an in-memory listing of the layers. See FileIndex.
     pub fn file_exists(&self, path_in_rom: &str, localized: bool) -> PyResult<bool> {
-        match self.fs.file_exists(path_in_rom, localized) {
+        match self.file_exists_impl(path_in_rom, localized) {
             Ok(b) => Ok(b),
             Err(err) => Err(PyException::new_err(format!("{:?}", err))),
         }
     }
 
+    /// Pick up files added or removed outside of Paragon since they were indexed.
+    pub fn refresh_file_index(&self) {
+        self.file_index.lock().unwrap().refresh();
+    }
+
     #[pyo3(signature = (dir, glob, localized, /))]
     pub fn list_files(
         &self,
@@ -175,9 +288,16 @@ impl GameData {
         glob: Option<&str>,
         localized: bool,
     ) -> PyResult<Vec<String>> {
-        self.fs
+        let mut file_index = self.file_index.lock().unwrap();
+        if let Some(files) = file_index.cached_list(dir, glob, localized) {
+            return Ok(files);
+        }
+        let files = self
+            .fs
             .list(dir, glob, localized)
-            .map_err(|err| PyException::new_err(format!("{:?}", err)))
+            .map_err(|err| PyException::new_err(format!("{:?}", err)))?;
+        file_index.cache_list(dir, glob, localized, files.clone());
+        Ok(files)
     }
 
     pub fn has_message(&self, path: &str, localized: bool, key: &str) -> bool {
@@ -244,6 +364,45 @@ impl GameData {
         }
     }
 
+    /// Counter that increases whenever anything a display string could be built from
+    /// changes: field values, list membership, or message text.
+    pub fn display_generation(&self) -> u64 {
+        self.types.key_generation() + self.types.value_generation() + self.text_data.generation()
+    }
+
+    /// The key, value and message generations that display_generation is built from.
+    pub fn display_generations(&self) -> (u64, u64, u64) {
+        (
+            self.types.key_generation(),
+            self.types.value_generation(),
+            self.text_data.generation(),
+        )
+    }
+
+    /// (rid, field id) pairs written since a value generation from display_generations.
+    /// None means the edits are no longer known.
+    pub fn field_edits_since(&self, generation: u64) -> Option<Vec<(RecordId, String)>> {
+        self.types.edits_since(generation)
+    }
+
+    /// Message keys written since a message generation from display_generations.
+    /// None means the edits are no longer known.
+    pub fn message_edits_since(&self, generation: u64) -> Option<Vec<String>> {
+        self.text_data.edits_since(generation)
+    }
+
+    /// The (rid, field id) pairs and message keys that display(rid) reads.
+    pub fn display_sources(&self, rid: RecordId) -> (Vec<(RecordId, String)>, Vec<String>) {
+        let mut fields = Vec::new();
+        let mut messages = Vec::new();
+        self.types.display_sources(rid, &mut fields, &mut messages);
+        (fields, messages)
+    }
+
+    pub fn text_archive_revision(&self, path: &str, localized: bool) -> u64 {
+        self.text_data.revision(path, localized)
+    }
+
     pub fn set_text_archive_title(
         &mut self,
         path: &str,
@@ -299,6 +458,13 @@ impl GameData {
         self.stores.is_dirty(store_id)
     }
 
+    /// Counter that increases whenever a record in the table's store changes.
+    pub fn table_revision(&self, table: &str) -> Option<u64> {
+        self.tables
+            .get(table)
+            .map(|(rid, _)| self.stores.revision(rid.store_number()))
+    }
+
     pub fn set_store_dirty(&mut self, store_id: &str, dirty: bool) -> PyResult<()> {
         match self.stores.set_dirty(store_id, dirty, false) {
             Ok(_) => Ok(()),
@@ -327,6 +493,7 @@ impl GameData {
 
     pub fn multi_open(&mut self, multi_id: &str, key: String) -> PyResult<RecordId> {
         let mut refs = ReadReferences::new();
+        let prefetched = self.prefetcher.take(&key);
         match self.stores.multi_open(
             &mut self.types,
             &mut refs,
@@ -334,6 +501,7 @@ impl GameData {
             &self.fs,
             multi_id,
             key,
+            prefetched,
         ) {
             Ok((rid, tables)) => {
                 let mut effective_tables = self.tables.clone();
@@ -347,12 +515,26 @@ impl GameData {
         }
     }
 
+    /// Start reading multi files in the background so a later multi_open
+    /// only has to register the parsed data. Returns immediately.
+    pub fn multi_prefetch(&mut self, multi_id: &str, keys: Vec<String>) -> PyResult<()> {
+        let result = self
+            .stores
+            .multi_prefetch_paths(multi_id, keys)
+            .and_then(|paths| self.prefetcher.start(paths));
+        match result {
+            Ok(_) => Ok(()),
+            Err(err) => Err(PyException::new_err(format!("{:?}", err))),
+        }
+    }
+
     pub fn multi_duplicate(
         &mut self,
         multi_id: &str,
         source: String,
         destination: String,
     ) -> PyResult<RecordId> {
+        self.prefetcher.discard(&destination);
         let mut refs = ReadReferences::new();
         match self.stores.multi_duplicate(
             &mut self.types,
@@ -409,6 +591,7 @@ impl GameData {
         filename: &str,
         contents: Vec<u8>,
     ) -> PyResult<()> {
+        self.texture_cache.lock().unwrap().invalidate(archive);
         self.archives
             .insert(archive, filename, contents)
             .map_err(|err| PyException::new_err(format!("{:?}", err)))
@@ -421,8 +604,12 @@ impl GameData {
     }
 
     pub fn write_file(&self, path: &str, contents: &[u8]) -> PyResult<()> {
+        self.texture_cache.lock().unwrap().invalidate(path);
         match self.fs.write(path, contents, false) {
-            Ok(_) => Ok(()),
+            Ok(_) => {
+                self.file_index.lock().unwrap().add(path);
+                Ok(())
+            }
             Err(e) => Err(PyException::new_err(format!(
                 "Failed to write file {}, error {:?}",
                 path, e
@@ -441,40 +628,75 @@ impl GameData {
     }
 
     pub fn read_bch_textures(&self, path: String) -> PyResult<HashMap<String, Texture>> {
-        match self.fs.read_bch_textures(&path, false) {
-            Ok(t) => Ok(t
-                .into_iter()
-                .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
-                .collect()),
-            Err(err) => Err(PyException::new_err(format!("{:?}", err))),
-        }
+        self.cached_textures(&path, TextureFormat::Bch, || {
+            Ok(CachedTextures::Named(
+                self.fs
+                    .read_bch_textures(&path, false)?
+                    .into_iter()
+                    .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
+                    .collect(),
+            ))
+        })
+        .map(|t| t.into_named())
+        .map_err(|err| PyException::new_err(format!("{:?}", err)))
     }
 
     pub fn read_cgfx_textures(&self, path: String) -> PyResult<HashMap<String, Texture>> {
-        match self.fs.read_cgfx_textures(&path, false) {
-            Ok(t) => Ok(t
-                .into_iter()
-                .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
-                .collect()),
-            Err(err) => Err(PyException::new_err(format!("{:?}", err))),
-        }
+        self.cached_textures(&path, TextureFormat::Cgfx, || {
+            Ok(CachedTextures::Named(
+                self.fs
+                    .read_cgfx_textures(&path, false)?
+                    .into_iter()
+                    .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
+                    .collect(),
+            ))
+        })
+        .map(|t| t.into_named())
+        .map_err(|err| PyException::new_err(format!("{:?}", err)))
     }
 
     pub fn read_ctpk_textures(&self, path: String) -> PyResult<HashMap<String, Texture>> {
-        match self.fs.read_ctpk_textures(&path, false) {
-            Ok(t) => Ok(t
-                .into_iter()
-                .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
-                .collect()),
-            Err(err) => Err(PyException::new_err(format!("{:?}", err))),
-        }
+        self.cached_textures(&path, TextureFormat::Ctpk, || {
+            Ok(CachedTextures::Named(
+                self.fs
+                    .read_ctpk_textures(&path, false)?
+                    .into_iter()
+                    .map(|(k, v)| -> (String, Texture) { (k, v.into()) })
+                    .collect(),
+            ))
+        })
+        .map(|t| t.into_named())
+        .map_err(|err| PyException::new_err(format!("{:?}", err)))
     }
 
     pub fn read_tpl_textures(&self, path: String) -> PyResult<Vec<Texture>> {
-        match self.fs.read_tpl_textures(&path, false) {
-            Ok(t) => Ok(t.into_iter().map(|t| t.into()).collect()),
-            Err(err) => Err(PyException::new_err(format!("{:?}", err))),
-        }
+        self.cached_textures(&path, TextureFormat::Tpl, || {
+            Ok(CachedTextures::Indexed(
+                self.fs
+                    .read_tpl_textures(&path, false)?
+                    .into_iter()
+                    .map(|t| t.into())
+                    .collect(),
+            ))
+        })
+        .map(|t| t.into_indexed())
+        .map_err(|err| PyException::new_err(format!("{:?}", err)))
+    }
+
+    /// Hit, miss and eviction counters plus current size for the texture cache.
+    pub fn texture_cache_stats(&self) -> HashMap<&'static str, u64> {
+        self.texture_cache.lock().unwrap().stats()
+    }
+
+    pub fn set_texture_cache_budget(&self, budget_in_bytes: usize) {
+        self.texture_cache
+            .lock()
+            .unwrap()
+            .set_budget(budget_in_bytes);
+    }
+
+    pub fn clear_texture_cache(&self) {
+        self.texture_cache.lock().unwrap().clear();
     }
 
     pub fn read_arc(&self, path: String) -> PyResult<HashMap<String, Vec<u8>>> {
@@ -485,7 +707,17 @@ impl GameData {
     }
 
     pub fn describe_stores(&self) -> Vec<StoreDescription> {
-        self.stores.describe()
+        let mut usage = self.types.memory_usage();
+        let mut stores = self.stores.describe();
+        for store in &mut stores {
+            if let Some(types) = usage.remove(&store.store_number) {
+                store.memory = types
+                    .into_iter()
+                    .map(|(typename, (count, bytes))| (typename, count, bytes))
+                    .collect();
+            }
+        }
+        stores
     }
 
     pub fn node(&self, id: &str) -> Option<UINode> {
@@ -512,12 +744,148 @@ impl GameData {
     }
 
     pub fn list_key_to_rid(&self, rid: RecordId, field_id: &str, key: &str) -> Option<RecordId> {
-        match self.types.field(rid, field_id) {
-            Some(Field::List(l)) => l.rid_from_key(key, &self.types),
-            _ => None,
+        self.key_index
+            .lock()
+            .unwrap()
+            .lookup(&self.types, rid, field_id, key)
+    }
+
+    pub fn keys_to_rids(&self, table: &str, keys: Vec<String>) -> Vec<Option<RecordId>> {
+        match self.table(table) {
+            Some((rid, id)) => self.list_keys_to_rids(rid, &id, keys),
+            None => vec![None; keys.len()],
         }
     }
 
+    pub fn list_keys_to_rids(
+        &self,
+        rid: RecordId,
+        field_id: &str,
+        keys: Vec<String>,
+    ) -> Vec<Option<RecordId>> {
+        self.key_index
+            .lock()
+            .unwrap()
+            .lookup_all(&self.types, rid, field_id, &keys)
+    }
+
+    /// Read several fields from several records in one call. Returns a tuple of
+    /// values per record in field order. Missing fields read as None.
+    pub fn read_fields(
+        &self,
+        py: Python,
+        rids: Vec<RecordId>,
+        field_ids: Vec<String>,
+    ) -> Vec<PyObject> {
+        rids.into_iter()
+            .map(|rid| PyTuple::new(py, self.field_values(py, rid, &field_ids)).into_py(py))
+            .collect()
+    }
+
+    /// Like read_fields for every item in a list, with each item's RID leading its tuple.
+    pub fn items_with_fields(
+        &self,
+        py: Python,
+        rid: RecordId,
+        list_id: &str,
+        field_ids: Vec<String>,
+    ) -> PyResult<Vec<PyObject>> {
+        let items = match self.types.field(rid, list_id).and_then(|f| f.items()) {
+            Some(items) => items,
+            None => {
+                return Err(PyException::new_err(format!(
+                    "Field {} is not a list.",
+                    list_id
+                )))
+            }
+        };
+        Ok(items
+            .into_iter()
+            .map(|item| {
+                let mut values = vec![item.into_py(py)];
+                values.extend(self.field_values(py, item, &field_ids));
+                PyTuple::new(py, values).into_py(py)
+            })
+            .collect())
+    }
+
+    /// Read a whole table as columns. Returns the item RIDs and a dict from field ID
+    /// to the list of that field's values, in item order. Reads every field of the
+    /// table's type unless field_ids is given.
+    pub fn table_to_columns(
+        &self,
+        py: Python,
+        table: &str,
+        field_ids: Option<Vec<String>>,
+    ) -> PyResult<(Vec<RecordId>, PyObject)> {
+        let (rid, id) = self.table_or_err(table)?;
+        let items = self.items(rid, &id).unwrap_or_default();
+        let field_ids =
+            field_ids.unwrap_or_else(|| columns::default_field_ids(&self.types, rid, &id));
+        let dict = PyDict::new(py);
+        for field_id in &field_ids {
+            let values: Vec<PyObject> = items
+                .iter()
+                .map(|item| match self.types.field(*item, field_id) {
+                    Some(field) => field.value(py),
+                    None => py.None(),
+                })
+                .collect();
+            dict.set_item(field_id, values)?;
+        }
+        Ok((items, dict.into_py(py)))
+    }
+
+    /// Write columns from table_to_columns back to a table. Every value is checked
+    /// first, including int ranges, so an invalid column leaves the table untouched.
+    pub fn columns_to_table(
+        &mut self,
+        table: &str,
+        rids: Vec<RecordId>,
+        columns: HashMap<String, Vec<&PyAny>>,
+    ) -> PyResult<()> {
+        let (rid, id) = self.table_or_err(table)?;
+        let items: HashSet<RecordId> = self
+            .items(rid, &id)
+            .unwrap_or_default()
+            .into_iter()
+            .collect();
+        let mut staged = Vec::new();
+        for (field_id, values) in &columns {
+            if values.len() != rids.len() {
+                return Err(PyException::new_err(format!(
+                    "Column {} has {} values for {} records.",
+                    field_id,
+                    values.len(),
+                    rids.len()
+                )));
+            }
+            for (rid, value) in rids.iter().zip(values) {
+                if !items.contains(rid) {
+                    return Err(PyException::new_err(format!(
+                        "Record {} is not in table {}.",
+                        rid, table
+                    )));
+                }
+                let value = columns::extract(&self.types, *rid, field_id, value)
+                    .map_err(|err| PyException::new_err(format!("{:?}", err)))?;
+                staged.push((*rid, field_id, value));
+            }
+        }
+        for (rid, field_id, value) in staged {
+            match value {
+                ColumnValue::Bool(v) => self.set_bool(rid, field_id, v)?,
+                ColumnValue::Bytes(v) => self.set_bytes(rid, field_id, v)?,
+                ColumnValue::Float(v) => self.set_float(rid, field_id, v)?,
+                ColumnValue::Int(v) => self.set_int(rid, field_id, v)?,
+                ColumnValue::Items(v) => self.set_items(rid, field_id, v)?,
+                ColumnValue::Rid(v) => self.set_rid(rid, field_id, v)?,
+                ColumnValue::String(v) => self.set_string(rid, field_id, v)?,
+            }
+        }
+        Ok(())
+    }
+
     pub fn key(&self, rid: RecordId) -> Option<String> {
         self.types.key(rid)
     }
@@ -602,7 +970,10 @@ impl GameData {
         field: &str,
         value: i64,
     ) -> Option<RecordId> {
-        self.types.list_get_by_field_value(rid, id, field, value)
+        self.key_index
+            .lock()
+            .unwrap()
+            .lookup_int(&self.types, rid, id, field, value)
     }
 
     pub fn list_insert(&mut self, rid: RecordId, id: &str, index: usize) -> PyResult<RecordId> {
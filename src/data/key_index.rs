@@ -0,0 +1,129 @@
+use std::collections::HashMap;
+use std::hash::Hash;
+
+use crate::data::fields::field::Field;
+use crate::data::Types;
+use crate::model::id::RecordId;
+
+type Lookup<K> = HashMap<K, RecordId>;
+
+/// Lookup tables for list fields, built on first use: key to RID, and
+/// (int field, value) to RID. A table is rebuilt when the type system's
+/// generation counters say its inputs may have changed.
+#[derive(Default)]
+pub struct KeyIndex {
+    keys: HashMap<(RecordId, String), (u64, Lookup<String>)>,
+    ints: HashMap<(RecordId, String, String), ((u64, u64), Lookup<i64>)>,
+}
+
+impl KeyIndex {
+    pub fn new() -> Self {
+        KeyIndex::default()
+    }
+
+    pub fn lookup(
+        &mut self,
+        types: &Types,
+        rid: RecordId,
+        field_id: &str,
+        key: &str,
+    ) -> Option<RecordId> {
+        self.key_index(types, rid, field_id)
+            .and_then(|index| index.get(key).cloned())
+    }
+
+    pub fn lookup_all(
+        &mut self,
+        types: &Types,
+        rid: RecordId,
+        field_id: &str,
+        keys: &[String],
+    ) -> Vec<Option<RecordId>> {
+        match self.key_index(types, rid, field_id) {
+            Some(index) => keys.iter().map(|key| index.get(key).cloned()).collect(),
+            None => vec![None; keys.len()],
+        }
+    }
+
+    pub fn lookup_int(
+        &mut self,
+        types: &Types,
+        rid: RecordId,
+        field_id: &str,
+        int_field_id: &str,
+        value: i64,
+    ) -> Option<RecordId> {
+        // Membership changes move the key generation, writes to the field move its own.
+        let generation = (types.key_generation(), types.int_generation(int_field_id));
+        let entry_key = (rid, field_id.to_owned(), int_field_id.to_owned());
+        build_if_stale(
+            &mut self.ints,
+            types,
+            entry_key,
+            (rid, field_id),
+            generation,
+            |item| types.int(item, int_field_id),
+        )
+        .and_then(|index| index.get(&value).cloned())
+    }
+
+    pub fn clear(&mut self) {
+        self.keys.clear();
+        self.ints.clear();
+    }
+
+    fn key_index(
+        &mut self,
+        types: &Types,
+        rid: RecordId,
+        field_id: &str,
+    ) -> Option<&Lookup<String>> {
+        let entry_key = (rid, field_id.to_owned());
+        build_if_stale(
+            &mut self.keys,
+            types,
+            entry_key,
+            (rid, field_id),
+            types.key_generation(),
+            |item| types.key(item),
+        )
+    }
+}
+
+fn build_if_stale<'a, E, G, K, F>(
+    tables: &'a mut HashMap<E, (G, Lookup<K>)>,
+    types: &Types,
+    entry_key: E,
+    list: (RecordId, &str),
+    generation: G,
+    value_of: F,
+) -> Option<&'a Lookup<K>>
+where
+    E: Eq + Hash + Clone,
+    G: PartialEq,
+    K: Eq + Hash,
+    F: Fn(RecordId) -> Option<K>,
+{
+    let stale = tables
+        .get(&entry_key)
+        .map(|(built_at, _)| *built_at != generation)
+        .unwrap_or(true);
+    if stale {
+        let items = match types.field(list.0, list.1) {
+            Some(Field::List(l)) => &l.items,
+            _ => {
+                tables.remove(&entry_key);
+                return None;
+            }
+        };
+        let mut index = HashMap::with_capacity(items.len());
+        for item in items {
+            if let Some(value) = value_of(*item) {
+                // Match the linear scans, which return the first matching item.
+                index.entry(value).or_insert(*item);
+            }
+        }
+        tables.insert(entry_key.clone(), (generation, index));
+    }
+    tables.get(&entry_key).map(|(_, index)| index)
+}
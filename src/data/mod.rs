@@ -5,12 +5,20 @@ pub use type_definition::TypeDefinition;
 pub use types::Types;
 
 pub mod archives;
+pub mod columns;
 pub mod fields;
+pub mod file_index;
 pub mod game_data;
+pub mod key_index;
+pub mod parallel;
+pub mod prefetch;
 pub mod record;
+pub mod save_progress;
 pub mod scripts;
 pub mod serialization;
+pub mod staged_output;
 pub mod storage;
 pub mod text_data;
+pub mod texture_cache;
 pub mod type_definition;
 pub mod types;
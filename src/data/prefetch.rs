@@ -0,0 +1,106 @@
+use std::collections::VecDeque;
+use std::str::FromStr;
+use std::sync::mpsc::{channel, Receiver, Sender};
+use std::sync::{Arc, Mutex};
+use std::thread;
+
+use indexmap::IndexMap;
+use mila::{BinArchive, LayeredFilesystem};
+
+/// Prefetched archives nobody asked for are dropped past this point, oldest first.
+const MAX_PENDING: usize = 64;
+
+type Job = (String, Sender<anyhow::Result<BinArchive>>);
+
+/// Decompresses and parses bin archives on background threads ahead of time.
+/// Only the file work happens off the main thread. Registering the parsed
+/// records still happens on open, where the type system is available.
+pub struct Prefetcher {
+    layers: Vec<String>,
+    game: String,
+    language: String,
+    fs: Option<Arc<LayeredFilesystem>>,
+    pending: IndexMap<String, Receiver<anyhow::Result<BinArchive>>>,
+}
+
+impl Prefetcher {
+    pub fn new(layers: Vec<String>, game: String, language: String) -> Self {
+        Prefetcher {
+            layers,
+            game,
+            language,
+            fs: None,
+            pending: IndexMap::new(),
+        }
+    }
+
+    /// Start reading every path that isn't already pending.
+    pub fn start(&mut self, paths: Vec<String>) -> anyhow::Result<()> {
+        let fs = self.fs()?;
+        let mut jobs = VecDeque::new();
+        for path in paths {
+            if self.pending.contains_key(&path) {
+                continue;
+            }
+            let (sender, receiver) = channel();
+            self.pending.insert(path.clone(), receiver);
+            jobs.push_back((path, sender));
+        }
+        while self.pending.len() > MAX_PENDING {
+            self.pending.shift_remove_index(0);
+        }
+        if jobs.is_empty() {
+            return Ok(());
+        }
+
+        let workers = thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(jobs.len());
+        let jobs: Arc<Mutex<VecDeque<Job>>> = Arc::new(Mutex::new(jobs));
+        for _ in 0..workers {
+            let fs = fs.clone();
+            let jobs = jobs.clone();
+            thread::spawn(move || loop {
+                let next = jobs.lock().unwrap().pop_front();
+                match next {
+                    Some((path, sender)) => {
+                        // The receiver is gone if the prefetch was evicted. Nothing to do.
+                        let _ = sender.send(read(&fs, &path));
+                    }
+                    None => break,
+                }
+            });
+        }
+        Ok(())
+    }
+
+    /// Take the archive for a path, waiting for it if the read is still running.
+    /// Returns None if the path was never prefetched or the read failed. In that
+    /// case the caller reads the file normally and reports its own error.
+    pub fn take(&mut self, path: &str) -> Option<BinArchive> {
+        let receiver = self.pending.shift_remove(path)?;
+        receiver.recv().ok().and_then(|result| result.ok())
+    }
+
+    /// Drop a pending read, ex. because the file is about to be replaced.
+    pub fn discard(&mut self, path: &str) {
+        self.pending.shift_remove(path);
+    }
+
+    fn fs(&mut self) -> anyhow::Result<Arc<LayeredFilesystem>> {
+        if self.fs.is_none() {
+            let fs = LayeredFilesystem::new(
+                self.layers.clone(),
+                mila::Language::from_str(&self.language)?,
+                mila::Game::from_str(&self.game)?,
+            )?;
+            self.fs = Some(Arc::new(fs));
+        }
+        Ok(self.fs.clone().unwrap())
+    }
+}
+
+fn read(fs: &LayeredFilesystem, path: &str) -> anyhow::Result<BinArchive> {
+    Ok(fs.read_archive(path, false)?)
+}
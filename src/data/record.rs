@@ -4,25 +4,60 @@ use crate::model::id::{RecordId, StoreNumber};
 use crate::model::read_state::ReadState;
 use crate::model::write_state::WriteState;
 use anyhow::{anyhow, Context};
-use indexmap::IndexMap;
+use indexmap::IndexSet;
 use std::collections::HashSet;
+use std::sync::Arc;
+
+/// Field layout shared by every record of a type. Records store their fields
+/// in slots ordered like the schema's IDs, so IDs and the lookup table exist
+/// once per type instead of once per record.
+#[derive(Debug)]
+pub struct RecordSchema {
+    typename: String,
+    field_ids: IndexSet<String>,
+}
+
+impl RecordSchema {
+    pub fn new(typename: String, definition: &TypeDefinition) -> Self {
+        RecordSchema {
+            typename,
+            field_ids: definition
+                .get_fields()
+                .iter()
+                .map(|f| f.id().to_string())
+                .collect(),
+        }
+    }
+
+    pub fn slot(&self, id: &str) -> Option<usize> {
+        self.field_ids.get_index_of(id)
+    }
+}
 
 #[derive(Debug, Clone)]
 pub struct Record {
-    typename: String,
-    fields: IndexMap<String, Field>,
+    schema: Arc<RecordSchema>,
+    fields: Vec<Field>,
 }
 
 impl Record {
-    pub fn new(name: String, definition: &TypeDefinition) -> Self {
-        let mut fields = IndexMap::new();
+    pub fn new(schema: Arc<RecordSchema>, definition: &TypeDefinition) -> Self {
+        let mut fields: Vec<Field> = Vec::with_capacity(schema.field_ids.len());
         for field in definition.get_fields() {
-            fields.insert(field.id().to_string(), field.clone());
-        }
-        Record {
-            typename: name,
-            fields,
+            // A repeated ID replaces the earlier field but keeps its slot.
+            match schema.slot(field.id()) {
+                Some(slot) if slot < fields.len() => fields[slot] = field.clone(),
+                _ => fields.push(field.clone()),
+            }
         }
+        Record { schema, fields }
+    }
+
+    /// Approximate bytes used by the record, including its field values.
+    pub fn estimated_size(&self) -> usize {
+        std::mem::size_of::<Record>()
+            + self.fields.capacity() * std::mem::size_of::<Field>()
+            + self.fields.iter().map(|f| f.heap_size()).sum::<usize>()
     }
 
     pub fn copy_to(
@@ -32,11 +67,11 @@ impl Record {
         types: &mut Types,
         destination_store_number: StoreNumber,
     ) -> anyhow::Result<()> {
-        if self.typename != other.typename {
+        if self.typename() != other.typename() {
             return Err(anyhow!(
                 "Cannot copy between different types: {} {}.",
-                self.typename,
-                other.typename
+                self.typename(),
+                other.typename()
             ));
         }
         let typedef = types
@@ -45,8 +80,9 @@ impl Record {
         let mut fields: HashSet<String> = if !fields.is_empty() {
             fields.iter().cloned().collect()
         } else {
-            self.fields
-                .keys()
+            self.schema
+                .field_ids
+                .iter()
                 .filter(|s| !typedef.ignore_for_copy.contains(*s))
                 .cloned()
                 .collect()
@@ -55,44 +91,36 @@ impl Record {
             fields.remove(id);
         }
 
-        let old_fields = other.fields.clone();
-        other.fields.clear();
-        for (k, v) in old_fields.into_iter() {
-            if fields.contains(&k) {
-                let field_clone = self
-                    .fields
-                    .get(&k)
-                    .unwrap()
-                    .clone_with_allocations(types, destination_store_number)?;
-                other.fields.insert(k, field_clone);
-            } else {
-                other.fields.insert(k, v);
+        for (slot, id) in self.schema.field_ids.iter().enumerate() {
+            if fields.contains(id) {
+                other.fields[slot] =
+                    self.fields[slot].clone_with_allocations(types, destination_store_number)?;
             }
         }
         Ok(())
     }
 
     pub fn typename(&self) -> &str {
-        &self.typename
+        &self.schema.typename
     }
 
     pub fn field(&self, id: &str) -> Option<&Field> {
-        self.fields.get(id)
+        self.schema.slot(id).map(|slot| &self.fields[slot])
     }
 
     pub fn field_mut(&mut self, id: &str) -> Option<&mut Field> {
-        self.fields.get_mut(id)
+        self.schema.slot(id).map(move |slot| &mut self.fields[slot])
     }
 
     pub fn read(&mut self, state: &mut ReadState) -> anyhow::Result<()> {
-        let typename = self.typename.clone();
+        let schema = self.schema.clone();
         state.address_stack.push(state.reader.tell());
         state.conditions_stack.push(HashSet::new());
-        for (k, v) in &mut self.fields {
+        for (k, v) in schema.field_ids.iter().zip(&mut self.fields) {
             v.read(state).with_context(|| {
                 format!(
                     "Failed to read typename '{}' field '{}' at address '0x{:X}",
-                    typename,
+                    schema.typename,
                     k,
                     state.reader.tell()
                 )
@@ -116,7 +144,7 @@ impl Record {
                 state.nodes.push(node);
             }
         }
-        for (_, v) in &self.fields {
+        for v in &self.fields {
             v.post_register_read(rid, state);
         }
     }
@@ -126,11 +154,11 @@ impl Record {
         state.conditions_stack.push(HashSet::new());
         state.rid_stack.push(rid);
         state.references.add_known_record(rid, state.writer.tell());
-        for (k, v) in &self.fields {
+        for (k, v) in self.schema.field_ids.iter().zip(&self.fields) {
             v.write(state).with_context(|| {
                 format!(
                     "Failed to write typename '{}' field '{}' at address '0x{:X}'",
-                    self.typename,
+                    self.schema.typename,
                     k,
                     state.writer.tell()
                 )
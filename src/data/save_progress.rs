@@ -0,0 +1,33 @@
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+use pyo3::prelude::*;
+
+/// Reports files finished during a save to an optional Python callback.
+/// The callback receives (path, files_done, files_total).
+pub struct SaveProgress {
+    callback: Option<PyObject>,
+    total: usize,
+    done: AtomicUsize,
+}
+
+impl SaveProgress {
+    pub fn new(callback: Option<PyObject>, total: usize) -> Self {
+        SaveProgress {
+            callback,
+            total,
+            done: AtomicUsize::new(0),
+        }
+    }
+
+    pub fn finished(&self, path: &str) {
+        let done = self.done.fetch_add(1, Ordering::Relaxed) + 1;
+        if let Some(callback) = &self.callback {
+            Python::with_gil(|py| {
+                // Progress is informational. Don't fail the save over it.
+                if let Err(err) = callback.call1(py, (path, done, self.total)) {
+                    err.print(py);
+                }
+            });
+        }
+    }
+}
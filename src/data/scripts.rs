@@ -1,12 +1,16 @@
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::path::Path;
 
 use mila::Game;
 use mila::LayeredFilesystem;
 
+use crate::data::parallel::par_map;
+use crate::data::save_progress::SaveProgress;
+
 pub struct Scripts {
     game: Game,
     scripts: HashMap<String, String>,
+    dirty: HashSet<String>,
 }
 
 impl Scripts {
@@ -14,11 +18,22 @@ impl Scripts {
         Scripts {
             game,
             scripts: HashMap::new(),
+            dirty: HashSet::new(),
         }
     }
 
-    pub fn save(&self, fs: &LayeredFilesystem) -> anyhow::Result<()> {
-        for (path, script) in &self.scripts {
+    pub fn dirty_files(&self) -> Vec<String> {
+        self.dirty.iter().cloned().collect()
+    }
+
+    pub fn save(&self, fs: &LayeredFilesystem, progress: &SaveProgress) -> anyhow::Result<()> {
+        // Scripts that were only opened don't need to be reassembled.
+        let dirty: Vec<(&String, &String)> = self
+            .scripts
+            .iter()
+            .filter(|(path, _)| self.dirty.contains(*path))
+            .collect();
+        let results = par_map(&dirty, |(path, script)| -> anyhow::Result<()> {
             let script_name = Path::new(path)
                 .file_name()
                 .ok_or_else(|| anyhow::anyhow!("Bad path."))?
@@ -29,8 +44,10 @@ impl Scripts {
                 _ => Err(anyhow::anyhow!("Unsupported game.")),
             }?;
             fs.write(path, &raw, false)?;
-        }
-        Ok(())
+            progress.finished(path);
+            Ok(())
+        });
+        results.into_iter().collect()
     }
 
     pub fn open(&mut self, fs: &LayeredFilesystem, path: String) -> anyhow::Result<String> {
@@ -48,6 +65,7 @@ impl Scripts {
     }
 
     pub fn set_script(&mut self, path: String, script: String) {
+        self.dirty.insert(path.clone());
         self.scripts.insert(path, script);
     }
 }
@@ -0,0 +1,101 @@
+use std::path::{Path, PathBuf};
+use std::str::FromStr;
+
+use anyhow::{anyhow, Context};
+use mila::LayeredFilesystem;
+
+const STAGING_DIR: &str = ".paragon_staging";
+
+/// Filesystem that stages writes in a scratch layer inside the output directory.
+/// Nothing in the output directory changes until the save is committed, at which
+/// point each staged file replaces its destination with a rename.
+pub struct StagedOutput {
+    output_root: PathBuf,
+    staging_root: PathBuf,
+    fs: LayeredFilesystem,
+}
+
+impl StagedOutput {
+    pub fn begin(layers: &[String], game: &str, language: &str) -> anyhow::Result<Self> {
+        let output_root = PathBuf::from(
+            layers
+                .last()
+                .ok_or_else(|| anyhow!("Filesystem has no output layer."))?,
+        );
+        let staging_root = output_root.join(STAGING_DIR);
+
+        // Clear out anything left behind by a save that crashed part way.
+        if staging_root.exists() {
+            std::fs::remove_dir_all(&staging_root).with_context(|| {
+                format!(
+                    "Failed to clear staging directory {}",
+                    staging_root.display()
+                )
+            })?;
+        }
+        std::fs::create_dir_all(&staging_root).with_context(|| {
+            format!(
+                "Failed to create staging directory {}",
+                staging_root.display()
+            )
+        })?;
+
+        let mut staged_layers = layers.to_vec();
+        staged_layers.push(staging_root.to_string_lossy().to_string());
+        let fs = LayeredFilesystem::new(
+            staged_layers,
+            mila::Language::from_str(language)?,
+            mila::Game::from_str(game)?,
+        )?;
+        Ok(StagedOutput {
+            output_root,
+            staging_root,
+            fs,
+        })
+    }
+
+    pub fn fs(&self) -> &LayeredFilesystem {
+        &self.fs
+    }
+
+    /// Move staged files into the output directory. Returns the path of each
+    /// file written, relative to the output directory.
+    pub fn commit(self) -> anyhow::Result<Vec<String>> {
+        let mut staged_files = Vec::new();
+        collect_files(&self.staging_root, &mut staged_files)?;
+        let mut written = Vec::with_capacity(staged_files.len());
+        for path in staged_files {
+            let relative = path.strip_prefix(&self.staging_root)?.to_owned();
+            let destination = self.output_root.join(&relative);
+            if let Some(parent) = destination.parent() {
+                std::fs::create_dir_all(parent)?;
+            }
+            std::fs::rename(&path, &destination).with_context(|| {
+                format!(
+                    "Failed to move {} to {}",
+                    path.display(),
+                    destination.display()
+                )
+            })?;
+            written.push(relative.to_string_lossy().replace('\\', "/"));
+        }
+        std::fs::remove_dir_all(&self.staging_root)?;
+        Ok(written)
+    }
+
+    pub fn abort(self) {
+        let _ = std::fs::remove_dir_all(&self.staging_root);
+    }
+}
+
+fn collect_files(dir: &Path, files: &mut Vec<PathBuf>) -> anyhow::Result<()> {
+    for entry in std::fs::read_dir(dir)? {
+        let path = entry?.path();
+        if path.is_dir() {
+            collect_files(&path, files)?;
+        } else {
+            files.push(path);
+        }
+    }
+    Ok(())
+}
@@ -4,7 +4,7 @@ use crate::model::id::{RecordId, StoreNumber};
 use crate::model::read_output::ReadOutput;
 use crate::model::ui_node::UINode;
 use anyhow::{anyhow, Context};
-use mila::{AssetBinary, AssetSpec, LayeredFilesystem};
+use mila::{AssetBinary, AssetSpec, BinArchive, LayeredFilesystem};
 use serde::Deserialize;
 
 fn default_typename() -> String {
@@ -741,9 +741,13 @@ impl AssetStore {
         &mut self,
         types: &mut Types,
         fs: &LayeredFilesystem,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<ReadOutput> {
         let store_number = self.store_number.unwrap();
-        let archive = fs.read_archive(&self.filename, false)?;
+        let archive = match prefetched {
+            Some(archive) => archive,
+            None => fs.read_archive(&self.filename, false)?,
+        };
         let asset_binary = mila::AssetBinary::from_archive(&archive)
             .with_context(|| format!("Failed to parse Asset from '{}'.", self.filename))?;
 
@@ -7,7 +7,7 @@ use crate::model::read_output::ReadOutput;
 use crate::model::ui_node::UINode;
 use anyhow::{anyhow, Context};
 use mila::fe14_aset::ANIMATION_NAMES;
-use mila::{FE14ASet, LayeredFilesystem};
+use mila::{BinArchive, FE14ASet, LayeredFilesystem};
 use serde::Deserialize;
 
 #[derive(Deserialize, Debug)]
@@ -127,9 +127,13 @@ impl FE14ASetStore {
         &mut self,
         types: &mut Types,
         fs: &LayeredFilesystem,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<ReadOutput> {
         let store_number = self.store_number.unwrap();
-        let archive = fs.read_archive(&self.filename, false)?;
+        let archive = match prefetched {
+            Some(archive) => archive,
+            None => fs.read_archive(&self.filename, false)?,
+        };
         let aset = FE14ASet::from_archive(&archive)
             .with_context(|| format!("Failed to parse FE14ASet from '{}'.", self.filename))?;
 
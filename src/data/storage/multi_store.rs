@@ -1,9 +1,11 @@
 use std::collections::HashMap;
 
 use crate::data::archives::Archives;
+use crate::data::parallel::par_map;
+use crate::data::save_progress::SaveProgress;
 use crate::model::store_description::StoreDescription;
 use anyhow::{anyhow, Context};
-use mila::LayeredFilesystem;
+use mila::{BinArchive, LayeredFilesystem};
 use serde::Deserialize;
 
 use crate::data::serialization::inject_count_strategy::CountStrategy;
@@ -139,12 +141,20 @@ impl MultiStore {
         fs: &LayeredFilesystem,
         key: String,
         store_number: StoreNumber,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<(RecordId, HashMap<String, (RecordId, String)>, bool)> {
         match self.info_from_id(&key) {
             Some(o) => Ok((o.rid, o.tables.clone(), false)),
             None => {
-                let info =
-                    self.open_uncached(types, references, archives, fs, key.clone(), store_number)?;
+                let info = self.open_uncached(
+                    types,
+                    references,
+                    archives,
+                    fs,
+                    key.clone(),
+                    store_number,
+                    prefetched,
+                )?;
                 let rid = info.rid;
                 let tables = info.tables.clone();
                 self.stores_by_id.insert(key, store_number);
@@ -162,6 +172,7 @@ impl MultiStore {
         fs: &LayeredFilesystem,
         key: String,
         store_number: StoreNumber,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<OpenInfo> {
         let mut store = create_instance_for_multi(
             self.multi_store_type.clone(),
@@ -171,7 +182,7 @@ impl MultiStore {
             false,
         );
         let output = store
-            .read(types, references, archives, fs)
+            .read(types, references, archives, fs, prefetched)
             .with_context(|| format!("Failed to read from key '{}' multi '{}'", key, self.id))?;
         let rid = output
             .nodes
@@ -202,7 +213,8 @@ impl MultiStore {
         source: String,
         destination: String,
     ) -> anyhow::Result<(RecordId, HashMap<String, (RecordId, String)>)> {
-        let mut info = self.open_uncached(types, references, archives, fs, source, store_number)?;
+        let mut info =
+            self.open_uncached(types, references, archives, fs, source, store_number, None)?;
         let rid = info.rid;
         let tables = info.tables.clone();
         info.store.set_filename(destination.clone())?;
@@ -219,25 +231,43 @@ impl MultiStore {
         tables: &HashMap<String, (RecordId, String)>,
         archives: &mut Archives,
         fs: &LayeredFilesystem,
+        progress: &SaveProgress,
     ) -> anyhow::Result<()> {
-        for info in self.stores_by_number.values() {
-            if info.store.is_dirty() {
-                if self.merge_tables {
-                    let mut effective_tables: HashMap<String, (RecordId, String)> = HashMap::new();
-                    effective_tables.extend(tables.clone());
-                    effective_tables.extend(info.tables.clone());
-                    info.store.write(types, &effective_tables, archives, fs)
-                } else {
-                    info.store.write(types, tables, archives, fs)
-                }
-                .with_context(|| {
-                    format!("Failed to write key '{}' for multi '{}'", info.key, self.id)
-                })?;
+        let write_info = |info: &OpenInfo, archives: &mut Archives| {
+            if self.merge_tables {
+                let mut effective_tables: HashMap<String, (RecordId, String)> = HashMap::new();
+                effective_tables.extend(tables.clone());
+                effective_tables.extend(info.tables.clone());
+                info.store
+                    .write(types, &effective_tables, archives, fs, progress)
+            } else {
+                info.store.write(types, tables, archives, fs, progress)
+            }
+            .with_context(|| format!("Failed to write key '{}' for multi '{}'", info.key, self.id))
+        };
+
+        let dirty: Vec<&OpenInfo> = self
+            .stores_by_number
+            .values()
+            .filter(|info| info.store.is_dirty())
+            .collect();
+        if self.uses_archives() {
+            for info in dirty {
+                write_info(info, archives)?;
+            }
+        } else {
+            // Keys are independent files, so serialize and compress them in parallel.
+            for result in par_map(&dirty, |info| write_info(*info, &mut Archives::new())) {
+                result?;
             }
         }
         Ok(())
     }
 
+    pub fn uses_archives(&self) -> bool {
+        matches!(self.multi_store_type, MultiStoreType::Cmp { .. })
+    }
+
     pub fn describe(&self) -> Vec<StoreDescription> {
         self.stores_by_number
             .values()
@@ -270,6 +300,17 @@ impl MultiStore {
         }
     }
 
+    /// Paths worth reading ahead of time for the given keys.
+    /// Keys that are already open, and CMP multis (which read through Archives), are skipped.
+    pub fn prefetch_paths(&self, keys: Vec<String>) -> Vec<String> {
+        if self.uses_archives() {
+            return Vec::new();
+        }
+        keys.into_iter()
+            .filter(|key| !self.stores_by_id.contains_key(key))
+            .collect()
+    }
+
     pub fn keys(&self, fs: &LayeredFilesystem) -> anyhow::Result<Vec<String>> {
         let files = match &self.glob {
             Some(p) => fs.list(&self.directory, Some(p), false),
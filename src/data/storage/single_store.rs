@@ -79,25 +79,40 @@ impl SingleStore {
         }
     }
 
+    pub fn archive_path(&self, fs: &LayeredFilesystem) -> Option<String> {
+        match self.skips_language(fs) {
+            Ok(false) => Some(self.filename.clone()),
+            _ => None,
+        }
+    }
+
+    // Check if this store is language-specific and excluded from the filesystem's language.
+    fn skips_language(&self, fs: &LayeredFilesystem) -> anyhow::Result<bool> {
+        match &self.language {
+            Some(language) => Ok(fs.language() != mila::Language::from_str(language)?),
+            None => Ok(false),
+        }
+    }
+
     pub fn read(
         &mut self,
         types: &mut Types,
         references: &mut ReadReferences,
         fs: &LayeredFilesystem,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<ReadOutput> {
         let store_number = self.store_number.unwrap();
 
-        // Check if this store is language-specific.
-        // Exit early if it is.
-        if let Some(language) = &self.language {
-            let language = mila::Language::from_str(language)?;
-            if fs.language() != language {
-                return Ok(ReadOutput::new());
-            }
+        // Exit early if this store is for a different language.
+        if self.skips_language(fs)? {
+            return Ok(ReadOutput::new());
         }
 
         // Read the file.
-        let archive = fs.read_archive(&self.filename, false)?;
+        let archive = match prefetched {
+            Some(archive) => archive,
+            None => fs.read_archive(&self.filename, false)?,
+        };
 
         // Instantiate the type and try parsing it from the file.
         let mut record = types
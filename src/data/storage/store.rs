@@ -1,8 +1,9 @@
 use std::collections::HashMap;
 
 use crate::data::archives::Archives;
+use crate::data::save_progress::SaveProgress;
 use anyhow::anyhow;
-use mila::LayeredFilesystem;
+use mila::{BinArchive, LayeredFilesystem};
 use serde::Deserialize;
 
 use crate::data::serialization::references::ReadReferences;
@@ -87,23 +88,37 @@ impl Store {
             path: self.filename(),
             store_type: store_type.to_owned(),
             dirty: self.is_dirty(),
+            memory: Vec::new(),
         });
         items
     }
 
+    /// Path of the bin archive this store parses on read, if any.
+    /// Used to decompress and parse archives ahead of time, off the main thread.
+    pub fn archive_path(&self, fs: &LayeredFilesystem) -> Option<String> {
+        match self {
+            Store::Single(s) => s.archive_path(fs),
+            Store::Asset(s) => Some(s.filename.clone()),
+            Store::TableInject(s) => Some(s.filename.clone()),
+            Store::FE14ASet(s) => Some(s.filename.clone()),
+            Store::Multi(_) | Store::Cmp(_) => None,
+        }
+    }
+
     pub fn read(
         &mut self,
         types: &mut Types,
         references: &mut ReadReferences,
         archives: &mut Archives,
         fs: &LayeredFilesystem,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<ReadOutput> {
         match self {
-            Store::Single(s) => s.read(types, references, fs),
-            Store::Asset(s) => s.read(types, fs),
+            Store::Single(s) => s.read(types, references, fs, prefetched),
+            Store::Asset(s) => s.read(types, fs, prefetched),
             Store::Multi(_) => Ok(ReadOutput::new()),
-            Store::TableInject(s) => s.read(types, references, fs),
-            Store::FE14ASet(s) => s.read(types, fs),
+            Store::TableInject(s) => s.read(types, references, fs, prefetched),
+            Store::FE14ASet(s) => s.read(types, fs, prefetched),
             Store::Cmp(s) => s.read(types, references, archives, fs),
         }
     }
@@ -114,14 +129,31 @@ impl Store {
         tables: &HashMap<String, (RecordId, String)>,
         archives: &mut Archives,
         fs: &LayeredFilesystem,
+        progress: &SaveProgress,
     ) -> anyhow::Result<()> {
         match self {
             Store::Single(s) => s.write(types, tables, fs),
             Store::Asset(s) => s.write(types, fs),
-            Store::Multi(s) => s.write(types, tables, archives, fs),
+            Store::Multi(s) => s.write(types, tables, archives, fs, progress),
             Store::TableInject(s) => s.write(types, tables, fs),
             Store::FE14ASet(s) => s.write(types, fs),
             Store::Cmp(s) => s.write(types, tables, archives, fs),
+        }?;
+        // Multi stores report each key themselves and CMP stores
+        // are reported when their archive is saved.
+        if !matches!(self, Store::Multi(_) | Store::Cmp(_)) {
+            progress.finished(&self.filename());
+        }
+        Ok(())
+    }
+
+    /// Whether writing this store touches the shared CMP archives.
+    /// Stores that don't can be written in parallel.
+    pub fn uses_archives(&self) -> bool {
+        match self {
+            Store::Multi(s) => s.uses_archives(),
+            Store::Cmp(_) => true,
+            _ => false,
         }
     }
 
@@ -1,4 +1,6 @@
 use crate::data::archives::Archives;
+use crate::data::parallel::par_map;
+use crate::data::save_progress::SaveProgress;
 use crate::data::serialization::references::ReadReferences;
 use crate::data::storage::store::Store;
 use crate::data::Types;
@@ -7,7 +9,7 @@ use crate::model::multi_node::MultiNode;
 use crate::model::read_output::ReadOutput;
 use crate::model::store_description::StoreDescription;
 use anyhow::{anyhow, bail, Context};
-use mila::LayeredFilesystem;
+use mila::{BinArchive, LayeredFilesystem};
 use std::collections::HashMap;
 use std::path::PathBuf;
 
@@ -16,6 +18,7 @@ pub struct Stores {
     stores_by_id: HashMap<String, StoreNumber>,
     stores_by_number: HashMap<StoreNumber, Store>,
     stores_owned_by_multi: HashMap<StoreNumber, StoreNumber>,
+    revisions: HashMap<StoreNumber, u64>,
 }
 
 impl Stores {
@@ -44,24 +47,31 @@ impl Stores {
             let paths = std::fs::read_dir(dir).with_context(|| {
                 format!("Failed to walk directory {} in Stores.", dir.display())
             })?;
+            let mut files = Vec::new();
             for path in paths {
                 if let Ok(p) = path {
                     if p.metadata()?.is_file() {
-                        for mut store in Stores::read_definitions(p.path())? {
-                            store.set_store_number(next_store_number);
-                            stores_by_id.insert(store.id().to_owned(), next_store_number);
-                            stores_by_number.insert(next_store_number, store);
-                            next_store_number.increment();
-                        }
+                        files.push(p.path());
                     }
                 }
             }
+            // Parse in parallel, then number stores in directory order as before.
+            let definitions = par_map(&files, |path| Stores::read_definitions(path.clone()));
+            for stores in definitions {
+                for mut store in stores? {
+                    store.set_store_number(next_store_number);
+                    stores_by_id.insert(store.id().to_owned(), next_store_number);
+                    stores_by_number.insert(next_store_number, store);
+                    next_store_number.increment();
+                }
+            }
         }
         Ok(Stores {
             next_store_number,
             stores_by_id,
             stores_by_number,
             stores_owned_by_multi: HashMap::new(),
+            revisions: HashMap::new(),
         })
     }
 
@@ -88,11 +98,37 @@ impl Stores {
         archives: &mut Archives,
         fs: &LayeredFilesystem,
     ) -> anyhow::Result<ReadOutput> {
+        // Read stores in a fixed order so references and tables merge the same way every time.
+        let mut store_numbers: Vec<StoreNumber> = self.stores_by_number.keys().cloned().collect();
+        store_numbers.sort();
+
+        // Decompressing and parsing archives dominates read time and doesn't touch
+        // the type system, so do that for every store in parallel first.
+        let paths: Vec<(StoreNumber, String)> = store_numbers
+            .iter()
+            .filter_map(|n| {
+                self.stores_by_number[n]
+                    .archive_path(fs)
+                    .map(|path| (*n, path))
+            })
+            .collect();
+        let mut prefetched: HashMap<StoreNumber, anyhow::Result<BinArchive>> =
+            par_map(&paths, |(_, path)| -> anyhow::Result<BinArchive> {
+                Ok(fs.read_archive(path, false)?)
+            })
+            .into_iter()
+            .zip(paths.iter())
+            .map(|(archive, (store_number, _))| (*store_number, archive))
+            .collect();
+
         let mut final_output = ReadOutput::new();
-        for store in self.stores_by_number.values_mut() {
-            let output = store
-                .read(types, references, archives, fs)
-                .with_context(|| format!("Failed to read data from store '{}'.", store.id()))?;
+        for store_number in store_numbers {
+            let store = self.stores_by_number.get_mut(&store_number).unwrap();
+            let output = match prefetched.remove(&store_number).transpose() {
+                Ok(archive) => store.read(types, references, archives, fs, archive),
+                Err(err) => Err(err),
+            }
+            .with_context(|| format!("Failed to read data from store '{}'.", store.id()))?;
             final_output.merge(output);
         }
         Ok(final_output)
@@ -104,13 +140,34 @@ impl Stores {
         tables: &HashMap<String, (RecordId, String)>,
         archives: &mut Archives,
         fs: &LayeredFilesystem,
+        progress: &SaveProgress,
     ) -> anyhow::Result<()> {
-        for store in self.stores_by_number.values() {
-            if self.is_dirty(store.id()) {
-                store
-                    .write(types, tables, archives, fs)
-                    .with_context(|| format!("Failed to write store '{}'.", store.id()))?;
-            }
+        let mut store_numbers: Vec<StoreNumber> = self.stores_by_number.keys().cloned().collect();
+        store_numbers.sort();
+        let dirty: Vec<&Store> = store_numbers
+            .iter()
+            .filter_map(|n| self.stores_by_number.get(n))
+            .filter(|store| self.is_dirty(store.id()))
+            .collect();
+
+        // Stores that share CMP archives, and multis that parallelize their
+        // own keys, are written one at a time. Everything else is an
+        // independent file that can be serialized and compressed in parallel.
+        let (sequential, parallel): (Vec<&Store>, Vec<&Store>) = dirty
+            .into_iter()
+            .partition(|store| store.uses_archives() || matches!(store, Store::Multi(_)));
+        let results = par_map(&parallel, |store| {
+            store
+                .write(types, tables, &mut Archives::new(), fs, progress)
+                .with_context(|| format!("Failed to write store '{}'.", store.id()))
+        });
+        for result in results {
+            result?;
+        }
+        for store in sequential {
+            store
+                .write(types, tables, archives, fs, progress)
+                .with_context(|| format!("Failed to write store '{}'.", store.id()))?;
         }
         Ok(())
     }
@@ -122,15 +179,36 @@ impl Stores {
     }
 
     pub fn set_dirty(&mut self, id: &str, dirty: bool, force: bool) -> anyhow::Result<()> {
+        if dirty {
+            if let Some(store_number) = self.stores_by_id.get(id).cloned() {
+                self.bump_revision(store_number);
+            }
+        }
         self.store_from_id_mut(id)?.set_dirty(dirty, force)
     }
 
+    /// Counter that increases every time a record in the store changes.
+    /// Lets callers cache values derived from a store's records.
+    pub fn revision(&self, store_number: StoreNumber) -> u64 {
+        self.revisions
+            .get(&store_number)
+            .cloned()
+            .unwrap_or_default()
+    }
+
+    fn bump_revision(&mut self, store_number: StoreNumber) {
+        *self.revisions.entry(store_number).or_default() += 1;
+    }
+
     pub fn set_dirty_by_number(
         &mut self,
         store_number: StoreNumber,
         dirty: bool,
         force: bool,
     ) -> anyhow::Result<()> {
+        if dirty {
+            self.bump_revision(store_number);
+        }
         if self.stores_by_number.contains_key(&store_number) {
             self.stores_by_number
                 .get_mut(&store_number)
@@ -169,12 +247,20 @@ impl Stores {
         fs: &LayeredFilesystem,
         multi_id: &str,
         key: String,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<(RecordId, HashMap<String, (RecordId, String)>)> {
         let store_number = self.next_store_number;
         match self.store_from_id_mut(multi_id)? {
             Store::Multi(m) => {
-                let (rid, tables, consumed_store_number) =
-                    m.open(types, references, archives, fs, key, store_number)?;
+                let (rid, tables, consumed_store_number) = m.open(
+                    types,
+                    references,
+                    archives,
+                    fs,
+                    key,
+                    store_number,
+                    prefetched,
+                )?;
                 if consumed_store_number {
                     self.next_store_number.increment();
                     let multi_number = *self.stores_by_id.get(multi_id).unwrap();
@@ -187,6 +273,17 @@ impl Stores {
         }
     }
 
+    pub fn multi_prefetch_paths(
+        &self,
+        multi_id: &str,
+        keys: Vec<String>,
+    ) -> anyhow::Result<Vec<String>> {
+        match self.store_from_id(multi_id)? {
+            Store::Multi(m) => Ok(m.prefetch_paths(keys)),
+            _ => Err(anyhow!("Store {} is not a multi.", multi_id)),
+        }
+    }
+
     pub fn multi_duplicate(
         &mut self,
         types: &mut Types,
@@ -1,7 +1,7 @@
 use std::collections::HashMap;
 
 use anyhow::{anyhow, Context};
-use mila::{BinArchiveReader, BinArchiveWriter, LayeredFilesystem};
+use mila::{BinArchive, BinArchiveReader, BinArchiveWriter, LayeredFilesystem};
 use serde::Deserialize;
 
 use crate::data::serialization::inject_count_strategy::CountStrategy;
@@ -85,11 +85,15 @@ impl TableInjectStore {
         types: &mut Types,
         references: &mut ReadReferences,
         fs: &LayeredFilesystem,
+        prefetched: Option<BinArchive>,
     ) -> anyhow::Result<ReadOutput> {
         let store_number = self.store_number.unwrap();
 
         // Read the file.
-        let archive = fs.read_archive(&self.filename, false)?;
+        let archive = match prefetched {
+            Some(archive) => archive,
+            None => fs.read_archive(&self.filename, false)?,
+        };
 
         // Get the location and count.
         let table_address = self
@@ -1,9 +1,14 @@
+use crate::data::parallel::par_map;
+use crate::data::save_progress::SaveProgress;
 use anyhow::{anyhow, Context};
 use mila::{LayeredFilesystem, TextArchive};
 use serde::Deserialize;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::path::PathBuf;
 
+/// Message writes remembered for TextData::edits_since. Older writes are forgotten.
+const MAX_EDITS: usize = 4096;
+
 fn default_localized_value() -> bool {
     true
 }
@@ -19,6 +24,9 @@ struct TextDataDefinition {
 pub struct TextData {
     defs: Vec<TextDataDefinition>,
     archives: HashMap<String, TextArchive>,
+    revisions: HashMap<String, u64>,
+    generation: u64,
+    edits: VecDeque<String>,
     localizer: mila::PathLocalizer,
     language: mila::Language,
 }
@@ -57,19 +65,60 @@ impl TextData {
         Ok(TextData {
             defs,
             archives: HashMap::new(),
+            revisions: HashMap::new(),
+            generation: 0,
+            edits: VecDeque::new(),
             localizer: fs.localizer(),
             language: fs.language(),
         })
     }
 
+    /// Counter that increases every time an archive's contents change.
+    pub fn revision(&self, path: &str, localized: bool) -> u64 {
+        match self.finalized_path(path, localized) {
+            Ok(p) => self.revisions.get(&p).cloned().unwrap_or_default(),
+            Err(_) => 0,
+        }
+    }
+
+    /// Counter that increases every time any archive's contents change.
+    pub fn generation(&self) -> u64 {
+        self.generation
+    }
+
+    /// Keys of messages set since the given generation, oldest first. Returns None
+    /// if the edits are no longer known, ex. because an archive was (re)opened.
+    pub fn edits_since(&self, generation: u64) -> Option<Vec<String>> {
+        let count = self.generation.checked_sub(generation)? as usize;
+        if count > self.edits.len() {
+            return None;
+        }
+        Some(
+            self.edits
+                .iter()
+                .skip(self.edits.len() - count)
+                .cloned()
+                .collect(),
+        )
+    }
+
+    fn bump_revision(&mut self, archive_key: &str) {
+        *self.revisions.entry(archive_key.to_owned()).or_default() += 1;
+        // Every message in the archive may have changed, so older edits can't describe it.
+        self.generation += 1;
+        self.edits.clear();
+    }
+
     pub fn new_archive(
         &mut self,
         fs: &LayeredFilesystem,
         path: &str,
         localized: bool,
     ) -> anyhow::Result<()> {
+        let archive_key = self.finalized_path(path, localized)?;
+        self.bump_revision(&archive_key);
         self.archives.insert(
-            self.finalized_path(path, localized)?,
+            archive_key,
             TextArchive::new(fs.text_archive_format(), fs.endian()),
         );
         Ok(())
@@ -91,6 +140,7 @@ impl TextData {
                 path, localized
             )
         })?;
+        self.bump_revision(&archive_key);
         self.archives.insert(archive_key, archive);
         Ok(())
     }
@@ -102,24 +152,33 @@ impl TextData {
 
     pub fn read(&mut self, fs: &LayeredFilesystem) -> anyhow::Result<()> {
         self.archives.clear();
-        for def in &self.defs {
-            let key = self.finalized_path(&def.path, def.localized)?;
-            let archive = fs
-                .read_text_archive(&key, false)
+        let keys = self
+            .defs
+            .iter()
+            .map(|def| self.finalized_path(&def.path, def.localized))
+            .collect::<anyhow::Result<Vec<String>>>()?;
+        let archives = par_map(&keys, |key| -> anyhow::Result<TextArchive> {
+            Ok(fs.read_text_archive(key, false)?)
+        });
+        for ((def, key), archive) in self.defs.iter().zip(keys).zip(archives) {
+            let archive = archive
                 .with_context(|| format!("Failed to read text from definition '{:?}'", def))?;
+            self.bump_revision(&key);
             self.archives.insert(key, archive);
         }
         Ok(())
     }
 
-    pub fn save(&self, fs: &LayeredFilesystem) -> anyhow::Result<()> {
-        for (p, v) in &self.archives {
-            if v.is_dirty() {
-                fs.write_text_archive(p, v, false)
-                    .with_context(|| format!("Failed to write text data to path: {}", p))?;
-            }
-        }
-        Ok(())
+    pub fn save(&self, fs: &LayeredFilesystem, progress: &SaveProgress) -> anyhow::Result<()> {
+        let dirty: Vec<(&String, &TextArchive)> =
+            self.archives.iter().filter(|(_, v)| v.is_dirty()).collect();
+        let results = par_map(&dirty, |(p, v)| -> anyhow::Result<()> {
+            fs.write_text_archive(p, v, false)
+                .with_context(|| format!("Failed to write text data to path: {}", p))?;
+            progress.finished(p);
+            Ok(())
+        });
+        results.into_iter().collect()
     }
 
     pub fn has_message(&self, path: &str, localized: bool, key: &str) -> bool {
@@ -162,6 +221,12 @@ impl TextData {
         let archive_key = self.finalized_path(path, localized)?;
         match self.archives.get_mut(&archive_key) {
             Some(a) => {
+                *self.revisions.entry(archive_key).or_default() += 1;
+                self.generation += 1;
+                self.edits.push_back(key.to_owned());
+                if self.edits.len() > MAX_EDITS {
+                    self.edits.pop_front();
+                }
                 match value {
                     Some(v) => a.set_message(key, &v),
                     None => a.delete_message(key),
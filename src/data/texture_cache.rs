@@ -0,0 +1,205 @@
+use std::collections::HashMap;
+use std::path::Path;
+use std::time::SystemTime;
+
+use indexmap::IndexMap;
+
+use crate::model::texture::Texture;
+
+/// Default budget for decoded pixel data held by the cache.
+pub const DEFAULT_TEXTURE_CACHE_BUDGET: usize = 256 * 1024 * 1024;
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub enum TextureFormat {
+    Bch,
+    Cgfx,
+    Ctpk,
+    Tpl,
+}
+
+#[derive(Clone)]
+pub enum CachedTextures {
+    Named(HashMap<String, Texture>),
+    Indexed(Vec<Texture>),
+}
+
+impl CachedTextures {
+    fn size_in_bytes(&self) -> usize {
+        let texture_size = |t: &Texture| t.pixel_data.len() + t.filename.len();
+        match self {
+            CachedTextures::Named(m) => m.iter().map(|(k, t)| k.len() + texture_size(t)).sum(),
+            CachedTextures::Indexed(v) => v.iter().map(texture_size).sum(),
+        }
+    }
+
+    pub fn into_named(self) -> HashMap<String, Texture> {
+        match self {
+            CachedTextures::Named(m) => m,
+            CachedTextures::Indexed(v) => v
+                .into_iter()
+                .enumerate()
+                .map(|(i, t)| (i.to_string(), t))
+                .collect(),
+        }
+    }
+
+    pub fn into_indexed(self) -> Vec<Texture> {
+        match self {
+            CachedTextures::Named(m) => m.into_iter().map(|(_, t)| t).collect(),
+            CachedTextures::Indexed(v) => v,
+        }
+    }
+}
+
+/// Identifies the file a cached entry was decoded from: the index of the
+/// layer that supplied it and that file's modification time.
+pub type SourceStamp = Option<(usize, SystemTime)>;
+
+pub fn source_stamp(layers: &[String], path: &str) -> SourceStamp {
+    layers.iter().enumerate().rev().find_map(|(i, layer)| {
+        let metadata = std::fs::metadata(Path::new(layer).join(path)).ok()?;
+        Some((i, metadata.modified().ok()?))
+    })
+}
+
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+struct CacheKey {
+    path: String,
+    format: TextureFormat,
+}
+
+struct CacheEntry {
+    stamp: SourceStamp,
+    textures: CachedTextures,
+    size: usize,
+}
+
+/// Byte-budgeted LRU cache of decoded textures.
+/// Entries are ordered from least to most recently used.
+pub struct TextureCache {
+    entries: IndexMap<CacheKey, CacheEntry>,
+    budget: usize,
+    size: usize,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+impl TextureCache {
+    pub fn new(budget: usize) -> Self {
+        TextureCache {
+            entries: IndexMap::new(),
+            budget,
+            size: 0,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        }
+    }
+
+    pub fn get(
+        &mut self,
+        path: &str,
+        format: TextureFormat,
+        stamp: SourceStamp,
+    ) -> Option<CachedTextures> {
+        let key = CacheKey {
+            path: path.to_owned(),
+            format,
+        };
+        match self.entries.shift_remove(&key) {
+            Some(entry) if entry.stamp == stamp => {
+                let textures = entry.textures.clone();
+                self.entries.insert(key, entry);
+                self.hits += 1;
+                Some(textures)
+            }
+            Some(entry) => {
+                // The file changed on disk since we decoded it.
+                self.size -= entry.size;
+                self.misses += 1;
+                None
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    pub fn insert(
+        &mut self,
+        path: &str,
+        format: TextureFormat,
+        stamp: SourceStamp,
+        textures: CachedTextures,
+    ) {
+        let size = textures.size_in_bytes();
+        if size > self.budget {
+            return;
+        }
+        let key = CacheKey {
+            path: path.to_owned(),
+            format,
+        };
+        if let Some(old) = self.entries.shift_remove(&key) {
+            self.size -= old.size;
+        }
+        self.entries.insert(
+            key,
+            CacheEntry {
+                stamp,
+                textures,
+                size,
+            },
+        );
+        self.size += size;
+        self.evict_to(self.budget);
+    }
+
+    /// Drop every entry decoded from the given path.
+    pub fn invalidate(&mut self, path: &str) {
+        let mut freed = 0;
+        self.entries.retain(|k, v| {
+            let keep = k.path != path;
+            if !keep {
+                freed += v.size;
+            }
+            keep
+        });
+        self.size -= freed;
+    }
+
+    pub fn clear(&mut self) {
+        self.entries.clear();
+        self.size = 0;
+    }
+
+    pub fn set_budget(&mut self, budget: usize) {
+        self.budget = budget;
+        self.evict_to(budget);
+    }
+
+    pub fn stats(&self) -> HashMap<&'static str, u64> {
+        let mut stats = HashMap::new();
+        stats.insert("hits", self.hits);
+        stats.insert("misses", self.misses);
+        stats.insert("evictions", self.evictions);
+        stats.insert("entries", self.entries.len() as u64);
+        stats.insert("bytes", self.size as u64);
+        stats.insert("budget", self.budget as u64);
+        stats
+    }
+
+    fn evict_to(&mut self, budget: usize) {
+        while self.size > budget {
+            match self.entries.shift_remove_index(0) {
+                Some((_, entry)) => {
+                    self.size -= entry.size;
+                    self.evictions += 1;
+                }
+                None => break,
+            }
+        }
+    }
+}
@@ -1,18 +1,32 @@
 use crate::data::fields::field::Field;
 use crate::data::fields::list_field::ListField;
+use crate::data::parallel::par_map;
+use crate::data::record::RecordSchema;
 use crate::data::{Record, TextData, TypeDefinition};
 use crate::model::id::{RecordId, RecordNumber, StoreNumber};
 use anyhow::{anyhow, Context};
 use pyo3::{PyObject, PyResult, Python};
 use rustc_hash::FxHashMap;
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap, VecDeque};
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
+
+/// Field writes remembered for Types::edits_since. Older writes are forgotten.
+const MAX_EDITS: usize = 4096;
+
+/// Record count and approximate bytes for each type, keyed by typename.
+pub type MemoryUsage = BTreeMap<String, (usize, usize)>;
 
 #[derive(Debug)]
 pub struct Types {
     types: FxHashMap<String, TypeDefinition>,
+    schemas: FxHashMap<String, Arc<RecordSchema>>,
     next_record_numbers: FxHashMap<StoreNumber, RecordNumber>,
     instances: FxHashMap<RecordId, Record>,
+    key_generation: u64,
+    value_generation: u64,
+    edits: VecDeque<(RecordId, String)>,
+    int_generations: FxHashMap<String, u64>,
 }
 
 impl Types {
@@ -24,10 +38,19 @@ impl Types {
         Types::load_types_from_dir(&mut complete_types, dir)?;
         Types::load_types_from_dir(&mut complete_types, &generated_dir)?;
         Types::load_types_from_dir(&mut complete_types, &language_dir)?;
+        let schemas = complete_types
+            .iter()
+            .map(|(name, td)| (name.clone(), Arc::new(RecordSchema::new(name.clone(), td))))
+            .collect();
         Ok(Types {
             types: complete_types,
+            schemas,
             next_record_numbers: FxHashMap::default(),
             instances: FxHashMap::default(),
+            key_generation: 0,
+            value_generation: 0,
+            edits: VecDeque::new(),
+            int_generations: FxHashMap::default(),
         })
     }
 
@@ -36,14 +59,17 @@ impl Types {
         dir: &PathBuf,
     ) -> anyhow::Result<()> {
         if dir.is_dir() {
+            let mut paths = Vec::new();
             for entry in std::fs::read_dir(dir)? {
-                let entry = entry?;
-                let path = entry.path();
+                let path = entry?.path();
                 if !path.is_dir() {
-                    let types_in_dir = Types::read_definitions(&path)?;
-                    types.extend(types_in_dir);
+                    paths.push(path);
                 }
             }
+            // Parsing dominates load time and each file is independent.
+            for types_in_file in par_map(&paths, Types::read_definitions) {
+                types.extend(types_in_file?);
+            }
         }
         Ok(())
     }
@@ -69,6 +95,8 @@ impl Types {
     }
 
     pub fn register_type(&mut self, name: String, td: TypeDefinition) {
+        let schema = RecordSchema::new(name.clone(), &td);
+        self.schemas.insert(name.clone(), Arc::new(schema));
         self.types.insert(name, td);
     }
 
@@ -76,7 +104,7 @@ impl Types {
         let table_typename = format!("__table_inject__{}", stored_type);
         let container = ListField::create_table_container(stored_type);
         let td = TypeDefinition::with_fields(vec![Field::List(container)]);
-        self.types.insert(table_typename.clone(), td);
+        self.register_type(table_typename.clone(), td);
         table_typename
     }
 
@@ -100,9 +128,10 @@ impl Types {
     }
 
     pub fn instantiate(&self, name: &str) -> Option<Record> {
-        self.types
-            .get(name)
-            .map(|t| Record::new(name.to_string(), t))
+        match (self.schemas.get(name), self.types.get(name)) {
+            (Some(schema), Some(td)) => Some(Record::new(schema.clone(), td)),
+            _ => None,
+        }
     }
 
     pub fn register(&mut self, record: Record, store_number: StoreNumber) -> RecordId {
@@ -125,6 +154,20 @@ impl Types {
         self.types.get(name)
     }
 
+    pub fn memory_usage(&self) -> FxHashMap<StoreNumber, MemoryUsage> {
+        let mut usage: FxHashMap<StoreNumber, MemoryUsage> = FxHashMap::default();
+        for (rid, record) in &self.instances {
+            let entry = usage
+                .entry(rid.store_number())
+                .or_default()
+                .entry(record.typename().to_string())
+                .or_default();
+            entry.0 += 1;
+            entry.1 += record.estimated_size();
+        }
+        usage
+    }
+
     pub fn instance(&self, rid: RecordId) -> Option<&Record> {
         self.instances.get(&rid)
     }
@@ -190,6 +233,7 @@ impl Types {
             Err(anyhow!("Cannot delete invalid RID {}.", rid))
         } else {
             self.instances.remove(&rid);
+            self.keys_changed();
             Ok(())
         }
     }
@@ -210,6 +254,8 @@ impl Types {
             .to_owned();
         source.copy_to(&mut dest, fields, self, destination.store_number())?;
         self.instances.insert(destination, dest);
+        self.keys_changed();
+        self.values_reset();
         Ok(())
     }
 
@@ -270,6 +316,107 @@ impl Types {
         }
     }
 
+    /// The fields and message keys that display(rid) reads, following records and
+    /// references the same way display does.
+    pub fn display_sources(
+        &self,
+        rid: RecordId,
+        fields: &mut Vec<(RecordId, String)>,
+        messages: &mut Vec<String>,
+    ) {
+        let display = match self.instance(rid).and_then(|r| self.get(r.typename())) {
+            Some(td) => match &td.display {
+                Some(display) => display,
+                None => return,
+            },
+            None => return,
+        };
+        fields.push((rid, display.clone()));
+        match self.field(rid, display) {
+            Some(Field::Message(f)) => messages.extend(f.value.clone()),
+            Some(Field::Record(f)) => {
+                if let Some(target) = f.value {
+                    self.display_sources(target, fields, messages);
+                }
+            }
+            Some(Field::Reference(f)) => {
+                if let Some(target) = f.value {
+                    self.display_sources(target, fields, messages);
+                }
+            }
+            _ => {}
+        }
+    }
+
+    /// Counter that increases whenever a record key or list membership may have changed.
+    /// Lets callers cache key lookups without tracking every edit themselves.
+    pub fn key_generation(&self) -> u64 {
+        self.key_generation
+    }
+
+    fn keys_changed(&mut self) {
+        self.key_generation += 1;
+    }
+
+    /// Counter that increases whenever any field value is written.
+    pub fn value_generation(&self) -> u64 {
+        self.value_generation
+    }
+
+    /// The (rid, field id) pairs written since the given value generation, oldest first.
+    /// Returns None if the edits are no longer known and callers must assume anything changed.
+    pub fn edits_since(&self, generation: u64) -> Option<Vec<(RecordId, String)>> {
+        let count = self.value_generation.checked_sub(generation)? as usize;
+        if count > self.edits.len() {
+            return None;
+        }
+        Some(
+            self.edits
+                .iter()
+                .skip(self.edits.len() - count)
+                .cloned()
+                .collect(),
+        )
+    }
+
+    fn values_changed(&mut self, rid: RecordId, id: &str) {
+        self.value_generation += 1;
+        self.edits.push_back((rid, id.to_owned()));
+        if self.edits.len() > MAX_EDITS {
+            self.edits.pop_front();
+        }
+    }
+
+    /// For changes that touch too many fields to log individually.
+    fn values_reset(&mut self) {
+        self.value_generation += 1;
+        self.edits.clear();
+    }
+
+    /// Counter that increases whenever an int field with the given id is written on any record.
+    pub fn int_generation(&self, id: &str) -> u64 {
+        self.int_generations.get(id).cloned().unwrap_or_default()
+    }
+
+    fn ints_changed(&mut self, id: &str) {
+        match self.int_generations.get_mut(id) {
+            Some(generation) => *generation += 1,
+            None => {
+                self.int_generations.insert(id.to_owned(), 1);
+            }
+        }
+    }
+
+    // Keys can come from nested records and references, so a change to any
+    // record's own key field may change the key of a record that points at it.
+    fn is_key_field(&self, rid: RecordId, id: &str) -> bool {
+        self.instance(rid)
+            .and_then(|r| self.get(r.typename()))
+            .and_then(|td| td.key.as_ref())
+            .map(|key| key == id)
+            .unwrap_or_default()
+    }
+
     pub fn key(&self, rid: RecordId) -> Option<String> {
         // TODO: Maybe a functional approach would work better here?
         match self.instance(rid) {
@@ -347,6 +494,8 @@ impl Types {
             }
         }?;
 
+        self.keys_changed();
+
         // Inserted the element. Now we need to regenerate IDs for list items.
         if let Some(base_id) = base_id {
             self.list_regenerate_ids(rid, id, base_id)?;
@@ -362,6 +511,7 @@ impl Types {
         rid: RecordId,
         index: usize,
     ) -> anyhow::Result<()> {
+        self.keys_changed();
         match self.field_mut(list_rid, id) {
             Some(f) => f.list_insert(rid, index),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -381,6 +531,7 @@ impl Types {
 
         // TODO: Note that some parts of the frontend (undo/redo) rely on this NOT
         //       garbage collecting the element immediately.
+        self.keys_changed();
         match self.field_mut(rid, id) {
             Some(f) => f.list_remove(index),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -398,6 +549,9 @@ impl Types {
         // Get the base ID now in case we need to regenerate these after swapping.
         let base_id = self.list_base_id(rid, id);
 
+        // Swapping can change which of two duplicate keys is found first.
+        self.keys_changed();
+
         // Perform the swap.
         match self.field_mut(rid, id) {
             Some(f) => f.list_swap(a, b),
@@ -497,6 +651,10 @@ impl Types {
         id: &str,
         value: Option<String>,
     ) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
+        if self.is_key_field(rid, id) {
+            self.keys_changed();
+        }
         match self.field_mut(rid, id) {
             Some(f) => f.set_string(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -511,6 +669,8 @@ impl Types {
     }
 
     pub fn set_int(&mut self, rid: RecordId, id: &str, value: i64) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
+        self.ints_changed(id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_int(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -525,6 +685,7 @@ impl Types {
     }
 
     pub fn set_float(&mut self, rid: RecordId, id: &str, value: f32) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_float(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -539,6 +700,7 @@ impl Types {
     }
 
     pub fn set_bool(&mut self, rid: RecordId, id: &str, value: bool) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_bool(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -553,6 +715,7 @@ impl Types {
     }
 
     pub fn set_bytes(&mut self, rid: RecordId, id: &str, value: Vec<u8>) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_bytes(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -573,6 +736,7 @@ impl Types {
         index: usize,
         value: u8,
     ) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_byte(index, value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -592,6 +756,11 @@ impl Types {
         id: &str,
         value: Option<RecordId>,
     ) -> anyhow::Result<Option<RecordId>> {
+        self.values_changed(rid, id);
+        if self.is_key_field(rid, id) {
+            self.keys_changed();
+        }
+
         // Cases that change a record's ownership need special handling.
         // These cases DON'T require anything special:
         // - Nulling a reference.
@@ -630,6 +799,8 @@ impl Types {
         id: &str,
         value: Vec<RecordId>,
     ) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
+        self.keys_changed();
         match self.field_mut(rid, id) {
             Some(f) => f.set_items(
                 value
@@ -651,6 +822,12 @@ impl Types {
         id: &str,
         value: usize,
     ) -> anyhow::Result<()> {
+        self.values_changed(rid, id);
+        if self.is_key_field(rid, id) {
+            self.keys_changed();
+        }
+        // Switching variants can change the value seen through int_value.
+        self.ints_changed(id);
         match self.field_mut(rid, id) {
             Some(f) => f.set_active_variant(value),
             None => Err(anyhow!("Bad rid/id combo: {} {}", rid, id)),
@@ -2,7 +2,7 @@ use pyo3::prelude::*;
 use std::fmt::Debug;
 
 /// Unique ID for a store.
-#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, FromPyObject)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, PartialOrd, Ord, Hash, FromPyObject)]
 pub struct StoreNumber(u32);
 
 impl StoreNumber {
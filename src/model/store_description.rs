@@ -15,4 +15,8 @@ pub struct StoreDescription {
 
     #[pyo3(get)]
     pub dirty: bool,
+
+    /// (typename, record count, approximate bytes) for records in the store.
+    #[pyo3(get)]
+    pub memory: Vec<(String, usize, usize)>,
 }